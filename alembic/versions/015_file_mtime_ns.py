@@ -0,0 +1,34 @@
+"""Store indexed_files modification time as integer nanoseconds.
+
+Replaces the file_mtime timestamp with file_mtime_ns (os.stat st_mtime_ns),
+so the rescan quick-check is an integer compare with no datetime objects.
+
+Revision ID: 015
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("indexed_files", sa.Column("file_mtime_ns", sa.BigInteger(), nullable=True))
+    op.execute(
+        "UPDATE indexed_files"
+        " SET file_mtime_ns = (EXTRACT(EPOCH FROM file_mtime) * 1000000000)::bigint"
+    )
+    op.drop_column("indexed_files", "file_mtime")
+
+
+def downgrade():
+    op.add_column(
+        "indexed_files",
+        sa.Column("file_mtime", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute("UPDATE indexed_files SET file_mtime = to_timestamp(file_mtime_ns / 1e9)")
+    op.drop_column("indexed_files", "file_mtime_ns")
@@ -16,18 +16,33 @@ DEFAULT_URL = "http://localhost:8080"
 # -- HTTP helpers ------------------------------------------------------
 
 
-def _client(args) -> tuple[httpx.Client, dict]:
-    token = args.token or load_token()
-    if not token:
-        print(f"No admin token found. Check {HIVE_HOME / 'admin.token'}", file=sys.stderr)
-        sys.exit(1)
-    headers = {"Authorization": f"Bearer {token}"}
-    return httpx.Client(base_url=args.url, timeout=120), headers
+_CLIENT: httpx.Client | None = None
+
+
+def _client(args) -> httpx.Client:
+    """Shared client for this process, created on first use.
+
+    The auth header is attached once, and the keep-alive connection is
+    reused when a command makes several requests.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        token = args.token or load_token()
+        if not token:
+            print(f"No admin token found. Check {HIVE_HOME / 'admin.token'}", file=sys.stderr)
+            sys.exit(1)
+        _CLIENT = httpx.Client(
+            base_url=args.url,
+            timeout=120,
+            headers={"Authorization": f"Bearer {token}"},
+            transport=httpx.HTTPTransport(retries=2),
+        )
+    return _CLIENT
 
 
-def _request(client, method, path, headers):
+def _request(client, method, path):
     try:
-        r = getattr(client, method)(path, headers=headers)
+        r = getattr(client, method)(path)
     except httpx.ConnectError:
         print(f"Cannot connect to {client.base_url}", file=sys.stderr)
         sys.exit(1)
@@ -43,19 +58,17 @@ def _request(client, method, path, headers):
 
 
 def _get(args, path: str):
-    client, headers = _client(args)
-    return _request(client, "get", path, headers)
+    return _request(_client(args), "get", path)
 
 
 def _post(args, path: str):
-    client, headers = _client(args)
-    return _request(client, "post", path, headers)
+    return _request(_client(args), "post", path)
 
 
 def _post_json(args, path: str, body: dict):
-    client, headers = _client(args)
+    client = _client(args)
     try:
-        r = client.post(path, headers=headers, json=body)
+        r = client.post(path, json=body)
     except httpx.ConnectError:
         print(f"Cannot connect to {client.base_url}", file=sys.stderr)
         sys.exit(1)
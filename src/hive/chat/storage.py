@@ -1,25 +1,147 @@
 """Chat storage -- JSON file persistence on the server.
 
 File naming: {user_slug}-{chat_id}.json (or {chat_id}.json without user).
+With compression enabled (config.chat.compress) new writes go to
+{name}.json.gz instead; both forms are always readable.
 Storage dir: configurable via config.chat.storage_dir.
+
+Listing metadata (title, created, message count, mtime) lives in an
+append-only sidecar, index.jsonl, so list_chats never opens chat files.
+The index is rebuilt from the chat files when it is missing or corrupt.
 """
 
-import json
+import asyncio
+import gzip
+import hashlib
 import logging
 import re
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from hashlib import sha256
 from pathlib import Path
 
+from hive.utils import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+INDEX_FILE = "index.jsonl"
+_INDEX_FIELDS = {"title", "created", "message_count", "mtime"}
+_REBUILD_WORKERS = 16
+
+
+def _decode(path: Path, raw: bytes) -> bytes:
+    """Undo on-disk compression (by suffix) to get JSON bytes."""
+    return gzip.decompress(raw) if path.suffix == ".gz" else raw
+
+
+def _scan_chat_file(filepath: Path) -> tuple[str, dict] | None:
+    """(file stem, index metadata) for one chat file, or None if unreadable."""
+    stem = filepath.name.removesuffix(".gz").removesuffix(".json")
+    try:
+        data = json_loads(_decode(filepath, filepath.read_bytes()))
+        return stem, {
+            "title": data.get("title"),
+            "created": data["created"],
+            "message_count": len(data.get("messages", [])),
+            "mtime": filepath.stat().st_mtime,
+        }
+    except (ValueError, KeyError, OSError, EOFError):
+        logger.warning("Skipping malformed chat file: %s", filepath)
+        return None
+
 
 class ChatStorage:
     """Persists chat sessions as JSON files in a server-side directory."""
 
-    def __init__(self, storage_dir: str):
+    def __init__(self, storage_dir: str, compress: bool = False):
         self.storage_dir = Path(storage_dir)
+        self.compress = compress
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.storage_dir / INDEX_FILE
+        # Serialises writers (and index reads) when called from worker threads
+        self._lock = threading.Lock()
+        self._index: dict[str, dict] = self._load_index()
+        # File stem -> digest of the last save() inputs, to skip no-op autosaves
+        self._saved: dict[str, bytes] = {}
+        # User slug ("" = no user) -> sorted list_chats() result; cleared on
+        # every index change
+        self._listings: dict[str, list[dict]] = {}
+
+    # -- metadata index --
+
+    def _load_index(self) -> dict[str, dict]:
+        """Replay index.jsonl into {file stem: metadata}.
+
+        The chat files stay authoritative: a missing or corrupt index (e.g. a
+        torn write after a crash) is rebuilt from them.
+        """
+        index: dict[str, dict] = {}
+        lines = 0
+        try:
+            with open(self._index_path, "rb") as f:
+                for line in f:
+                    lines += 1
+                    entry = json_loads(line)
+                    stem = entry.pop("stem")
+                    if entry.get("deleted"):
+                        index.pop(stem, None)
+                    elif entry.keys() >= _INDEX_FIELDS:
+                        index[stem] = entry
+                    else:
+                        raise KeyError(stem)
+        except FileNotFoundError:
+            return self._rebuild_index()
+        except (ValueError, KeyError, AttributeError, TypeError, OSError):
+            logger.warning("Chat index %s is corrupt, rebuilding", self._index_path)
+            return self._rebuild_index()
+        if lines > 2 * len(index) + 16:
+            self._write_index(index)
+        return index
+
+    def _rebuild_index(self) -> dict[str, dict]:
+        """One-shot scan of existing chat files (migration path).
+
+        Files are read on a small thread pool -- the scan is dominated by
+        open/read latency, which overlaps well across threads.
+        """
+        paths = [
+            p for p in self.storage_dir.iterdir() if p.name.endswith((".json", ".json.gz"))
+        ]
+        with ThreadPoolExecutor(max_workers=_REBUILD_WORKERS) as pool:
+            index = dict(e for e in pool.map(_scan_chat_file, paths) if e is not None)
+        self._write_index(index)
+        return index
+
+    def _write_index(self, index: dict[str, dict]):
+        """Rewrite the index compactly (one line per live chat)."""
+        tmp = self._index_path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            for stem, meta in index.items():
+                f.write(json_dumps({"stem": stem, **meta}) + "\n")
+        tmp.replace(self._index_path)
+
+    def _append_index(self, stem: str, meta: dict | None):
+        """Record an upsert (meta) or a removal (None) for one chat file."""
+        self._saved.pop(stem, None)
+        self._listings.clear()
+        if meta is None:
+            self._index.pop(stem, None)
+            entry = {"stem": stem, "deleted": True}
+        else:
+            self._index[stem] = meta
+            entry = {"stem": stem, **meta}
+        with open(self._index_path, "a") as f:
+            f.write(json_dumps(entry) + "\n")
+
+    def _index_meta(self, data: dict) -> dict:
+        return {
+            "title": data.get("title"),
+            "created": data["created"],
+            "message_count": len(data.get("messages") or []),
+            "mtime": time.time(),
+        }
 
     def _filepath(self, chat_id: str, user_slug: str | None = None) -> Path:
         # chat_id arrives from client (REST/WS) -- strip non-hex chars
@@ -28,9 +150,32 @@ class ChatStorage:
             return self.storage_dir / f"{user_slug}-{safe_id}.json"
         return self.storage_dir / f"{safe_id}.json"
 
+    def _paths(self, chat_id: str, user_slug: str | None = None) -> tuple[Path, Path]:
+        """(write target, alternate) -- .json.gz first when compressing."""
+        plain = self._filepath(chat_id, user_slug)
+        packed = plain.with_name(plain.name + ".gz")
+        return (packed, plain) if self.compress else (plain, packed)
+
+    def _read(self, chat_id: str, user_slug: str | None = None) -> bytes | None:
+        """Raw JSON bytes of a chat in either format, or None if missing."""
+        # Direct open (no exists() probe) -- one syscall fewer per load
+        for path in self._paths(chat_id, user_slug):
+            try:
+                return _decode(path, path.read_bytes())
+            except FileNotFoundError:
+                continue
+        return None
+
+    def _write(self, chat_id: str, user_slug: str | None, raw: bytes):
+        """Atomically write in the configured format; drop the other format."""
+        target, other = self._paths(chat_id, user_slug)
+        if self.compress:
+            raw = gzip.compress(raw, compresslevel=3, mtime=0)
+        self._write_atomic(target, raw)
+        other.unlink(missing_ok=True)
+
     def new_chat_id(self) -> str:
-        ts = datetime.now(UTC).isoformat()
-        return sha256(ts.encode()).hexdigest()[:8]
+        return secrets.token_hex(4)
 
     def save(
         self,
@@ -42,82 +187,116 @@ class ChatStorage:
         model: str | None = None,
         workspace: list[dict] | None = None,
     ):
-        if created is None:
-            created = datetime.now(UTC)
-
-        filepath = self._filepath(chat_id, user_slug)
-
-        # Preserve existing title/created/model/workspace if updating
-        existing = self.load(chat_id, user_slug)
-        if existing:
-            created = datetime.fromisoformat(existing["created"])
-            if title is None:
-                title = existing.get("title")
-            if model is None:
-                model = existing.get("model")
-            if workspace is None:
-                workspace = existing.get("workspace")
-
-        data = {
-            "id": chat_id,
-            "title": title,
-            "created": created.isoformat(),
-            "model": model,
-            "messages": messages,
-            "workspace": workspace or [],
-        }
+        stem = self._filepath(chat_id, user_slug).stem
+        digest = hashlib.blake2b(
+            json_dumps([messages, title, model, workspace], default=str).encode(), digest_size=8
+        ).digest()
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        with self._lock:
+            if self._saved.get(stem) == digest:
+                return  # same inputs as the last save -- skip the read/encode/write
+            # Preserve existing title/created/model/workspace if updating
+            old_raw = self._read(chat_id, user_slug)
+            existing = json_loads(old_raw) if old_raw else None
+            if existing:
+                # Keep the stored timestamp string verbatim (no parse/format round trip)
+                created_iso = existing["created"]
+                if title is None:
+                    title = existing.get("title")
+                if model is None:
+                    model = existing.get("model")
+                if workspace is None:
+                    workspace = existing.get("workspace")
+            else:
+                created_iso = (created or datetime.now(UTC)).isoformat()
+
+            data = {
+                "id": chat_id,
+                "title": title,
+                "created": created_iso,
+                "model": model,
+                "messages": messages,
+                "workspace": workspace or [],
+            }
+
+            raw = json_dumps(data, default=str).encode()
+            if raw != old_raw:
+                self._write(chat_id, user_slug, raw)
+                self._append_index(stem, self._index_meta(data))
+            self._saved[stem] = digest
+
+    @staticmethod
+    def _write_atomic(filepath: Path, raw: bytes):
+        """Write via a temp file + rename so a crash never leaves a truncated chat."""
+        tmp = filepath.with_name(filepath.name + ".tmp")
+        tmp.write_bytes(raw)
+        tmp.replace(filepath)
 
     def load(self, chat_id: str, user_slug: str | None = None) -> dict | None:
-        filepath = self._filepath(chat_id, user_slug)
-        if filepath.exists():
-            with open(filepath) as f:
-                return json.load(f)
-        return None
+        raw = self._read(chat_id, user_slug)
+        return json_loads(raw) if raw is not None else None
 
     def update_title(self, chat_id: str, title: str, user_slug: str | None = None):
-        data = self.load(chat_id, user_slug)
-        if data:
-            data["title"] = title
-            filepath = self._filepath(chat_id, user_slug)
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+        with self._lock:
+            data = self.load(chat_id, user_slug)
+            if data:
+                data["title"] = title
+                self._write(chat_id, user_slug, json_dumps(data, default=str).encode())
+                self._append_index(self._filepath(chat_id, user_slug).stem, self._index_meta(data))
 
     def delete(self, chat_id: str, user_slug: str | None = None) -> bool:
-        filepath = self._filepath(chat_id, user_slug)
-        if filepath.exists():
-            filepath.unlink()
-            return True
-        return False
+        with self._lock:
+            deleted = False
+            for path in self._paths(chat_id, user_slug):
+                try:
+                    path.unlink()
+                    deleted = True
+                except FileNotFoundError:
+                    pass
+            if deleted:
+                self._append_index(self._filepath(chat_id, user_slug).stem, None)
+        return deleted
 
     def list_chats(self, user_slug: str | None = None) -> list[dict]:
-        if user_slug:
-            pattern = f"{user_slug}-*.json"
-            prefix_len = len(user_slug) + 1  # slug + hyphen
-        else:
-            pattern = "*.json"
-            prefix_len = 0
-
-        chats = []
-        for filepath in sorted(
-            self.storage_dir.glob(pattern),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        ):
-            try:
-                with open(filepath) as f:
-                    data = json.load(f)
-                chat_id = filepath.stem[prefix_len:] if prefix_len else filepath.stem
-                chats.append(
+        prefix = f"{user_slug}-" if user_slug else ""
+        with self._lock:
+            listing = self._listings.get(user_slug or "")
+            if listing is None:
+                entries = sorted(
+                    ((stem, meta) for stem, meta in self._index.items() if stem.startswith(prefix)),
+                    key=lambda e: e[1]["mtime"],
+                    reverse=True,
+                )
+                listing = [
                     {
-                        "id": chat_id,
-                        "title": data.get("title"),
-                        "created": data["created"],
-                        "message_count": len(data.get("messages", [])),
+                        "id": stem[len(prefix):],
+                        "title": meta["title"],
+                        "created": meta["created"],
+                        "message_count": meta["message_count"],
                     }
-                )
-            except (json.JSONDecodeError, KeyError):
-                logger.warning("Skipping malformed chat file: %s", filepath)
-        return chats
+                    for stem, meta in entries
+                ]
+                self._listings[user_slug or ""] = listing
+        return list(listing)
+
+    # -- async wrappers: one worker-thread hop per operation, so disk I/O and
+    # JSON encoding never block the event loop --
+
+    async def asave(self, chat_id: str, messages: list[dict], **kwargs):
+        await asyncio.to_thread(self.save, chat_id, messages, **kwargs)
+
+    async def aload(self, chat_id: str, user_slug: str | None = None) -> dict | None:
+        return await asyncio.to_thread(self.load, chat_id, user_slug)
+
+    async def aupdate_title(self, chat_id: str, title: str, user_slug: str | None = None):
+        await asyncio.to_thread(self.update_title, chat_id, title, user_slug)
+
+    async def adelete(self, chat_id: str, user_slug: str | None = None) -> bool:
+        return await asyncio.to_thread(self.delete, chat_id, user_slug)
+
+    async def alist_chats(self, user_slug: str | None = None) -> list[dict]:
+        # A cached listing needs no disk or lock -- skip the thread hop
+        listing = self._listings.get(user_slug or "")
+        if listing is not None:
+            return list(listing)
+        return await asyncio.to_thread(self.list_chats, user_slug)
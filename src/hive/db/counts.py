@@ -0,0 +1,52 @@
+"""Row counts for status reporting -- REST /status and the WebSocket status bar."""
+
+import time
+
+from sqlalchemy import func, select
+
+from hive.db import session as db
+from hive.db.models import IndexedFile, Part, PartInstance, Sequence, User
+
+# Polled by dashboards and probes, and sent on every WebSocket connect and
+# message -- count(*) is a full scan on large tables, so one round trip
+# computes every count and the result is shared for a few seconds
+_COUNTS_TTL = 3.0
+# (fetched at, db.data_version, counts) -- also stale after any commit that writes
+_counts_cache: tuple[float, int, dict] | None = None
+
+_COUNTS_QUERY = select(
+    select(func.count())
+    .select_from(IndexedFile)
+    .where(IndexedFile.status == "active")
+    .scalar_subquery()
+    .label("indexed_files"),
+    select(func.count()).select_from(Sequence).scalar_subquery().label("sequences"),
+    select(func.count()).select_from(Part).scalar_subquery().label("parts"),
+    select(func.count()).select_from(PartInstance).scalar_subquery().label("part_instances"),
+    select(func.count()).select_from(User).scalar_subquery().label("users"),
+    select(func.max(IndexedFile.indexed_at)).scalar_subquery().label("last_updated"),
+)
+
+
+async def index_counts() -> dict:
+    """Indexed files, sequences, parts, part instances, users and last index time.
+
+    Cached for _COUNTS_TTL seconds or until db.data_version changes. Query
+    errors propagate; callers report the database as unavailable.
+    """
+    global _counts_cache
+    now = time.monotonic()
+    version = db.data_version
+    if (
+        _counts_cache is not None
+        and now - _counts_cache[0] < _COUNTS_TTL
+        and _counts_cache[1] == version
+    ):
+        return dict(_counts_cache[2])
+    async with db.async_session_factory() as s:
+        row = (await s.execute(_COUNTS_QUERY)).one()
+    counts = row._asdict()
+    last = counts["last_updated"]
+    counts["last_updated"] = last.isoformat() if last else None
+    _counts_cache = (now, version, counts)
+    return dict(counts)
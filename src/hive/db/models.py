@@ -48,7 +48,7 @@ class IndexedFile(Base):
     status: Mapped[str] = mapped_column(Text, default="active")  # 'active' | 'deleted' | 'error'
     error_msg: Mapped[str | None] = mapped_column(Text, nullable=True)
     file_size: Mapped[int] = mapped_column(BigInteger)
-    file_mtime: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    file_mtime_ns: Mapped[int | None] = mapped_column(BigInteger, nullable=True)  # st_mtime_ns
     indexed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     sequences: Mapped[list["Sequence"]] = relationship(back_populates="file", cascade="all")
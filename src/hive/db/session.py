@@ -2,8 +2,9 @@
 
 import logging
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from hive.config import DatabaseConfig
 
@@ -12,6 +13,42 @@ logger = logging.getLogger(__name__)
 engine = None
 async_session_factory = None
 
+# Bumped after every commit that wrote data (watcher, dedupe, prune, BLAST
+# matches, admin routes, ...); cached status counts and agent responses key on it
+data_version = 0
+
+# Session.info flag: this transaction flushed or executed a write
+_WROTE = "hive_wrote"
+
+
+def mark_data_changed() -> None:
+    """Signal that stored data changed (invalidates cached counts and answers)."""
+    global data_version
+    data_version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(state: ORMExecuteState) -> None:
+    # Bulk insert/update/delete statements bypass the flush
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _committed(session: Session) -> None:
+    if session.info.pop(_WROTE, False):
+        mark_data_changed()
+
+
+@event.listens_for(Session, "after_rollback")
+def _rolled_back(session: Session) -> None:
+    session.info.pop(_WROTE, None)
+
 
 async def init_db(config: DatabaseConfig) -> bool:
     """Initialize the async database engine and session factory.
@@ -21,13 +58,18 @@ async def init_db(config: DatabaseConfig) -> bool:
     """
     global engine, async_session_factory
 
+    connect_args = {}
+    if "+asyncpg" in config.url:
+        connect_args["prepared_statement_cache_size"] = config.statement_cache_size
     engine = create_async_engine(
         config.url,
         echo=False,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
         pool_pre_ping=True,
         pool_recycle=1800,
+        query_cache_size=1200,  # compiled-SQL cache; default 500 is tight for our query mix
+        connect_args=connect_args,
     )
     async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -39,13 +39,25 @@ class Dep(ABC):
 
     @staticmethod
     async def _run(cmd: list[str]) -> tuple[int, bytes, bytes]:
-        """Shared subprocess helper. Returns (returncode, stdout, stderr)."""
+        """Shared subprocess helper. Returns (returncode, stdout, stderr).
+
+        The child gets no stdin, and is killed if the awaiting task is
+        cancelled (client gone, server shutting down) so it cannot outlive
+        the request.
+        """
         proc = await asyncio.create_subprocess_exec(
             *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await proc.communicate()
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+                await asyncio.shield(proc.wait())
+            raise
         return proc.returncode, stdout, stderr
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
 import tempfile
@@ -205,21 +204,20 @@ class BlastDep(Dep):
         return ok
 
     async def _run_makeblastdb(self, binary: str, fasta: Path, db_file: Path, dbtype: str) -> bool:
-        proc = await asyncio.create_subprocess_exec(
-            binary,
-            "-in",
-            str(fasta),
-            "-dbtype",
-            dbtype,
-            "-out",
-            str(db_file),
-            "-blastdb_version",
-            "5",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        rc, _, stderr = await self._run(
+            [
+                binary,
+                "-in",
+                str(fasta),
+                "-dbtype",
+                dbtype,
+                "-out",
+                str(db_file),
+                "-blastdb_version",
+                "5",
+            ]
         )
-        _, stderr = await proc.communicate()
-        if proc.returncode != 0:
+        if rc != 0:
             logger.error("makeblastdb (%s) failed: %s", dbtype, stderr.decode())
             return False
         return True
@@ -289,16 +287,11 @@ class BlastDep(Dep):
                 cmd.extend([flag, str(value)])
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, stderr = await proc.communicate()
+            rc, stdout, stderr = await self._run(cmd)
         finally:
             Path(query_file).unlink(missing_ok=True)
 
-        if proc.returncode != 0:
+        if rc != 0:
             err = stderr.decode().strip()
             logger.error("BLAST failed (%s): %s", program, err)
             return {"error": f"BLAST error: {err}", "hits": []}
@@ -1,6 +1,7 @@
 """LLM package -- unified agent, client, model pool."""
 
 from hive.llm.agent import Agent
+from hive.llm.cache import ResponseCache
 from hive.llm.client import LLMClient
 from hive.llm.pool import ModelPool
 
@@ -8,4 +9,5 @@ __all__ = [
     "Agent",
     "LLMClient",
     "ModelPool",
+    "ResponseCache",
 ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -12,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 from hive.llm.commands import PLANNER_CMDS, python_cmd
 from hive.sandbox import SandboxRunner, Workspace
 from hive.tools import ToolRegistry
+from hive.utils import json_loads
 
 if TYPE_CHECKING:
     from hive.llm.client import LLMClient
@@ -61,6 +63,10 @@ The worker will search by name and discover the correct IDs itself.
 worker to search for it rather than guessing.
 - Keep it tight -- the brief is injected into the worker's system prompt."""
 
+# Fixed worker nudges -- shared across turns, never mutated
+_REPORT_READY_MSG = {"role": "user", "content": "Report is ready. Summarize and stop."}
+_CONTINUE_MSG = {"role": "user", "content": "Continue."}
+
 _WORKER_SYSTEM = """\
 You are Hive Browser, a lab sequence search assistant. Be FAST and DIRECT.
 
@@ -111,6 +117,13 @@ Be concise and direct."""
 
 _MAX_PLANNER_TURNS = 4
 
+# Prior conversation sent with each run, in characters (~4 per token). Keeps
+# prefill bounded when earlier replies were long reports.
+_HISTORY_CHAR_BUDGET = 16_000
+_TRUNCATED = "\n[... truncated]"
+
+_DELIVER_STEP = re.compile(r"^\s*\d+\.", re.MULTILINE)
+
 
 def _parse_tools_line(plan: str) -> list[str] | None:
     """Extract tool names from TOOLS: line in planner output."""
@@ -128,6 +141,47 @@ def _strip_tools_line(plan: str) -> str:
     )
 
 
+def _deliver_count(plan: str | None) -> int:
+    """Number of numbered DELIVER steps in a plan (1 when there is no plan)."""
+    if not plan:
+        return 1
+    return max(1, len(_DELIVER_STEP.findall(plan)))
+
+
+def trim_history(history: list[dict], budget: int = _HISTORY_CHAR_BUDGET) -> list[dict]:
+    """Newest messages of *history* whose content fits in *budget* characters.
+
+    Older messages are dropped first, and a reply whose question was dropped
+    goes with it. The newest message is cut rather than dropped, so the last
+    exchange is never lost entirely.
+    """
+    kept: list[dict] = []
+    used = 0
+    for msg in reversed(history):
+        content = msg.get("content") or ""
+        if used + len(content) > budget:
+            if not kept:
+                kept.append({**msg, "content": content[:budget] + _TRUNCATED})
+            break
+        kept.append(msg)
+        used += len(content)
+    kept.reverse()
+    if len(kept) > 1 and len(kept) < len(history) and kept[0].get("role") == "assistant":
+        kept.pop(0)
+    return kept
+
+
+@functools.lru_cache(maxsize=8)
+def _planner_prompt(catalog: str) -> str:
+    """Planner system prompt for a tool catalog.
+
+    Shared by every Agent -- one is created per request. The registry hands
+    back the same catalog string until tools change, so a hit is a cached-hash
+    lookup.
+    """
+    return _PLANNER_SYSTEM.format(catalog=catalog)
+
+
 def worker_system_prompt() -> str:
     """Return the worker system prompt (used by tests)."""
     return _WORKER_SYSTEM
@@ -146,12 +200,15 @@ class Agent:
         registry: ToolRegistry,
         skills: SkillLibrary | None = None,
         output_limit: int = 4000,
+        fast_finish: bool = True,
     ):
-        self.tokens: dict[str, int] = {"in": 0, "out": 0}
+        self.tokens: dict[str, int] = {"in": 0, "out": 0, "cached": 0}
         self._llm: LLMClient | None = None
         self._registry = registry
         self._skills = skills
         self._output_limit = output_limit
+        # Finish without a summary turn once every planned report table is filled
+        self._fast_finish = fast_finish
         # Per-run context (via prepare)
         self._user_input = ""
         self._history: list[dict] | None = None
@@ -165,11 +222,11 @@ class Agent:
         self._workspace: Workspace | None = None
         self._sandbox: SandboxRunner | None = None
         # Planner state
-        self._catalog = ""
         self._read_skills: list[dict] = []
         self._conv: list[dict] = []
         self._turn_calls: list[dict] = []
         self._turn_results: list[dict] = []
+        self._skill_results: list[tuple[dict, str]] = []
         self._planner_turns = 0
 
     def prepare(
@@ -181,13 +238,13 @@ class Agent:
     ) -> Agent:
         """Set context for the next run."""
         self._user_input = user_input
-        self._history = history
+        self._history = trim_history(history) if history else history
         self._on_progress = on_progress
         self._use_planner = use_planner
         return self
 
     def _reset(self):
-        self.tokens = {"in": 0, "out": 0}
+        self.tokens = {"in": 0, "out": 0, "cached": 0}
         # Mode
         if self._use_planner and self._skills and len(self._skills) > 0:
             self._mode = "planner"
@@ -202,12 +259,11 @@ class Agent:
         if self._mode == "worker":
             self._init_worker()
         # Planner state
-        sigs = self._registry.signatures(detailed=True)
-        self._catalog = "\n".join(f"- {s}" for s in sigs)
         self._read_skills = []
         self._conv = []
         self._turn_calls = []
         self._turn_results = []
+        self._skill_results = []
         self._planner_turns = 0
 
     def _init_worker(self):
@@ -223,10 +279,11 @@ class Agent:
                     tool_names.append("search")
                 registry = self._registry.filtered(tool_names)
                 self._plan = _strip_tools_line(self._plan)
-                logger.info(
-                    "Worker tools filtered: %s",
-                    [t.name for t in registry.tools()],
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Worker tools filtered: %s",
+                        [t.name for t in registry.tools()],
+                    )
         self._sandbox = SandboxRunner(
             self._workspace,
             output_limit=self._output_limit,
@@ -246,12 +303,15 @@ class Agent:
             tools = self._tools()
             tool_choice = self._tool_choice(turn)
 
+            debug = logger.isEnabledFor(logging.DEBUG)
+
             # Debug: log tools sent to LLM
-            tool_names = [t["function"]["name"] for t in tools] if tools else []
-            logger.debug(
-                "[%s turn=%d] sending tools=%s, tool_choice=%s, msgs=%d",
-                self._mode, turn, tool_names, tool_choice, len(messages),
-            )
+            if debug:
+                tool_names = [t["function"]["name"] for t in tools] if tools else []
+                logger.debug(
+                    "[%s turn=%d] sending tools=%s, tool_choice=%s, msgs=%d",
+                    self._mode, turn, tool_names, tool_choice, len(messages),
+                )
 
             try:
                 response = await self._chat(llm, messages, tools, tool_choice=tool_choice)
@@ -275,7 +335,7 @@ class Agent:
             text = self._msg_content(response)
 
             # Debug: log tool calls (show Python code inline)
-            if calls:
+            if debug and calls:
                 for tc in calls:
                     fn = tc.get("function", {})
                     name = fn.get("name", "")
@@ -292,7 +352,7 @@ class Agent:
                             "[%s turn=%d] %s(%s)",
                             self._mode, turn, name, fn.get("arguments", ""),
                         )
-            if text:
+            if debug and text:
                 logger.debug("[%s turn=%d] text: %s", self._mode, turn, text[:200])
 
             if self._mode == "planner":
@@ -318,11 +378,19 @@ class Agent:
             if not calls:
                 return self._on_complete(self._msg_content(response))
 
+            first_step = len(self._workspace.steps)
             for tc in calls:
                 await self._handle_call(tc)
 
             await self._post_turn(turn)
 
+            if self._fast_finish and self._sandbox.report:
+                report = self._sandbox.report
+                turn_ok = not any(s["error"] for s in self._workspace.steps[first_step:])
+                if turn_ok and len(report) >= _deliver_count(self._plan):
+                    logger.info("Report complete, skipping summary turn")
+                    return self._on_complete(_report_ready(report))
+
         return await self._on_exhausted()
 
     # -- Hooks --
@@ -360,6 +428,7 @@ class Agent:
 
     async def _post_turn(self, turn: int) -> None:
         if self._mode == "planner" and self._turn_calls:
+            self._compact_skill_results()
             self._conv.append({
                 "role": "assistant",
                 "content": None,
@@ -369,6 +438,25 @@ class Agent:
             self._turn_calls = []
             self._turn_results = []
 
+    def _compact_skill_results(self) -> None:
+        """Shrink skill bodies returned by earlier Read() turns.
+
+        Read skills are already injected into the planner system prompt, so
+        once a newer turn follows, the verbatim copy in the tool observation
+        only adds prefill. The latest turn is kept as-is.
+        """
+        in_conv = {id(m) for m in self._conv}
+        stale = {id(msg): name for msg, name in self._skill_results if id(msg) in in_conv}
+        if not stale:
+            return
+        # Swap in new dicts -- earlier message lists may still reference the old ones
+        self._conv = [
+            {**m, "content": f"Skill '{stale[id(m)]}' loaded (see Domain Skills)."}
+            if id(m) in stale else m
+            for m in self._conv
+        ]
+        self._skill_results = [r for r in self._skill_results if id(r[0]) not in stale]
+
     async def _on_error(self, error: Exception, turn: int) -> bool:
         sanitized = self._sanitize_error(str(error))
         if sanitized == "Rate limit reached":
@@ -380,10 +468,11 @@ class Agent:
         return False
 
     def _on_complete(self, content: str) -> dict[str, Any]:
-        logger.info(
-            "Agent done after %d step(s): %s",
-            len(self._chain), [s["tool"] for s in self._chain],
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Agent done after %d step(s): %s",
+                len(self._chain), [s["tool"] for s in self._chain],
+            )
 
         if self._sandbox.report:
             self._sandbox.flush_report()
@@ -399,7 +488,7 @@ class Agent:
         return self._result("message", content=content, chain=self._chain)
 
     async def _on_exhausted(self) -> dict[str, Any]:
-        if not self._error:
+        if not self._error and logger.isEnabledFor(logging.WARNING):
             logger.warning(
                 "Agent hit max turns: %s", [s["tool"] for s in self._chain],
             )
@@ -448,50 +537,49 @@ class Agent:
 
     # -- Message building --
 
+    def _planner_base(self) -> str:
+        """Planner system prompt with the tool catalog, rebuilt only when tools change."""
+        return _planner_prompt(self._registry.catalog())
+
     def _build_planner_messages(self) -> list[dict]:
-        system = _PLANNER_SYSTEM.format(catalog=self._catalog)
+        system = self._planner_base()
 
         if self._read_skills:
             parts = [f"### {s['name']}\n{s['content']}" for s in self._read_skills]
             system += "\n\n## Domain Skills\n" + "\n".join(parts)
 
-        messages: list[dict] = [{"role": "system", "content": system}]
-        if self._history:
-            messages.extend(self._history)
-        messages.append({"role": "user", "content": self._user_input})
-
-        # Append tool call conversation so model sees its past actions
-        messages.extend(self._conv)
-
-        return messages
+        # One list build; the tool call conversation goes last so the model
+        # sees its past actions
+        return [
+            {"role": "system", "content": system},
+            *(self._history or ()),
+            {"role": "user", "content": self._user_input},
+            *self._conv,
+        ]
 
     def _build_worker_messages(self) -> list[dict]:
         system = _WORKER_SYSTEM
         if self._plan:
             system += f"\n\n## Plan\n{self._plan}"
 
-        msgs: list[dict] = [{"role": "system", "content": system}]
-
-        # History (only when no plan -- plan already contains resolved context)
-        if not self._plan and self._history:
-            msgs.extend(self._history)
-
-        # User message
-        ws = self._workspace
-        msgs.append({"role": "user", "content": self._user_input})
+        # History only when no plan -- plan already contains resolved context
+        history = self._history if not self._plan and self._history else ()
+        msgs: list[dict] = [
+            {"role": "system", "content": system},
+            *history,
+            {"role": "user", "content": self._user_input},
+        ]
 
         # Progress from previous turns + current workspace state
+        ws = self._workspace
         progress = ws.history()
         if progress:
             scope = ws.describe(report=self._sandbox.report)
-            msgs.append({
-                "role": "assistant",
-                "content": f"Done so far:\n{progress}\n\n[Workspace]\n{scope}",
-            })
-            if self._sandbox.report:
-                msgs.append({"role": "user", "content": "Report is ready. Summarize and stop."})
-            else:
-                msgs.append({"role": "user", "content": "Continue."})
+            done = f"Done so far:\n{progress}\n\n[Workspace]\n{scope}"
+            msgs += (
+                {"role": "assistant", "content": done},
+                _REPORT_READY_MSG if self._sandbox.report else _CONTINUE_MSG,
+            )
 
         return msgs
 
@@ -533,11 +621,14 @@ class Agent:
             available = ", ".join(self._skills.names()) if self._skills else ""
             result_content = f"Skill '{skill_name}' not found. Available: {available}"
             logger.warning("Agent/planner: skill %r not found", skill_name)
-        self._turn_results.append({
+        result_msg = {
             "role": "tool",
             "tool_call_id": tc.get("id", ""),
             "content": result_content,
-        })
+        }
+        self._turn_results.append(result_msg)
+        if content:
+            self._skill_results.append((result_msg, skill_name))
         self._chain.append({
             "tool": "Read", "params": {"name": skill_name},
             "summary": f"read {skill_name}" if content else f"{skill_name} not found",
@@ -620,11 +711,25 @@ class Agent:
         tools: list[dict] | None = None,
         tool_choice: str | None = None,
     ) -> dict:
-        """Make an LLM call, accumulating token usage."""
-        response = await llm.chat(messages, tools=tools, tool_choice=tool_choice)
+        """Make an LLM call, accumulating token usage.
+
+        Only the planner prefix (fixed commands + catalog system prompt) is
+        stable across turns. The worker's python tool embeds the live
+        workspace, and tools lead the provider's prefix, so cache markers
+        there would pay a cache write every turn and never get a read.
+        """
+        response = await llm.chat(
+            messages, tools=tools, tool_choice=tool_choice,
+            cache_prefix=self._mode == "planner",
+        )
         usage = response.get("usage") or {}
         self.tokens["in"] += usage.get("prompt_tokens", 0)
         self.tokens["out"] += usage.get("completion_tokens", 0)
+        # Prompt-cache hits (Anthropic reports them separately; OpenAI in details)
+        details = usage.get("prompt_tokens_details") or {}
+        self.tokens["cached"] += (
+            usage.get("cache_read_input_tokens") or details.get("cached_tokens") or 0
+        )
         return response
 
     @staticmethod
@@ -639,7 +744,7 @@ class Agent:
     def _parse_tool_args(tc: dict) -> dict[str, Any]:
         raw = tc["function"]["arguments"]
         try:
-            params = json.loads(raw) if isinstance(raw, str) else raw
+            params = json_loads(raw) if isinstance(raw, str) else raw
             return {k: v for k, v in params.items() if v is not None}
         except (json.JSONDecodeError, AttributeError):
             return {}
@@ -683,6 +788,11 @@ def _error_hint(err_text: str, workspace: Workspace, sandbox: SandboxRunner) ->
     return None
 
 
+def _report_ready(report: dict[str, Any]) -> str:
+    """Short completion message listing the populated report sections."""
+    return f"Results are ready: {', '.join(report)}."
+
+
 def _build_produced(workspace: Workspace, sandbox: SandboxRunner) -> str | None:
     parts: list[str] = []
     if sandbox.report:
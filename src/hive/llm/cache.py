@@ -0,0 +1,148 @@
+"""Response cache -- reuse of agent answers for repeated prompts.
+
+Two layers share one store: an exact match on the normalized prompt, and an
+optional semantic match (cosine similarity of prompt embeddings) for
+paraphrases. Both only ever match within the same scope -- history, model,
+user, planner mode and tool set.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Any
+
+from hive.utils import json_dumps
+
+# Bump when prompts or the agent loop change shape so old answers are not reused
+_CACHE_SCHEMA = 1
+
+# Raw sequence pasted into the prompt (BLAST, translate, ...) -- a paraphrase
+# match would answer for a different sequence, so these are exact-only
+_RAW_SEQUENCE_RE = re.compile(r"[A-Za-z*]{30,}")
+
+
+def normalize_prompt(text: str) -> str:
+    """Case- and whitespace-insensitive form of a user prompt."""
+    return " ".join(text.split()).lower()
+
+
+def semantic_eligible(text: str) -> bool:
+    """Whether a prompt may be answered from a paraphrase."""
+    return _RAW_SEQUENCE_RE.search(text) is None
+
+
+def _unit(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+class ResponseCache:
+    """Bounded LRU of agent responses with a time-to-live.
+
+    Tool results come from a live database, so entries expire after ``ttl``
+    seconds rather than living for the whole process. With an
+    ``embedding_model``, entries stored with a prompt embedding can also be
+    found by ``nearest`` when a new prompt's embedding is at least
+    ``threshold`` cosine-similar. Single-threaded under asyncio, like
+    ModelPool.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: float = 300.0,
+        threshold: float = 0.95,
+        embedding_model: str = "",
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self.embedding_model = embedding_model  # empty = exact matches only
+        # key -> (stored at, response, scope, unit embedding or None)
+        self._entries: OrderedDict[str, tuple[float, dict, str, list[float] | None]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def scope(
+        history: list[dict] | None,
+        model: str,
+        *,
+        user_id: int | None = None,
+        use_planner: bool = True,
+        registry_version: int = 0,
+        data_version: int = 0,
+    ) -> str:
+        """Digest of everything besides the prompt that shapes an answer.
+
+        *data_version* (``db.data_version``) changes after every commit that
+        writes data, so answers computed before a scan, dedupe or prune are
+        not reused.
+        """
+        payload = [
+            _CACHE_SCHEMA,
+            [(m.get("role"), m.get("content")) for m in history or ()],
+            model,
+            user_id,
+            use_planner,
+            registry_version,
+            data_version,
+        ]
+        return hashlib.sha256(json_dumps(payload, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def key(user_input: str, scope: str) -> str:
+        """Exact-match key: normalized prompt within a scope."""
+        return hashlib.sha256(f"{scope}\0{normalize_prompt(user_input)}".encode()).hexdigest()
+
+    def _live(self, key: str) -> dict | None:
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(hit[1])
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Copy of the cached response, or None on a miss or expired entry."""
+        return self._live(key)
+
+    def nearest(self, scope: str, embedding: list[float]) -> dict[str, Any] | None:
+        """Copy of the most similar cached response in *scope*, if above threshold."""
+        query = _unit(embedding)
+        best_key, best = None, self.threshold
+        for key, (_, _, entry_scope, vector) in self._entries.items():
+            if vector is None or entry_scope != scope or len(vector) != len(query):
+                continue
+            score = sum(a * b for a, b in zip(vector, query, strict=True))
+            if score >= best:
+                best_key, best = key, score
+        return self._live(best_key) if best_key is not None else None
+
+    def put(
+        self,
+        key: str,
+        response: dict[str, Any],
+        scope: str = "",
+        embedding: list[float] | None = None,
+    ):
+        """Store a response; failed runs are never cached."""
+        if response.get("llm_error"):
+            return
+        # Token counts belong to the original run -- a hit costs nothing
+        entry = {k: v for k, v in response.items() if k != "tokens"}
+        vector = _unit(embedding) if embedding else None
+        self._entries[key] = (time.monotonic(), copy.deepcopy(entry), scope, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,20 +1,45 @@
 """LLM client -- unified provider support via litellm."""
 
-import json
+import asyncio
 import logging
 
 import httpx
-import litellm
 
 from hive.config import ModelEntry
+from hive.utils import json_dumps
 
-# Silence litellm's verbose logging
-litellm.suppress_debug_info = True
 logging.getLogger("LiteLLM").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 _dump = logging.getLogger("hive.llm.dump")
 
+# Providers that honour per-block cache_control markers (prompt caching)
+_CACHE_PROVIDERS = {"anthropic"}
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+_litellm_module = None
+
+
+def _litellm():
+    """litellm, imported on first use -- it takes seconds to import (and
+    fetches the model cost map), which every CLI start and test run would
+    otherwise pay. Blocking: call through load_litellm() from async code."""
+    global _litellm_module
+    if _litellm_module is None:
+        import litellm
+
+        # Silence litellm's verbose logging
+        litellm.suppress_debug_info = True
+        _litellm_module = litellm
+    return _litellm_module
+
+
+async def load_litellm():
+    """litellm, imported on a worker thread the first time so the slow import
+    never stalls the event loop. The server awaits this during startup."""
+    return _litellm_module or await asyncio.to_thread(_litellm)
+
 
 class LLMClient:
     """Async LLM client supporting Ollama, Anthropic, OpenAI, and others."""
@@ -25,6 +50,9 @@ class LLMClient:
         # Build litellm model identifier -- litellm always needs provider/ prefix
         self._model = f"{config.provider}/{config.model}"
 
+        # Health-check client, created on first use and kept for keep-alive
+        self._http: httpx.AsyncClient | None = None
+
     @property
     def provider(self) -> str:
         return self._config.provider
@@ -43,35 +71,27 @@ class LLMClient:
         tools: list[dict] | None = None,
         tool_choice: str | None = None,
         disable_thinking: bool = False,
+        cache_prefix: bool = False,
     ) -> dict:
-        """Send a chat completion request via litellm."""
+        """Send a chat completion request via litellm.
+
+        With ``cache_prefix``, providers that support prompt caching get
+        breakpoints on the system message and the last tool schema so the
+        stable prefix is reused across turns.
+        """
+        if cache_prefix and self._config.provider in _CACHE_PROVIDERS:
+            messages, tools = _with_cache_breakpoints(messages, tools)
+
         kwargs: dict = {
             "model": self._model,
             "messages": messages,
+            **self._endpoint_kwargs(),
         }
         if tools:
             kwargs["tools"] = tools
             if tool_choice:
                 kwargs["tool_choice"] = tool_choice
 
-        # Provider-specific config
-        if self._config.provider == "ollama":
-            base = self._config.base_url or "http://localhost:11434"
-            # litellm expects base URL without /v1 for Ollama
-            if base.endswith("/v1"):
-                base = base[:-3]
-            kwargs["api_base"] = base
-        elif self._config.base_url:
-            # Custom endpoint (vLLM, etc.) -- pass base URL to litellm
-            kwargs["api_base"] = self._config.base_url
-
-        if self._config.api_key:
-            kwargs["api_key"] = self._config.api_key
-        elif self._config.provider == "openai" and self._config.base_url:
-            # Local OpenAI-compatible endpoints (vLLM, etc.) don't need a real key
-            # but litellm requires one to be set
-            kwargs["api_key"] = "no-key"
-
         kwargs["timeout"] = 120  # seconds -- prevent indefinite hangs
         kwargs["num_retries"] = 3  # litellm auto-retry on transient errors
 
@@ -82,7 +102,7 @@ class LLMClient:
 
         if _dump.isEnabledFor(logging.DEBUG):
             _dump.debug(
-                json.dumps(
+                json_dumps(
                     {
                         "dir": "request",
                         "model": self._model,
@@ -94,6 +114,7 @@ class LLMClient:
                 )
             )
 
+        litellm = await load_litellm()
         response = await litellm.acompletion(**kwargs)
         try:
             result = response.model_dump()
@@ -103,7 +124,7 @@ class LLMClient:
 
         if _dump.isEnabledFor(logging.DEBUG):
             _dump.debug(
-                json.dumps(
+                json_dumps(
                     {
                         "dir": "response",
                         "model": self._model,
@@ -116,17 +137,58 @@ class LLMClient:
 
         return result
 
+    def _endpoint_kwargs(self) -> dict:
+        """Provider-specific api_base / api_key for litellm calls."""
+        kwargs: dict = {}
+        if self._config.provider == "ollama":
+            base = self._config.base_url or "http://localhost:11434"
+            # litellm expects base URL without /v1 for Ollama
+            if base.endswith("/v1"):
+                base = base[:-3]
+            kwargs["api_base"] = base
+        elif self._config.base_url:
+            # Custom endpoint (vLLM, etc.) -- pass base URL to litellm
+            kwargs["api_base"] = self._config.base_url
+
+        if self._config.api_key:
+            kwargs["api_key"] = self._config.api_key
+        elif self._config.provider == "openai" and self._config.base_url:
+            # Local OpenAI-compatible endpoints (vLLM, etc.) don't need a real key
+            # but litellm requires one to be set
+            kwargs["api_key"] = "no-key"
+        return kwargs
+
+    async def embed(self, text: str, model: str) -> list[float]:
+        """Embedding vector for *text* from *model* on this client's endpoint.
+
+        *model* is the provider-side name (e.g. ``nomic-embed-text`` on Ollama).
+        """
+        litellm = await load_litellm()
+        response = await litellm.aembedding(
+            model=f"{self._config.provider}/{model}",
+            input=[text],
+            timeout=30,
+            **self._endpoint_kwargs(),
+        )
+        item = response.data[0]
+        return list(item["embedding"] if isinstance(item, dict) else item.embedding)
+
     async def health(self) -> bool:
         """Check if the LLM service is reachable."""
         if self._config.base_url:
             # Local providers (Ollama, vLLM, etc.) -- ping the endpoint
-            try:
+            if self._http is None:
                 base = self._config.base_url.rstrip("/")
                 if not base.endswith("/v1"):
                     base += "/v1"
-                async with httpx.AsyncClient(base_url=base, timeout=5.0) as client:
-                    response = await client.get("/models")
-                    return response.status_code == 200
+                self._http = httpx.AsyncClient(
+                    base_url=base,
+                    timeout=5.0,
+                    limits=httpx.Limits(max_keepalive_connections=2),
+                )
+            try:
+                response = await self._http.get("/models")
+                return response.status_code == 200
             except httpx.HTTPError:
                 return False
         else:
@@ -134,7 +196,36 @@ class LLMClient:
             return bool(self._config.api_key)
 
     async def close(self):
-        pass  # litellm manages connections internally
+        # litellm manages completion connections internally
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+def _with_cache_breakpoints(
+    messages: list[dict], tools: list[dict] | None,
+) -> tuple[list[dict], list[dict] | None]:
+    """Return copies of messages/tools with ephemeral cache_control markers.
+
+    Marks the end of the system message and the last tool schema. Inputs
+    are left untouched -- callers may reuse them across turns.
+
+    The breakpoints deliberately stop at the static prefix: user turns and
+    role="tool" observations (search hits, sequences, sandbox output) change
+    every turn, and caching them only pays cache-write cost for entries
+    that are never read back.
+    """
+    if messages and messages[0].get("role") == "system":
+        system = messages[0]
+        content = system.get("content")
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content, "cache_control": _EPHEMERAL}]
+        elif isinstance(content, list) and content:
+            content = [*content[:-1], {**content[-1], "cache_control": _EPHEMERAL}]
+        messages = [{**system, "content": content}, *messages[1:]]
+    if tools:
+        tools = [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
+    return messages, tools
 
 
 def _extract_response(response) -> dict:
@@ -45,3 +45,8 @@ class ModelPool:
     def entries(self) -> list[ModelEntry]:
         """All configured model entries."""
         return list(self._entries.values())
+
+    async def close(self):
+        """Close every client created so far."""
+        for client in self._clients.values():
+            await client.close()
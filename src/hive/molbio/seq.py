@@ -1,10 +1,16 @@
 """Pure sequence operations -- no Biopython."""
 
 import json
+import re
+from functools import cache
+from itertools import repeat
 from pathlib import Path
 
 _COMPLEMENT = str.maketrans("ACGTRYWSMKBDHVN", "TGCAYRWSKMVHDBN")
 
+# Non-overlapping triplets; a trailing partial codon is simply not matched
+_CODON = re.compile(r"...", re.DOTALL)
+
 _EXTRAS_DIR = Path(__file__).resolve().parents[3] / "extras"
 
 # Module-level cache for codon tables
@@ -37,6 +43,17 @@ def back_transcribe(seq: str) -> str:
     return seq.upper().replace("U", "T")
 
 
+@cache
+def _codon_lut(table: int) -> dict[str, str]:
+    """Codon -> amino acid map for one table, stop codons merged in as '*'."""
+    ct = _load_codon_tables().get(table)
+    if ct is None:
+        raise ValueError(f"Unknown codon table: {table}")
+    lut = dict(ct["forward_table"])
+    lut.update(dict.fromkeys(ct["stop_codons"], "*"))
+    return lut
+
+
 def translate(seq: str, table: int = 1) -> str:
     """Translate a DNA/RNA sequence to protein.
 
@@ -45,20 +62,6 @@ def translate(seq: str, table: int = 1) -> str:
     Stop codons are translated as '*'.
     """
     seq = seq.upper().replace("U", "T")
-    tables = _load_codon_tables()
-    ct = tables.get(table)
-    if ct is None:
-        raise ValueError(f"Unknown codon table: {table}")
-
-    forward = ct["forward_table"]
-    stops = set(ct["stop_codons"])
-    protein = []
-    for i in range(0, len(seq) - 2, 3):
-        codon = seq[i : i + 3]
-        if codon in stops:
-            protein.append("*")
-        elif codon in forward:
-            protein.append(forward[codon])
-        else:
-            protein.append("X")  # unknown codon
-    return "".join(protein)
+    lut = _codon_lut(table)
+    # Unknown codons (ambiguity codes, gaps) -> 'X'
+    return "".join(map(lut.get, _CODON.findall(seq), repeat("X")))
@@ -1,9 +1,13 @@
-"""Parser interface -- common data structures for all parsers."""
+"""Parser interface -- common data structures for all parsers.
+
+Slotted: a large GenBank file yields thousands of features, and slots keep
+each instance free of a per-object __dict__.
+"""
 
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFeature:
     name: str
     type: str  # SO term: CDS, promoter, terminator, etc.
@@ -13,7 +17,7 @@ class ParsedFeature:
     qualifiers: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedPrimer:
     name: str
     sequence: str
@@ -24,7 +28,7 @@ class ParsedPrimer:
     length: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     name: str
     sequence: str
@@ -1,5 +1,6 @@
 """FASTA parser -- native implementation, no Biopython."""
 
+import io
 import logging
 from pathlib import Path
 
@@ -8,31 +9,54 @@ from hive.utils import detect_molecule
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE = b" \t\r\n\v\f"
 
-def parse_fasta(filepath: Path, extract: list[str] | None = None) -> ParseResult:
-    """Parse a FASTA file and return structured data (first record only)."""
-    text = filepath.read_text()
-    lines = text.strip().splitlines()
+
+def parse_fasta(
+    filepath: Path, extract: list[str] | None = None, data: bytes | None = None
+) -> ParseResult:
+    """Parse a FASTA file and return structured data (first record only).
+
+    Streams the file line by line and stops at the second header, so large
+    multi-record files are never read (or split) in full. When the caller
+    already holds the contents (data), the first record is sliced out of the
+    bytes and its line breaks removed with a single translate.
+    """
+    if data is not None and (record := _first_record(data, filepath)) is not None:
+        header, seq_str = record
+        parts = header.split(None, 1)
+        return ParseResult(
+            name=parts[0] if parts else filepath.stem,
+            sequence=seq_str,
+            size_bp=len(seq_str),
+            topology="linear",
+            molecule=detect_molecule(seq_str),
+            description=parts[1] if len(parts) > 1 else None,
+            meta={},
+        )
 
     name = filepath.stem
     description = None
     seq_lines = []
     header_seen = False
 
-    for line in lines:
-        line = line.strip()
-        if line.startswith(">"):
-            if header_seen:
-                logger.warning("Multi-record FASTA %s: only first record parsed", filepath.name)
-                break
-            header_seen = True
-            header = line[1:].strip()
-            parts = header.split(None, 1)
-            name = parts[0] if parts else filepath.stem
-            if len(parts) > 1:
-                description = parts[1]
-        elif line:
-            seq_lines.append(line)
+    with io.StringIO(data.decode()) if data is not None else open(filepath) as fh:
+        for line in fh:
+            line = line.strip()
+            if line.startswith(">"):
+                if header_seen:
+                    logger.warning(
+                        "Multi-record FASTA %s: only first record parsed", filepath.name
+                    )
+                    break
+                header_seen = True
+                header = line[1:].strip()
+                parts = header.split(None, 1)
+                name = parts[0] if parts else filepath.stem
+                if len(parts) > 1:
+                    description = parts[1]
+            elif line:
+                seq_lines.append(line)
 
     seq_str = "".join(seq_lines)
 
@@ -45,3 +69,24 @@ def parse_fasta(filepath: Path, extract: list[str] | None = None) -> ParseResult
         description=description,
         meta={},
     )
+
+
+def _first_record(data: bytes, filepath: Path) -> tuple[str, str] | None:
+    """Header and sequence of the first record in *data*.
+
+    Returns None when the contents do not start with a header line, leaving
+    such files to the line-by-line parser.
+    """
+    body = data.lstrip()
+    if not body.startswith(b">"):
+        return None
+    header_end = body.find(b"\n")
+    if header_end < 0:
+        return body[1:].decode().strip(), ""
+    next_record = body.find(b"\n>", header_end)
+    if next_record >= 0:
+        logger.warning("Multi-record FASTA %s: only first record parsed", filepath.name)
+    else:
+        next_record = len(body)
+    seq = body[header_end:next_record].translate(None, _WHITESPACE)
+    return body[1:header_end].decode().strip(), seq.decode()
@@ -1,14 +1,44 @@
 """GenBank .gb/.gbk parser -- native implementation, no Biopython."""
 
+import mmap
 import re
 from pathlib import Path
 
 from hive.parsers.base import ParsedFeature, ParseResult
 
+# ORIGIN lines are "  <position> <10-base blocks>" -- drop digits and whitespace
+_ORIGIN_STRIP = b"0123456789 \t\r\n"
+_NON_LETTER_RE = re.compile(rb"[^a-zA-Z]")
 
-def parse_genbank(filepath: Path, extract: list[str] | None = None) -> ParseResult:
-    """Parse a GenBank file and return structured data."""
-    text = filepath.read_text()
+
+def parse_genbank(
+    filepath: Path, extract: list[str] | None = None, data: bytes | None = None
+) -> ParseResult:
+    """Parse a GenBank file and return structured data.
+
+    data: file contents already read by the caller (skips re-reading filepath).
+    Otherwise the file is memory-mapped, so only the slices actually used are
+    copied out of the page cache.
+
+    Only the header (everything before ORIGIN) is decoded to text; the
+    sequence block stays bytes and is cleaned with a single translate.
+    """
+    if data is not None:
+        return _parse_genbank(filepath, data, extract)
+    with open(filepath, "rb") as fh:
+        try:
+            raw = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file -- nothing to map
+            return _parse_genbank(filepath, b"", extract)
+        with raw:
+            return _parse_genbank(filepath, raw, extract)
+
+
+def _parse_genbank(
+    filepath: Path, raw: bytes | mmap.mmap, extract: list[str] | None
+) -> ParseResult:
+    origin_at = raw.find(b"\nORIGIN")
+    text = raw[: origin_at + 1 if origin_at >= 0 else len(raw)].decode()
 
     # -- LOCUS line --
     locus_m = re.match(
@@ -36,11 +66,7 @@ def parse_genbank(filepath: Path, extract: list[str] | None = None) -> ParseResu
         molecule = "DNA"
 
     # -- ORIGIN section (sequence) --
-    origin_m = re.search(r"^ORIGIN\s*\n(.*?)^//", text, re.MULTILINE | re.DOTALL)
-    sequence = ""
-    if origin_m:
-        # Strip line numbers and spaces, keep only letters
-        sequence = re.sub(r"[^a-zA-Z]", "", origin_m.group(1))
+    sequence = _origin_sequence(raw, origin_at) if origin_at >= 0 else ""
 
     size_bp = len(sequence)
 
@@ -67,6 +93,20 @@ def parse_genbank(filepath: Path, extract: list[str] | None = None) -> ParseResu
     )
 
 
+def _origin_sequence(raw: bytes | mmap.mmap, origin_at: int) -> str:
+    """Letters of the ORIGIN block starting at *origin_at* (up to ``//``)."""
+    start = raw.find(b"\n", origin_at + 1)
+    end = raw.find(b"\n//", start) if start >= 0 else -1
+    if end < 0:
+        return ""
+    # Strip line numbers and spaces, keep only letters. One translate pass
+    # handles well-formed blocks; anything else falls back to regex.
+    seq = raw[start:end].translate(None, _ORIGIN_STRIP)
+    if not (seq.isascii() and seq.isalpha()):
+        seq = _NON_LETTER_RE.sub(b"", seq)
+    return seq.decode("ascii")
+
+
 def _parse_features(block: str) -> list[ParsedFeature]:
     """Parse the FEATURES block into ParsedFeature objects."""
     features = []
@@ -1,5 +1,7 @@
 """SnapGene file parser using sgffp (.dna, .rna, .prot)."""
 
+import struct
+from io import BytesIO
 from pathlib import Path
 
 from hive.molbio.primers import find_primer_sites
@@ -8,11 +10,54 @@ from hive.parsers.base import ParsedFeature, ParsedPrimer, ParseResult
 # sgffp block IDs -> molecule type
 _BLOCK_MOLECULE_TYPE = {0: "DNA", 1: "DNA", 21: "protein", 32: "RNA"}
 
-# sgffp strand strings -> integer (DB stores SmallInteger)
-_STRAND_MAP = {"+": 1, "-": -1, ".": 0, "1": 1, "-1": -1}
+# sgffp strand values -> integer (DB stores SmallInteger). Ints map to
+# themselves so the common values resolve in a single lookup.
+_STRAND_MAP: dict[object, int] = {"+": 1, "-": -1, ".": 0, "1": 1, "-1": -1, 1: 1, -1: -1, 0: 0}
+
+
+# sgffp blocks read for every file: sequence (DNA, 2-bit DNA, protein, RNA)
+# and notes, which carry the description
+_BASE_BLOCKS = frozenset({0, 1, 6, 21, 32})
+
+# Extra blocks per extract key. Anything not listed (traces, trace alignments,
+# attachments, enzyme sets, ...) is skipped undecoded.
+_EXTRACT_BLOCKS = {
+    "features": frozenset({10}),
+    "primers": frozenset({5}),
+    "history": frozenset({7, 10, 11, 29, 30}),  # 10: root node fallback features
+}
+
+
+def _read_sgff(source, extract: list[str] | None):
+    """SgffReader.read(), decoding only the blocks parse_snapgene will use.
+
+    SgffReader always decodes every block, including LZMA history and BAM/ZTR
+    trace data that indexing never looks at.
+    """
+    from sgffp.internal import Cookie, SgffObject
+    from sgffp.parsers import parse_blocks, scheme_for
+
+    wanted = set(_BASE_BLOCKS)
+    for key in _EXTRACT_BLOCKS if extract is None else extract:
+        wanted |= _EXTRACT_BLOCKS.get(key, frozenset())
+
+    with BytesIO(source) if isinstance(source, bytes) else open(source, "rb") as stream:
+        if stream.read(1) != b"\t":
+            raise ValueError("Invalid SnapGene file: wrong magic byte")
+        length = struct.unpack(">I", stream.read(4))[0]
+        if length != 14 or stream.read(8) != b"SnapGene":
+            raise ValueError("Invalid SnapGene file: wrong header")
+        cookie = Cookie(*struct.unpack(">HHH", stream.read(6)))
+        scheme = {
+            bid: fn for bid, fn in scheme_for(cookie.export_version).items() if bid in wanted
+        }
+        return SgffObject(cookie=cookie, blocks=parse_blocks(stream, scheme))
 
 
 def _parse_strand(strand) -> int:
+    mapped = _STRAND_MAP.get(strand)
+    if mapped is not None:
+        return mapped
     if isinstance(strand, int):
         return strand
     return _STRAND_MAP.get(str(strand), 0)
@@ -109,11 +154,15 @@ def _history_keywords(steps: list[dict]) -> str:
     return " ".join(sorted(words))
 
 
-def parse_snapgene(filepath: Path, extract: list[str] | None = None) -> ParseResult:
-    """Parse a SnapGene file (.dna, .rna, .prot) and return structured data."""
-    from sgffp import SgffReader
+def parse_snapgene(
+    filepath: Path, extract: list[str] | None = None, data: bytes | None = None
+) -> ParseResult:
+    """Parse a SnapGene file (.dna, .rna, .prot) and return structured data.
 
-    sgff = SgffReader.from_file(filepath)
+    data: file contents already read by the caller (skips re-reading filepath).
+    Blocks not needed for *extract* are skipped without being decoded.
+    """
+    sgff = _read_sgff(data if data is not None else filepath, extract)
 
     features = []
     if extract is None or "features" in extract:
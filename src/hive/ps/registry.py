@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
 from datetime import UTC, datetime
 
 from hive.ps.base import Process, ProcessContext, ProcessInfo, ProcessState, ProcessStoppedError
+from hive.utils import cancel_and_wait
 
 logger = logging.getLogger(__name__)
 
@@ -80,10 +80,8 @@ class ProcessRegistry:
             ctx.stop_event.set()
 
         task = self._tasks.get(name)
-        if task and not task.done():
-            task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await task
+        if task:
+            await cancel_and_wait(task)
 
         info = self._info.get(name)
         if info and info.state in (ProcessState.running, ProcessState.paused):
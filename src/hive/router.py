@@ -8,11 +8,16 @@ import re
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
+from hive.context import current_user_id
+from hive.db import session as db
 from hive.llm import LLMClient
 from hive.llm.agent import Agent
+from hive.llm.cache import normalize_prompt, semantic_eligible
 from hive.tools import ToolRegistry
+from hive.utils import json_loads
 
 if TYPE_CHECKING:
+    from hive.llm.cache import ResponseCache
     from hive.skills import SkillLibrary
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,25 @@ DIRECT_PATTERN = re.compile(r"^//(\w+)\s*(.*)", re.DOTALL)
 GUIDED_PATTERN = re.compile(r"^/(\w+)\s*(.*)", re.DOTALL)
 
 
+def _split_command(user_input: str) -> tuple[bool, str, str] | None:
+    """Split ``//name args`` / ``/name args`` into (direct, name, args).
+
+    Same semantics as DIRECT_PATTERN / GUIDED_PATTERN (name is ``\\w+``,
+    args are stripped) without running the regex engine on every message.
+    Returns None for input that is not a command.
+    """
+    if not user_input.startswith("/"):
+        return None
+    direct = user_input.startswith("//")
+    start = end = 2 if direct else 1
+    n = len(user_input)
+    while end < n and (user_input[end].isalnum() or user_input[end] == "_"):
+        end += 1
+    if end == start:
+        return None
+    return direct, user_input[start:end], user_input[end:].strip()
+
+
 async def route_input(
     user_input: str,
     registry: ToolRegistry,
@@ -35,6 +59,8 @@ async def route_input(
     on_progress: Callable[[dict], Awaitable[None]] | None = None,
     skills: SkillLibrary | None = None,
     use_planner: bool = True,
+    fast_finish: bool = True,
+    response_cache: ResponseCache | None = None,
 ) -> dict[str, Any]:
     """Route user input -> tool execution -> response.
 
@@ -48,10 +74,11 @@ async def route_input(
     if user_input.strip().lstrip("/") == "help":
         return _help_response(registry)
 
+    command = _split_command(user_input)
+
     # -- Mode 1: Direct -- //command --
-    if match := DIRECT_PATTERN.match(user_input):
-        tool_name = match.group(1)
-        args_text = match.group(2).strip()
+    if command and command[0]:
+        _, tool_name, args_text = command
         tool = registry.get(tool_name)
         if not tool:
             return _error(f"Unknown tool: {tool_name}")
@@ -65,9 +92,8 @@ async def route_input(
         return _tool_response(tool_name, result, params, result.get("error", ""))
 
     # -- Mode 2: Guided -- /command --
-    if match := GUIDED_PATTERN.match(user_input):
-        tool_name = match.group(1)
-        text = match.group(2).strip()
+    if command:
+        _, tool_name, text = command
         tool = registry.get(tool_name)
         if not tool:
             return _error(f"Unknown tool: {tool_name}")
@@ -93,6 +119,8 @@ async def route_input(
             on_progress=on_progress,
             skills=skills,
             use_planner=use_planner,
+            fast_finish=fast_finish,
+            response_cache=response_cache,
         )
 
     # -- Mode 3: Natural language -- unified agentic loop --
@@ -109,6 +137,8 @@ async def route_input(
         on_progress=on_progress,
         skills=skills,
         use_planner=use_planner,
+        fast_finish=fast_finish,
+        response_cache=response_cache,
     )
 
 
@@ -125,11 +155,42 @@ async def _run_agents(
     on_progress: Callable[[dict], Awaitable[None]] | None = None,
     skills: SkillLibrary | None = None,
     use_planner: bool = True,
+    fast_finish: bool = True,
+    response_cache: ResponseCache | None = None,
 ) -> dict[str, Any]:
-    """Run unified agent (planner + worker in one loop)."""
+    """Run unified agent (planner + worker in one loop).
+
+    With a response cache, a repeat (same normalized prompt, history, model,
+    user and tool set) returns the earlier answer without an LLM call; with
+    an embedding model configured, so does a close paraphrase.
+    """
+    key = scope = embedding = None
+    if response_cache is not None:
+        scope = response_cache.scope(
+            history, f"{llm_client.provider}/{llm_client.model}",
+            user_id=current_user_id.get(),
+            use_planner=use_planner,
+            registry_version=registry.version,
+            data_version=db.data_version,
+        )
+        key = response_cache.key(user_input, scope)
+        cached = response_cache.get(key)
+        if (
+            cached is None
+            and response_cache.embedding_model
+            and semantic_eligible(user_input)
+        ):
+            embedding = await _embed(llm_client, response_cache.embedding_model, user_input)
+            if embedding:
+                cached = response_cache.nearest(scope, embedding)
+        if cached is not None:
+            logger.info("Agent: response cache hit (%s)", "semantic" if embedding else "exact")
+            return cached
+
     agent = Agent(
         registry, skills,
         output_limit=sandbox_output_limit,
+        fast_finish=fast_finish,
     )
     agent.prepare(
         user_input,
@@ -137,7 +198,19 @@ async def _run_agents(
         on_progress=on_progress,
         use_planner=use_planner,
     )
-    return await agent.run(llm_client, max_turns=max_turns)
+    result = await agent.run(llm_client, max_turns=max_turns)
+    if key is not None:
+        response_cache.put(key, result, scope, embedding)
+    return result
+
+
+async def _embed(llm_client: LLMClient, model: str, text: str) -> list[float] | None:
+    """Prompt embedding for the semantic cache; None if the provider can't embed."""
+    try:
+        return await llm_client.embed(normalize_prompt(text), model)
+    except Exception as e:
+        logger.debug("Prompt embedding failed (%s): %s", model, e)
+        return None
 
 
 # -- Helpers --
@@ -147,10 +220,14 @@ def _parse_args(text: str) -> dict:
     """Try to parse text as JSON params, fall back to {'query': text}."""
     if not text:
         return {}
+    # Free text is the common case -- only a JSON object can be params
+    if not text.startswith("{"):
+        return {"query": text}
     try:
-        return json.loads(text)
+        params = json_loads(text)
     except json.JSONDecodeError:
         return {"query": text}
+    return params if isinstance(params, dict) else {"query": text}
 
 
 def _tool_response(tool_name: str, result: dict, params: dict, content: str) -> dict:
@@ -173,11 +250,7 @@ def _form_response(tool_name: str, description: str, schema: dict) -> dict:
 
 
 def _help_response(registry: ToolRegistry) -> dict:
-    lines = ["**Available commands:**\n"]
-    for tool in registry.tools():
-        lines.append(f"- **/{tool.name}** -- {tool.long_desc}")
-    lines.append("\nPrefix with `//` for direct execution (no LLM), e.g. `//search ampicillin`.")
-    return {"type": "message", "content": "\n".join(lines)}
+    return {"type": "message", "content": registry.help_text()}
 
 
 def _error(msg: str) -> dict:
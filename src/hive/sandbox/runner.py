@@ -16,6 +16,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Static part of the python tool schema -- shared across turns, treat as read-only
+_PYTHON_PARAMS: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "description": {
+            "type": "string",
+            "description": "Brief description of what this code does.",
+        },
+        "code": {
+            "type": "string",
+            "description": "Python code to execute.",
+        },
+    },
+    "required": ["description", "code"],
+}
+
 
 class SandboxRunner:
     """Execution orchestrator for the built-in python sandbox."""
@@ -45,7 +61,7 @@ class SandboxRunner:
             def wrapper(*args, **kwargs):
                 # Accept first positional arg as 'query' for convenience
                 if args:
-                    schema = t.input_schema()
+                    schema = t.llm_schema["parameters"]
                     required = schema.get("required", [])
                     first_param = required[0] if required else next(iter(schema.get("properties", {})), None)
                     if first_param and first_param not in kwargs:
@@ -85,20 +101,7 @@ class SandboxRunner:
             "function": {
                 "name": "python",
                 "description": ws_desc,
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "description": {
-                            "type": "string",
-                            "description": "Brief description of what this code does.",
-                        },
-                        "code": {
-                            "type": "string",
-                            "description": "Python code to execute.",
-                        },
-                    },
-                    "required": ["description", "code"],
-                },
+                "parameters": _PYTHON_PARAMS,
             },
         }
 
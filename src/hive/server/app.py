@@ -1,24 +1,38 @@
 """FastAPI application factory."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
+import httpx
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from hive.admin import admin_router, generate_token, save_token
 from hive.chat import ChatStorage
 from hive.config import Settings
 from hive.deps import BlastDep, DepRegistry, MafftDep
-from hive.llm import ModelPool
+from hive.llm import ModelPool, ResponseCache
+from hive.llm.client import load_litellm
 from hive.server.routes import router
 from hive.server.websocket import ws_router
 from hive.tools import ToolFactory
+from hive.utils import cancel_and_wait, json_bytes
 
 logger = logging.getLogger(__name__)
 
+_SHUTDOWN_TIMEOUT = 5.0  # seconds per shutdown step
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class -- renders through orjson when installed."""
+
+    def render(self, content) -> bytes:
+        return json_bytes(content)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -34,40 +48,29 @@ async def lifespan(app: FastAPI):
     logger.debug("Admin token: %s", token)
 
     # --- Chat storage ---
-    app.state.chat_storage = ChatStorage(config.chats_dir)
-
-    # --- Database ---
-    try:
-        from hive.db import init_db
-
-        app.state.db_ready = await init_db(config.database)
-    except Exception as e:
-        logger.warning("Database init skipped: %s", e)
-
-    # --- Bootstrap enzymes ---
-    if app.state.db_ready:
-        try:
-            from hive.libs.enzymes import bootstrap_enzymes
-            from hive.db import session as db
-
-            async with db.async_session_factory() as session:
-                await bootstrap_enzymes(session)
-                await session.commit()
-        except Exception as e:
-            logger.warning("Enzyme bootstrap failed: %s", e)
+    app.state.chat_storage = ChatStorage(config.chats_dir, compress=config.chat.compress)
 
-    # --- Model pool ---
+    # --- Database and LLM probe (independent round-trips, run concurrently) ---
     pool = ModelPool(config.llm.models)
     app.state.model_pool = pool
-    default_client = pool.get(pool.default_id) if pool.default_id else None
-    if default_client:
-        try:
-            if await default_client.health():
-                logger.info("LLM connected: %s", pool.default_id)
-            else:
-                logger.warning("Default LLM not available: %s", pool.default_id)
-        except Exception:
-            logger.warning("Default LLM not available: %s", pool.default_id)
+    # Shared for model discovery so /api/models polls reuse keep-alive connections
+    app.state.http_client = httpx.AsyncClient(timeout=5.0)
+    # litellm is imported on a worker thread here, before connections are
+    # accepted, so the first chat does not pay the import on the event loop
+    app.state.db_ready, _, _ = await asyncio.gather(
+        _init_database(config), _check_llm(pool), load_litellm()
+    )
+
+    app.state.response_cache = (
+        ResponseCache(
+            config.llm.response_cache_size,
+            config.llm.response_cache_ttl,
+            threshold=config.llm.semantic_cache_threshold,
+            embedding_model=config.llm.semantic_cache_model,
+        )
+        if config.llm.response_cache_ttl > 0
+        else None
+    )
 
     # --- Dep registry ---
     dep_registry = DepRegistry()
@@ -124,27 +127,93 @@ async def lifespan(app: FastAPI):
     ps.register(PruneProcess(config))
     app.state.ps = ps
 
+    # Initial scan, dep setup and watcher run in the background so the
+    # server accepts connections while files are indexed
+    app.state.startup_task = None
     if app.state.db_ready and config.watcher.rules:
-        try:
-            await ps.start("scan")
-            # Wait for scan to finish
-            task = ps._tasks.get("scan")
-            if task:
-                await task
-        except Exception as e:
-            logger.warning("Initial scan failed: %s", e)
+        app.state.startup_task = asyncio.create_task(
+            _initial_index(ps, dep_registry), name="startup-index"
+        )
+        app.state.startup_task.add_done_callback(_log_startup_failure)
+
+    yield
+
+    # --- Shutdown --- (bounded: a stuck task or client must not block exit)
+    if app.state.startup_task:
+        await cancel_and_wait(app.state.startup_task, _SHUTDOWN_TIMEOUT)
+    await ps.stop_all()
+    try:
+        await asyncio.wait_for(pool.close(), _SHUTDOWN_TIMEOUT)
+    except TimeoutError:
+        logger.warning("Closing LLM clients timed out")
+    await app.state.http_client.aclose()
+
+
+async def _init_database(config: Settings) -> bool:
+    """Connect the database and seed enzymes; False when unavailable."""
+    try:
+        from hive.db import init_db
+
+        ready = await init_db(config.database)
+    except Exception as e:
+        logger.warning("Database init skipped: %s", e)
+        return False
 
+    # --- Bootstrap enzymes ---
+    if ready:
         try:
-            await dep_registry.setup_all()
+            from hive.db import session as db
+            from hive.libs.enzymes import bootstrap_enzymes
+
+            async with db.async_session_factory() as session:
+                await bootstrap_enzymes(session)
+                await session.commit()
         except Exception as e:
-            logger.warning("Dep setup failed: %s", e)
+            logger.warning("Enzyme bootstrap failed: %s", e)
+    return ready
 
-        await ps.start("watcher")
 
-    yield
+async def _check_llm(pool: ModelPool) -> None:
+    """Log whether the default model answers (never raises)."""
+    default_client = pool.get(pool.default_id) if pool.default_id else None
+    if not default_client:
+        return
+    try:
+        if await default_client.health():
+            logger.info("LLM connected: %s", pool.default_id)
+        else:
+            logger.warning("Default LLM not available: %s", pool.default_id)
+    except Exception:
+        logger.warning("Default LLM not available: %s", pool.default_id)
 
-    # --- Shutdown ---
-    await ps.stop_all()
+
+async def _initial_index(ps, dep_registry: DepRegistry) -> dict[str, bool]:
+    """Initial scan, then dep setup (indexes built from scanned data), then watcher.
+
+    Returns the setup_all() results, which /api/status reports once done.
+    """
+    setup: dict[str, bool] = {}
+    try:
+        await ps.start("scan")
+        # Wait for scan to finish
+        task = ps._tasks.get("scan")
+        if task:
+            await task
+    except Exception as e:
+        logger.warning("Initial scan failed: %s", e)
+
+    try:
+        setup = await dep_registry.setup_all()
+    except Exception as e:
+        logger.warning("Dep setup failed: %s", e)
+
+    await ps.start("watcher")
+    return setup
+
+
+def _log_startup_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning("Startup indexing failed: %s", exc)
 
 
 def create_app(config: Settings) -> FastAPI:
@@ -153,6 +222,7 @@ def create_app(config: Settings) -> FastAPI:
         title="Hive Browser",
         description="Lab sequence search platform",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     app.state.config = config
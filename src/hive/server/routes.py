@@ -1,10 +1,14 @@
 """REST API endpoints."""
 
 import logging
+import time
+from functools import cache
+from urllib.parse import urlsplit
 
+import httpx
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
-from sqlalchemy import func, select
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import select
 
 from hive.context.collections import (
     create_collection,
@@ -19,8 +23,9 @@ from hive.context.skills import (
     update_skill,
     validate_skill_content,
 )
-from hive.db import Enzyme, IndexedFile, Part, PartInstance, Sequence
+from hive.db import Enzyme, Part, PartInstance
 from hive.db import session as db
+from hive.db.counts import index_counts
 from hive.users import (
     create_user,
     get_user_by_slug,
@@ -28,6 +33,7 @@ from hive.users import (
     list_users,
     validate_username,
 )
+from hive.utils import json_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -129,7 +135,7 @@ async def list_chats(request: Request):
     if not storage:
         return []
     slug = await _get_user_slug(request)
-    return storage.list_chats(slug)
+    return await storage.alist_chats(slug)
 
 
 @router.get("/chats/{chat_id}")
@@ -138,7 +144,7 @@ async def get_chat(chat_id: str, request: Request):
     if not storage:
         return {"error": "Chat storage not available"}
     slug = await _get_user_slug(request)
-    data = storage.load(chat_id, slug)
+    data = await storage.aload(chat_id, slug)
     if not data:
         return {"error": "Chat not found"}
     return data
@@ -150,7 +156,7 @@ async def delete_chat(chat_id: str, request: Request):
     if not storage:
         return {"error": "Chat storage not available"}
     slug = await _get_user_slug(request)
-    deleted = storage.delete(chat_id, slug)
+    deleted = await storage.adelete(chat_id, slug)
     return {"deleted": deleted}
 
 
@@ -166,32 +172,58 @@ async def list_models(request: Request):
     )
 
     discovered = []
-    if config and config.llm.auto_discover and pool:
+    client = getattr(request.app.state, "http_client", None)
+    if config and config.llm.auto_discover and pool and client:
         ollama_base = next((m.base_url for m in pool.entries() if m.provider == "ollama"), None)
         if ollama_base:
-            discovered = await _discover_ollama(ollama_base, configured)
+            discovered = await _discover_ollama(client, ollama_base, configured)
 
     return {"configured": configured, "ollama": discovered}
 
 
-async def _discover_ollama(base_url: str, configured: list[dict]) -> list[dict]:
+_OLLAMA_TTL = 30.0
+# base_url -> (fetched at, model names) -- the installed model list rarely changes
+_ollama_cache: dict[str, tuple[float, list[str]]] = {}
+
+
+@cache
+def _ollama_tags_url(base_url: str) -> str | None:
+    """Native /api/tags URL for an OpenAI-compatible Ollama base URL."""
+    parts = urlsplit(base_url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return base_url.rstrip("/").removesuffix("/v1").rstrip("/") + "/api/tags"
+
+
+async def _discover_ollama(
+    client: httpx.AsyncClient, base_url: str, configured: list[dict]
+) -> list[dict]:
     """Fetch available models from Ollama API, excluding already-configured ones."""
-    import httpx
+    now = time.monotonic()
+    hit = _ollama_cache.get(base_url)
+    if hit is not None and now - hit[0] < _OLLAMA_TTL:
+        names = hit[1]
+    else:
+        url = _ollama_tags_url(base_url)
+        if url is None:
+            logger.warning("Ollama discovery skipped: invalid base URL %r", base_url)
+            return []
+        try:
+            resp = await client.get(url)
+            if resp.status_code != 200:
+                return []
+            names = [m["name"] for m in resp.json().get("models", [])]
+        except Exception as e:
+            logger.warning("Ollama discovery failed: %s", e)
+            return []
+        _ollama_cache[base_url] = (now, names)
 
-    url = base_url.rstrip("/v1").rstrip("/") + "/api/tags"
     configured_ids = {m["id"] for m in configured}
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(url)
-            if resp.status_code == 200:
-                return [
-                    {"id": f"ollama/{m['name']}", "provider": "ollama", "model": m["name"]}
-                    for m in resp.json().get("models", [])
-                    if f"ollama/{m['name']}" not in configured_ids
-                ]
-    except Exception as e:
-        logger.warning("Ollama discovery failed: %s", e)
-    return []
+    return [
+        {"id": f"ollama/{name}", "provider": "ollama", "model": name}
+        for name in names
+        if f"ollama/{name}" not in configured_ids
+    ]
 
 
 # -- Collections -------------------------------------------
@@ -420,11 +452,11 @@ async def list_primer_parts():
 
 @router.get("/tools")
 async def list_tools(request: Request):
-    """List all tools with schemas."""
+    """List all tools with schemas (pre-encoded, reused until tools change)."""
     registry = getattr(request.app.state, "tool_registry", None)
     if not registry:
         return []
-    return [t.api_schema() for t in registry.tools()]
+    return Response(registry.api_schemas_json(), media_type="application/json")
 
 
 @router.get("/tools/{tool_name}/schema")
@@ -439,14 +471,18 @@ async def tool_schema(tool_name: str, request: Request):
 
 @router.post("/tools/{tool_name}")
 async def execute_tool(tool_name: str, request: Request):
-    """Execute a tool by name with JSON params."""
+    """Execute a tool by name with JSON params.
+
+    Results (a profile carries every feature, primer and cut site) are encoded
+    in one json_bytes pass rather than walked by FastAPI's jsonable_encoder.
+    """
     registry = getattr(request.app.state, "tool_registry", None)
     tool = registry.get(tool_name) if registry else None
     if not tool:
         return JSONResponse({"error": f"Unknown tool: {tool_name}"}, status_code=404)
     params = await request.json()
     result = await tool.execute(params)
-    return result
+    return Response(json_bytes(result, default=str), media_type="application/json")
 
 
 @router.get("/health")
@@ -456,7 +492,7 @@ async def health():
     if db.async_session_factory:
         try:
             async with db.async_session_factory() as s:
-                await s.execute(select(func.count()).select_from(IndexedFile))
+                await s.execute(select(1))  # connectivity only -- no table scan
             db_ok = True
         except Exception:
             pass
@@ -467,44 +503,40 @@ async def health():
     }
 
 
+_STATUS_COUNTS = ("indexed_files", "sequences", "parts", "part_instances")
+
+
+def _startup_state(app) -> dict:
+    """Background startup indexing: whether it is still running and dep readiness."""
+    task = getattr(app.state, "startup_task", None)
+    if task is None or not task.done():
+        return {"indexing": task is not None, "blast_index_ready": False}
+    setup = {} if task.cancelled() or task.exception() else task.result()
+    return {"indexing": False, "blast_index_ready": setup.get("blast", False)}
+
+
 @router.get("/status")
-async def status():
-    """System status -- indexed files, DB health, LLM status."""
+async def status(request: Request):
+    """System status -- indexed files, DB health, LLM status, startup indexing."""
+    startup = _startup_state(request.app)
+    empty = {
+        "indexed_files": 0,
+        "sequences": 0,
+        "parts": 0,
+        "part_instances": 0,
+        "database": False,
+        **startup,
+    }
     if not db.async_session_factory:
-        return {
-            "indexed_files": 0,
-            "sequences": 0,
-            "parts": 0,
-            "part_instances": 0,
-            "database": False,
-        }
+        return empty
 
     try:
-        async with db.async_session_factory() as s:
-            files = (
-                await s.execute(
-                    select(func.count())
-                    .select_from(IndexedFile)
-                    .where(IndexedFile.status == "active")
-                )
-            ).scalar()
-            seqs = (await s.execute(select(func.count()).select_from(Sequence))).scalar()
-            parts = (await s.execute(select(func.count()).select_from(Part))).scalar()
-            pis = (await s.execute(select(func.count()).select_from(PartInstance))).scalar()
-
+        counts = await index_counts()
         return {
-            "indexed_files": files,
-            "sequences": seqs,
-            "parts": parts,
-            "part_instances": pis,
+            **{key: counts[key] for key in _STATUS_COUNTS},
             "database": True,
+            **startup,
         }
     except Exception as e:
         logger.warning("Status query failed: %s", e)
-        return {
-            "indexed_files": 0,
-            "sequences": 0,
-            "parts": 0,
-            "part_instances": 0,
-            "database": False,
-        }
+        return empty
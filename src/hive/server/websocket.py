@@ -2,20 +2,19 @@
 
 import asyncio
 import contextlib
-import json
 import logging
 import re
 from datetime import UTC, datetime
 from uuid import uuid4
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from sqlalchemy import func, select
 
 from hive.context import current_user_id
-from hive.db import IndexedFile, Part, Sequence, User
 from hive.db import session as db
+from hive.db.counts import index_counts
 from hive.router import route_input
 from hive.users import create_feedback, get_user_by_token, update_preferences
+from hive.utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +58,7 @@ class ConnectionManager:
 
     async def send_json(self, conn_id: str, data: dict):
         if ws := self.active.get(conn_id):
-            await ws.send_json(data)
+            await ws.send_text(json_dumps(data))
 
     def append_history(self, conn_id: str, role: str, content: str, max_pairs: int = 20):
         history = self.histories.get(conn_id)
@@ -104,6 +103,7 @@ async def websocket_endpoint(websocket: WebSocket):
     model_pool = getattr(app.state, "model_pool", None)
     chat_storage = getattr(app.state, "chat_storage", None)
     skills = getattr(app.state, "skills", None)
+    response_cache = getattr(app.state, "response_cache", None)
     max_pairs = config.chat.max_history_pairs if config else 20
 
     # Per-connection model selection -- use user preference if valid, else default
@@ -162,7 +162,7 @@ async def websocket_endpoint(websocket: WebSocket):
             raw = await websocket.receive_text()
             if len(raw) > 512_000:  # 512 KB max
                 continue
-            data = json.loads(raw)
+            data = json_loads(raw)
 
             # Handle cancel -- abort any running processing task
             if data.get("type") == "cancel":
@@ -266,7 +266,7 @@ async def websocket_endpoint(websocket: WebSocket):
             if data.get("type") == "load_chat" and chat_storage:
                 requested_id = data.get("chatId")
                 if requested_id:
-                    saved = chat_storage.load(requested_id, user_slug)
+                    saved = await chat_storage.aload(requested_id, user_slug)
                     if saved:
                         chat["id"] = requested_id
                         chat["messages"] = saved.get("messages", [])
@@ -377,6 +377,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     skills=skills,
                     use_planner=use_planner,
                     user_id=user.id,
+                    response_cache=response_cache,
                 )
             )
 
@@ -398,6 +399,7 @@ async def _handle_message(
     skills=None,
     use_planner: bool = True,
     user_id: int | None = None,
+    response_cache=None,
 ):
     """Process a user message -- runs as a cancellable background task."""
     try:
@@ -416,6 +418,8 @@ async def _handle_message(
             on_progress=_progress,
             skills=skills,
             use_planner=use_planner,
+            fast_finish=config.llm.fast_finish if config else True,
+            response_cache=response_cache,
         )
 
         # Track user message (skip bare commands that just show a form)
@@ -500,7 +504,7 @@ async def _handle_message(
             threshold = config.chat.widget_data_threshold if config else 2048
             messages_to_save = [_strip_large_widget_data(m, threshold) for m in chat["messages"]]
 
-            chat_storage.save(
+            await chat_storage.asave(
                 chat["id"],
                 messages_to_save,
                 user_slug=user_slug,
@@ -517,12 +521,12 @@ async def _handle_message(
                 if not title:
                     title = _fallback_title(content)
                 if title:
-                    chat_storage.update_title(chat["id"], title, user_slug=user_slug)
+                    await chat_storage.aupdate_title(chat["id"], title, user_slug=user_slug)
 
             # Notify frontend (always on new chat, or when title first generated)
             if is_new or not chat.get("title_sent"):
                 chat["title_sent"] = True
-                saved_data = chat_storage.load(chat["id"], user_slug)
+                saved_data = await chat_storage.aload(chat["id"], user_slug)
                 await manager.send_json(
                     conn_id,
                     {
@@ -621,26 +625,27 @@ async def _rerun_stale_widgets(
 ):
     """Re-execute tools for stale widgets after chat load.
 
-    Iterates messages in reverse (last stale first).
+    Collects stale widgets in reverse (last stale first), then re-runs
+    them concurrently -- each tool opens its own DB session.
     max_rerun: -1 = all, 0 = none, N > 0 = last N stale widgets.
     """
     current_user_id.set(user_id)
     messages = chat.get("messages", [])
-    rerun_count = 0
+    targets = []
     for idx in range(len(messages) - 1, -1, -1):
-        if max_rerun > 0 and rerun_count >= max_rerun:
+        if max_rerun > 0 and len(targets) >= max_rerun:
             break
-        msg = messages[idx]
-        widget = msg.get("widget")
+        widget = messages[idx].get("widget")
         if not widget or not widget.get("stale"):
             continue
         tool_name = widget.get("tool")
-        params = widget.get("params", {})
         tool = registry.get(tool_name) if tool_name else None
-        if not tool:
-            continue
+        if tool:
+            targets.append((idx, widget, tool))
+
+    async def _rerun(idx: int, widget: dict, tool) -> None:
         try:
-            result = await tool.execute(params)
+            result = await tool.execute(widget.get("params", {}))
             await manager.send_json(
                 conn_id,
                 {
@@ -652,8 +657,9 @@ async def _rerun_stale_widgets(
             widget["data"] = result
             widget.pop("stale", None)
         except Exception as e:
-            logger.warning("Stale rerun %s[%d] failed: %s", tool_name, idx, e)
-        rerun_count += 1
+            logger.warning("Stale rerun %s[%d] failed: %s", tool.name, idx, e)
+
+    await asyncio.gather(*(_rerun(*t) for t in targets))
 
 
 def _strip_large_widget_data(msg: dict, threshold: int) -> dict:
@@ -664,7 +670,7 @@ def _strip_large_widget_data(msg: dict, threshold: int) -> dict:
     # Always persist sandbox report data -- can't be re-run without workspace
     if widget.get("tool") == "python":
         return msg
-    data_size = len(json.dumps(widget["data"], default=str))
+    data_size = len(json_dumps(widget["data"], default=str))
     if data_size > threshold:
         stripped = {**msg}
         stripped["widget"] = {
@@ -682,6 +688,9 @@ def _now_iso() -> str:
     return datetime.now(UTC).isoformat()
 
 
+_QUICK_STATUS_COUNTS = ("indexed_files", "sequences", "parts", "users", "last_updated")
+
+
 async def _quick_status(llm_client=None, tool_count: int = 0) -> dict:
     """Lightweight status for the status bar (no full tool execution)."""
     status = {
@@ -696,21 +705,8 @@ async def _quick_status(llm_client=None, tool_count: int = 0) -> dict:
     }
     if db.async_session_factory:
         try:
-            async with db.async_session_factory() as s:
-                status["indexed_files"] = (
-                    await s.execute(
-                        select(func.count())
-                        .select_from(IndexedFile)
-                        .where(IndexedFile.status == "active")
-                    )
-                ).scalar()
-                status["sequences"] = (
-                    await s.execute(select(func.count()).select_from(Sequence))
-                ).scalar()
-                status["parts"] = (await s.execute(select(func.count()).select_from(Part))).scalar()
-                status["users"] = (await s.execute(select(func.count()).select_from(User))).scalar()
-                last = (await s.execute(select(func.max(IndexedFile.indexed_at)))).scalar()
-                status["last_updated"] = last.isoformat() if last else None
+            counts = await index_counts()
+            status.update({key: counts[key] for key in _QUICK_STATUS_COUNTS})
             status["db_connected"] = True
         except Exception as e:
             logger.warning("Quick status DB query failed: %s", e)
@@ -5,8 +5,9 @@ from __future__ import annotations
 import inspect
 import logging
 from abc import ABC, abstractmethod
-from functools import wraps
-from typing import Any
+from functools import cache, cached_property, wraps
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
 
 logger = logging.getLogger(__name__)
 
@@ -59,20 +60,29 @@ class Tool(ABC):
         """Return JSON Schema dict for this tool's parameters.
 
         Auto-generated from self.params if set.
-        Internal tools override to use Pydantic model_json_schema().
+        Internal tools override to return model_schema(InputModel).
         """
         if self.params:
             return _params_to_schema(self.params)
         return {"type": "object", "properties": {}}
 
-    def api_schema(self) -> dict:
-        """OpenAI-format schema for REST API docs."""
+    @cached_property
+    def llm_schema(self) -> dict:
+        """OpenAI-format function schema, built once per tool instance.
+
+        Shared between callers -- treat as read-only. A tool whose schema
+        changes is re-created, which drops the cache with the instance.
+        """
         return {
             "name": self.name,
             "description": self.long_desc,
             "parameters": self.input_schema(),
         }
 
+    def api_schema(self) -> dict:
+        """OpenAI-format schema for REST API docs."""
+        return self.llm_schema
+
     @property
     def short_desc(self) -> str:
         """Short label (1-3 words). Falls back to full description for plain strings."""
@@ -100,6 +110,71 @@ class Tool(ABC):
         return None
 
 
+@cache
+def model_schema(model: type) -> dict:
+    """JSON Schema for a Pydantic input model, without the top-level title.
+
+    Generated once per model class. The returned dict is shared -- treat it
+    as read-only.
+    """
+    schema = model.model_json_schema()
+    schema.pop("title", None)
+    return schema
+
+
+_SIMPLE_TYPES = (str, int, float, bool)
+
+
+def _exact_types(annotation: Any) -> tuple[type, ...] | None:
+    """Accepted exact value types for a plain scalar or optional scalar field."""
+    if annotation in _SIMPLE_TYPES:
+        return (annotation,)
+    if get_origin(annotation) in (Union, UnionType):
+        args = get_args(annotation)
+        if len(args) == 2 and type(None) in args:
+            inner = args[0] if args[1] is type(None) else args[1]
+            if inner in _SIMPLE_TYPES:
+                return (inner, type(None))
+    return None
+
+
+@cache
+def _simple_fields(model: type) -> dict[str, tuple[type, ...]] | None:
+    """Field -> exact accepted types for models made only of (optional) scalars.
+
+    None when anything could make construction differ from validation
+    (validators, constraints, aliases, custom config, non-scalar fields).
+    """
+    decs = model.__pydantic_decorators__
+    if model.model_config or decs.field_validators or decs.model_validators or decs.validators:
+        return None
+    fields: dict[str, tuple[type, ...]] = {}
+    for name, info in model.model_fields.items():
+        types = _exact_types(info.annotation)
+        if types is None or info.metadata or info.alias:
+            return None
+        fields[name] = types
+    return fields
+
+
+def parse_input(model: type, params: dict[str, Any]) -> Any:
+    """Build a tool input model, skipping validation when it cannot matter.
+
+    If every field is a plain scalar (or ``scalar | None``) and every supplied
+    value already has exactly an accepted type, ``model_construct`` gives the
+    same result as validation without the overhead. Anything else goes
+    through the full validator (coercion, errors for missing/invalid values).
+    """
+    fields = _simple_fields(model)
+    if fields is not None and all(
+        (name in params and type(params[name]) in types)
+        or (name not in params and not model.model_fields[name].is_required())
+        for name, types in fields.items()
+    ):
+        return model.model_construct(**{k: params[k] for k in fields if k in params})
+    return model(**params)
+
+
 _JSON_TO_PY = {"string": "str", "integer": "int", "number": "float", "boolean": "bool", "array": "list", "object": "dict"}
 
 
@@ -8,6 +8,10 @@ if TYPE_CHECKING:
     from hive.tools.base import Tool
 
 from hive.tools.base import _build_signature
+from hive.utils import json_dumps
+
+# Planner-chosen tool subsets remembered by filtered()
+_MAX_FILTERED = 64
 
 
 class ToolRegistry:
@@ -15,9 +19,28 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._sig_cache: dict[bool, list[str]] = {}
+        self._help: str | None = None
+        self._meta: list[dict] | None = None
+        self._schemas_json: bytes | None = None
+        self._catalog: str | None = None
+        self._filtered: dict[tuple[str, ...], ToolRegistry] = {}
+        self._version = 0
 
     def register(self, tool: Tool):
         self._tools[tool.name] = tool
+        self._sig_cache.clear()
+        self._help = None
+        self._meta = None
+        self._schemas_json = None
+        self._catalog = None
+        self._filtered.clear()
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Bumped on every register(); keys caches derived from the tool set."""
+        return self._version
 
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
@@ -27,16 +50,39 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def filtered(self, names: list[str]) -> ToolRegistry:
-        """Return a new registry containing only the named tools."""
+        """Registry containing only the named tools.
+
+        Subsets are kept per name list until the next register(), so a repeat
+        plan reuses the subset's already-built signatures. Callers must not
+        register into the result.
+        """
+        key = tuple(names)
+        if (new := self._filtered.get(key)) is not None:
+            return new
         new = ToolRegistry()
         for name in names:
             if tool := self._tools.get(name):
                 new.register(tool)
+        if len(self._filtered) >= _MAX_FILTERED:
+            self._filtered.clear()
+        self._filtered[key] = new
         return new
 
     def metadata(self) -> list[dict]:
-        """All tool metadata for frontend init."""
-        return [t.metadata() for t in self._tools.values()]
+        """All tool metadata for frontend init.
+
+        Built once per registry state and shared by every connection -- the
+        entries are read-only.
+        """
+        if self._meta is None:
+            self._meta = [t.metadata() for t in self._tools.values()]
+        return list(self._meta)
+
+    def api_schemas_json(self) -> bytes:
+        """JSON-encoded list of every tool's api_schema() (built once per registry state)."""
+        if self._schemas_json is None:
+            self._schemas_json = json_dumps([t.api_schema() for t in self._tools.values()]).encode()
+        return self._schemas_json
 
     def signatures(self, detailed: bool = False) -> list[str]:
         """Python-style tool signatures for LLM context.
@@ -44,7 +90,11 @@ class ToolRegistry:
         When detailed=False (workspace):
             ``def search(query: str, tags: str | None = None) -> dict  # fuzzy search``
         When detailed=True (planner catalog): adds indented param descriptions.
+        Built once per registry state; callers get a fresh list they may extend.
         """
+        cached = self._sig_cache.get(detailed)
+        if cached is not None:
+            return list(cached)
         lines = []
         for tool in self._tools.values():
             sig, descs = _build_signature(tool)
@@ -52,4 +102,23 @@ class ToolRegistry:
             if detailed:
                 for d in descs:
                     lines.append(f"  {d}")
-        return lines
+        self._sig_cache[detailed] = lines
+        return list(lines)
+
+    def catalog(self) -> str:
+        """Detailed signatures as a bulleted list, for the planner prompt."""
+        if self._catalog is None:
+            self._catalog = "\n".join(f"- {s}" for s in self.signatures(detailed=True))
+        return self._catalog
+
+    def help_text(self) -> str:
+        """Markdown command list for /help (rebuilt only after register())."""
+        if self._help is None:
+            lines = ["**Available commands:**\n"]
+            for tool in self._tools.values():
+                lines.append(f"- **/{tool.name}** -- {tool.long_desc}")
+            lines.append(
+                "\nPrefix with `//` for direct execution (no LLM), e.g. `//search ampicillin`."
+            )
+            self._help = "\n".join(lines)
+        return self._help
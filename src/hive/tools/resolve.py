@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from functools import cache
+
+from sqlalchemy import Select, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,32 +16,26 @@ from hive.db import (
     Sequence,
 )
 
+# One pass: uppercase ASCII letters and drop whitespace
+_CLEAN_TABLE = str.maketrans(
+    {c: None for c in " \t\r\n"} | {c: c.upper() for c in "abcdefghijklmnopqrstuvwxyz"}
+)
 
-async def resolve_sequence(
-    session: AsyncSession,
-    *,
-    sid: int | None = None,
-    name: str | None = None,
-    load_parts: bool = False,
-    load_file: bool = False,
-) -> Sequence | None:
-    """Resolve a sequence by SID (primary) or exact name (fallback).
 
-    Only returns sequences from active (non-deleted) indexed files.
+@cache
+def _sequence_stmt(by_sid: bool, load_parts: bool, load_file: bool) -> Select:
+    """Sequence lookup for one combination of flags, keyed on the "key" bind.
+
+    Built once and reused: the statement object memoizes its SQL cache key, so
+    repeat lookups skip both construction and the compiled-cache traversal.
     """
+    key = bindparam("key")
     stmt = (
         select(Sequence)
         .join(IndexedFile, Sequence.file_id == IndexedFile.id)
         .where(IndexedFile.status == "active")
+        .where(Sequence.id == key if by_sid else func.lower(Sequence.name) == func.lower(key))
     )
-
-    if sid is not None:
-        stmt = stmt.where(Sequence.id == sid)
-    elif name:
-        stmt = stmt.where(func.lower(Sequence.name) == func.lower(name))
-    else:
-        return None
-
     if load_parts:
         stmt = stmt.options(
             selectinload(Sequence.part_instances)
@@ -48,8 +44,49 @@ async def resolve_sequence(
         )
     if load_file:
         stmt = stmt.options(selectinload(Sequence.file))
+    return stmt.order_by(Sequence.id).limit(1)
+
+
+@cache
+def _part_stmt(
+    load_names: bool, load_instances: bool, load_annotations: bool, load_libraries: bool
+) -> Select:
+    """Part lookup by the "pid" bind for one combination of eager loads."""
+    stmt = select(Part).where(Part.id == bindparam("pid"))
+    if load_names:
+        stmt = stmt.options(selectinload(Part.names))
+    if load_instances:
+        stmt = stmt.options(
+            selectinload(Part.instances)
+            .selectinload(PartInstance.sequence)
+            .selectinload(Sequence.file)
+        )
+    if load_annotations:
+        stmt = stmt.options(selectinload(Part.annotations))
+    if load_libraries:
+        stmt = stmt.options(selectinload(Part.library_members).selectinload(LibraryMember.library))
+    return stmt
+
+
+async def resolve_sequence(
+    session: AsyncSession,
+    *,
+    sid: int | None = None,
+    name: str | None = None,
+    load_parts: bool = False,
+    load_file: bool = False,
+) -> Sequence | None:
+    """Resolve a sequence by SID (primary) or exact name (fallback).
 
-    return (await session.execute(stmt.order_by(Sequence.id).limit(1))).scalar_one_or_none()
+    Only returns sequences from active (non-deleted) indexed files.
+    """
+    if sid is not None:
+        stmt, key = _sequence_stmt(True, load_parts, load_file), sid
+    elif name:
+        stmt, key = _sequence_stmt(False, load_parts, load_file), name
+    else:
+        return None
+    return (await session.execute(stmt, {"key": key})).scalar_one_or_none()
 
 
 async def resolve_part(
@@ -66,22 +103,8 @@ async def resolve_part(
     Instances chain: Part.instances -> PartInstance.sequence -> Sequence.file.
     Libraries chain: Part.library_members -> LibraryMember.library.
     """
-    stmt = select(Part).where(Part.id == pid)
-
-    if load_names:
-        stmt = stmt.options(selectinload(Part.names))
-    if load_instances:
-        stmt = stmt.options(
-            selectinload(Part.instances)
-            .selectinload(PartInstance.sequence)
-            .selectinload(Sequence.file)
-        )
-    if load_annotations:
-        stmt = stmt.options(selectinload(Part.annotations))
-    if load_libraries:
-        stmt = stmt.options(selectinload(Part.library_members).selectinload(LibraryMember.library))
-
-    return (await session.execute(stmt)).scalar_one_or_none()
+    stmt = _part_stmt(load_names, load_instances, load_annotations, load_libraries)
+    return (await session.execute(stmt, {"pid": pid})).scalar_one_or_none()
 
 
 async def resolve_and_clean(raw: str) -> tuple[str, dict] | dict:
@@ -96,7 +119,7 @@ async def resolve_and_clean(raw: str) -> tuple[str, dict] | dict:
                 seq, meta = await resolve_input(session, seq)
             except ValueError as exc:
                 return {"error": str(exc)}
-    cleaned = seq.upper().replace(" ", "").replace("\n", "")
+    cleaned = seq.translate(_CLEAN_TABLE)
     if len(cleaned) < 1:
         return {"error": "Empty sequence"}
     return cleaned, meta
@@ -8,7 +8,7 @@ from typing import Any
 from pydantic import BaseModel, Field, field_validator
 
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_part, resolve_sequence
 
 
@@ -50,15 +50,13 @@ class AlignTool(Tool):
     advanced = {"algorithm"}
 
     def input_schema(self) -> dict:
-        schema = AlignInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(AlignInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         if not self._dep:
             return {"error": "MAFFT not configured"}
 
-        inp = AlignInput(**params)
+        inp = parse_input(AlignInput, params)
         total = len(inp.sids) + len(inp.pids)
 
         if total < 2:
@@ -13,7 +13,7 @@ from hive.config import display_file_path
 from hive.db import IndexedFile, Sequence
 from hive.db import session as db
 from hive.deps import BlastDep
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema
 from hive.tools.resolve import resolve_input
 
 logger = logging.getLogger(__name__)
@@ -92,9 +92,7 @@ class BlastTool(Tool):
         self._default_max_hits = config.deps.blast.default_max_hits
 
     def input_schema(self) -> dict:
-        schema = BlastInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(BlastInput)
 
     async def execute(
         self,
@@ -7,7 +7,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from hive.molbio.codon import codon_usage, rare_codons
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 
@@ -29,12 +29,10 @@ class CodonUsageTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = CodonUsageInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(CodonUsageInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = CodonUsageInput(**params)
+        inp = parse_input(CodonUsageInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
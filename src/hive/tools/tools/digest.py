@@ -8,7 +8,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 # NEB 1kb+ DNA Ladder -- (size_bp, relative_intensity)
@@ -105,12 +105,10 @@ class DigestTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = DigestInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(DigestInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = DigestInput(**params)
+        inp = parse_input(DigestInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
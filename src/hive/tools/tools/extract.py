@@ -11,7 +11,7 @@ from sqlalchemy.orm import selectinload
 from hive.molbio.seq import reverse_complement
 from hive.db import Part, PartInstance, PartName
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_sequence
 
 
@@ -34,12 +34,10 @@ class ExtractTool(Tool):
     advanced = {"sequence_name", "primer_name"}
 
     def input_schema(self) -> dict:
-        schema = ExtractInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(ExtractInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = ExtractInput(**params)
+        inp = parse_input(ExtractInput, params)
 
         if inp.sid is None and not inp.sequence_name:
             return {"error": "Provide either sid or sequence_name"}
@@ -148,14 +146,24 @@ async def _find_part_instance(
     name: str,
     annotation_type: str | None = None,
 ) -> PartInstance | None:
-    """Find a PartInstance by part name on a given sequence."""
-    # Subquery: part_ids whose names match
-    name_sub = select(PartName.part_id).where(PartName.name.ilike(f"%{name}%")).subquery()
+    """Find a PartInstance by part name on a given sequence.
+
+    Name checks are correlated EXISTS probes: the plan starts from this
+    sequence's instances (idx_pi_seq_start) and looks names up by part_id
+    (uq_part_name_source), instead of ILIKE-scanning every part name.
+    """
+    def name_matches(pattern: str):
+        return (
+            select(PartName.id)
+            .where(PartName.part_id == PartInstance.part_id, PartName.name.ilike(pattern))
+            .exists()
+        )
+
     query = (
         select(PartInstance)
         .options(selectinload(PartInstance.part).selectinload(Part.names))
         .where(PartInstance.seq_id == seq_id)
-        .where(PartInstance.part_id.in_(select(name_sub)))
+        .where(name_matches(f"%{name}%"))
     )
     if annotation_type:
         query = query.where(PartInstance.annotation_type == annotation_type)
@@ -164,13 +172,7 @@ async def _find_part_instance(
 
     # Prefer exact match, then longest
     query = query.order_by(
-        case(
-            (
-                PartInstance.part_id.in_(select(PartName.part_id).where(PartName.name.ilike(name))),
-                0,
-            ),
-            else_=1,
-        ),
+        case((name_matches(name), 0), else_=1),
         (PartInstance.end - PartInstance.start).desc(),
     ).limit(1)
 
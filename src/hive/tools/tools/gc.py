@@ -6,7 +6,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 
@@ -26,12 +26,10 @@ class GCTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = GCInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(GCInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = GCInput(**params)
+        inp = parse_input(GCInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
@@ -10,7 +10,7 @@ from sqlalchemy import select
 
 from hive.db import CloningStep
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_sequence
 
 logger = logging.getLogger(__name__)
@@ -32,12 +32,10 @@ class HistoryTool(Tool):
     advanced = {"name"}
 
     def input_schema(self) -> dict:
-        schema = HistoryInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(HistoryInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = HistoryInput(**params)
+        inp = parse_input(HistoryInput, params)
 
         if inp.sid is None and not inp.name:
             return {"error": "Provide either sid or name"}
@@ -7,7 +7,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from hive.molbio.orf import find_orfs
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 
@@ -29,12 +29,10 @@ class OrfFindTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = OrfFindInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(OrfFindInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = OrfFindInput(**params)
+        inp = parse_input(OrfFindInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
@@ -12,7 +12,7 @@ from sqlalchemy.orm import selectinload
 from hive.config import display_file_path
 from hive.db import Part, PartInstance
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema
 from hive.tools.resolve import resolve_part, resolve_sequence
 
 logger = logging.getLogger(__name__)
@@ -42,9 +42,7 @@ class PartsTool(Tool):
     advanced = {"find_relatives"}
 
     def input_schema(self) -> dict:
-        schema = PartsInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(PartsInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         inp = PartsInput(**{k: v for k, v in params.items() if v is not None})
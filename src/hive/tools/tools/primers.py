@@ -10,7 +10,7 @@ from pydantic import BaseModel, Field
 from hive.context import current_user_id
 from hive.db import session as db
 from hive.molbio.classify import analyze_primer
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import dedup_primers, resolve_input, resolve_sequence
 
 logger = logging.getLogger(__name__)
@@ -32,12 +32,10 @@ class PrimersTool(Tool):
     advanced = {"circular"}
 
     def input_schema(self) -> dict:
-        schema = PrimersInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(PrimersInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = PrimersInput(**params)
+        inp = parse_input(PrimersInput, params)
 
         if not db.async_session_factory:
             return {"error": "Database unavailable"}
@@ -11,12 +11,44 @@ from hive.config import display_file_path
 from hive.context import current_user_id
 from hive.db import session as db
 from hive.molbio.classify import analyze_primer
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import dedup_primers, resolve_sequence
 
 logger = logging.getLogger(__name__)
 
 
+def _part_dict(pi) -> dict[str, Any]:
+    """One part instance with its part's pid, names and sequence."""
+    part = pi.part
+    names = [n.name for n in part.names]
+    return {
+        "pid": part.id,
+        "names": names,
+        "name": names[0] if names else "",
+        "annotation_type": pi.annotation_type,
+        "start": pi.start,
+        "end": pi.end,
+        "strand": pi.strand,
+        "length": part.length,
+        "sequence": part.sequence,
+        "molecule": part.molecule,
+        "qualifiers": pi.qualifiers,
+    }
+
+
+def _feature_dict(p: dict[str, Any]) -> dict[str, Any]:
+    """Viewer feature from a _part_dict entry."""
+    return {
+        "pid": p["pid"],
+        "name": p["name"],
+        "type": p["annotation_type"],
+        "start": p["start"],
+        "end": p["end"],
+        "strand": p["strand"],
+        "qualifiers": p["qualifiers"],
+    }
+
+
 class ProfileInput(BaseModel):
     sid: int | None = Field(default=None, description="Sequence ID (preferred)")
     name: str | None = Field(default=None, description="Sequence name (fallback)")
@@ -36,13 +68,11 @@ class ProfileTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = ProfileInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(ProfileInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         """Fetch complete sequence profile from the database."""
-        inp = ProfileInput(**params)
+        inp = parse_input(ProfileInput, params)
 
         if inp.sid is None and not inp.name:
             return {"error": "Provide either sid or name"}
@@ -63,22 +93,7 @@ class ProfileTool(Tool):
                 return {"error": f"Sequence not found: {inp.sid or inp.name}"}
 
             # Build parts list with pid and names
-            parts_list = [
-                {
-                    "pid": pi.part.id,
-                    "names": [n.name for n in pi.part.names],
-                    "name": pi.part.names[0].name if pi.part.names else "",
-                    "annotation_type": pi.annotation_type,
-                    "start": pi.start,
-                    "end": pi.end,
-                    "strand": pi.strand,
-                    "length": pi.part.length,
-                    "sequence": pi.part.sequence,
-                    "molecule": pi.part.molecule,
-                    "qualifiers": pi.qualifiers,
-                }
-                for pi in seq.part_instances
-            ]
+            parts_list = list(map(_part_dict, seq.part_instances))
 
             circular = seq.topology == "circular"
 
@@ -247,17 +262,7 @@ class ProfileTool(Tool):
                     "sequence_data": seq.sequence,
                 },
                 "features": [
-                    {
-                        "pid": p["pid"],
-                        "name": p["name"],
-                        "type": p["annotation_type"],
-                        "start": p["start"],
-                        "end": p["end"],
-                        "strand": p["strand"],
-                        "qualifiers": p["qualifiers"],
-                    }
-                    for p in parts_list
-                    if p["annotation_type"] != "primer_bind"
+                    _feature_dict(p) for p in parts_list if p["annotation_type"] != "primer_bind"
                 ],
                 "translations": translations,
                 "primers": primers,
@@ -17,7 +17,7 @@ from hive.molbio.protein import (
     molecular_weight,
 )
 from hive.molbio.seq import translate as seq_translate
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 _DNA_RE = re.compile(r"^[ACGTUN]+$", re.IGNORECASE)
@@ -41,12 +41,10 @@ class ProtparamTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = ProtparamInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(ProtparamInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = ProtparamInput(**params)
+        inp = parse_input(ProtparamInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
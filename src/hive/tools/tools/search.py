@@ -17,7 +17,7 @@ from sqlalchemy.orm import selectinload
 from hive.config import display_file_path
 from hive.db import IndexedFile, Part, PartInstance, PartName, Sequence
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,24 @@ def _parse_bool_query(query: str) -> tuple[list[str], str]:
     return [query.strip()], "single"
 
 
+_TOPOLOGIES = frozenset({"circular", "linear"})
+
+
+def _hoist_topology(terms: list[str], op: str) -> tuple[list[str], str | None]:
+    """Pull "circular"/"linear" terms out of an AND/single query.
+
+    Topology is not part of the BM25 search text, so these terms become an
+    exact filter on Sequence.topology instead. OR queries and contradictory
+    terms ("circular && linear") are left untouched.
+    """
+    if op == "or":
+        return terms, None
+    topo = {t.lower() for t in terms if t.lower() in _TOPOLOGIES}
+    if len(topo) != 1:
+        return terms, None
+    return [t for t in terms if t.lower() not in _TOPOLOGIES], topo.pop()
+
+
 def _bm25_query(terms: list[str], op: str) -> str:
     """Build a ParadeDB query string from parsed terms and operator.
 
@@ -74,6 +92,30 @@ class SearchResultItem(BaseModel):
     score: float
 
 
+def _result_item(seq: Sequence, file_path: str, score: float) -> dict[str, Any]:
+    """One search hit in the SearchResultItem shape.
+
+    Built as a plain dict -- the values come straight from typed ORM columns,
+    so validating and dumping a model per row only adds overhead on large
+    listings (``*`` returns every sequence).
+    """
+    meta = seq.meta or {}
+    return {
+        "sid": seq.id,
+        "name": seq.name,
+        "size_bp": seq.length,
+        "topology": seq.topology,
+        # First name per part, shown as the sequence's "features"
+        "features": [
+            pi.part.names[0].name for pi in seq.part_instances if pi.part and pi.part.names
+        ],
+        "tags": meta.get("tags", []),
+        "has_history": seq.has_history,
+        "file_path": display_file_path(file_path),
+        "score": score,
+    }
+
+
 class SearchTool(Tool):
     name = "search"
     description = (
@@ -87,16 +129,14 @@ class SearchTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = SearchInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(SearchInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         """Execute search with ParadeDB BM25 full-text search.
 
         Supports boolean queries: "KanR && circular" (AND), "GFP || RFP" (OR).
         """
-        inp = SearchInput(**params)
+        inp = parse_input(SearchInput, params)
 
         if not db.async_session_factory:
             return {"results": [], "total": 0, "query": inp.query, "error": "Database unavailable"}
@@ -106,6 +146,15 @@ class SearchTool(Tool):
             return await self._execute_all(inp)
 
         terms, op = _parse_bool_query(inp.query)
+        terms, topology = _hoist_topology(terms, op)
+        if topology:
+            if inp.filters.get("topology", topology) != topology:
+                return {"results": [], "total": 0, "parts": [], "parts_total": 0,
+                        "query": inp.query}
+            inp = inp.model_copy(update={"filters": {**inp.filters, "topology": topology}})
+            if not terms:
+                return await self._execute_all(inp)
+            op = "and" if len(terms) > 1 else "single"
         bm25_q = _bm25_query(terms, op)
 
         # Choose BM25 operator: &&& (conjunction) for AND, ||| (disjunction) for OR/single
@@ -148,27 +197,10 @@ class SearchTool(Tool):
 
                 rows = (await session.execute(stmt)).all()
 
-                results = []
-                for seq, score, file_path in rows:
-                    # Collect part names (first name per part) as "features" for display
-                    part_names = []
-                    for pi in seq.part_instances:
-                        if pi.part and pi.part.names:
-                            part_names.append(pi.part.names[0].name)
-                    meta = seq.meta or {}
-                    results.append(
-                        SearchResultItem(
-                            sid=seq.id,
-                            name=seq.name,
-                            size_bp=seq.length,
-                            topology=seq.topology,
-                            features=part_names,
-                            tags=meta.get("tags", []),
-                            has_history=seq.has_history,
-                            file_path=display_file_path(file_path),
-                            score=round(float(score), 3),
-                        ).model_dump()
-                    )
+                results = [
+                    _result_item(seq, file_path, round(float(score), 3))
+                    for seq, score, file_path in rows
+                ]
 
                 # --- Part-level search ---
                 parts = await _search_parts(session, bm25_q)
@@ -215,26 +247,7 @@ class SearchTool(Tool):
 
             rows = (await session.execute(stmt)).all()
 
-            results = []
-            for seq, file_path in rows:
-                part_names = []
-                for pi in seq.part_instances:
-                    if pi.part and pi.part.names:
-                        part_names.append(pi.part.names[0].name)
-                meta = seq.meta or {}
-                results.append(
-                    SearchResultItem(
-                        sid=seq.id,
-                        name=seq.name,
-                        size_bp=seq.length,
-                        topology=seq.topology,
-                        features=part_names,
-                        tags=meta.get("tags", []),
-                        has_history=seq.has_history,
-                        file_path=display_file_path(file_path),
-                        score=1.0,
-                    ).model_dump()
-                )
+            results = [_result_item(seq, file_path, 1.0) for seq, file_path in rows]
 
         return {
             "results": results,
@@ -246,48 +259,40 @@ class SearchTool(Tool):
 
 
 async def _search_parts(session: Any, bm25_q: str) -> list[dict]:
-    """Search parts by name using ParadeDB BM25 on part_names."""
-    try:
-        score_expr = literal_column("pdb.score(part_names.id)")
-
-        # BM25 search on part_names (disjunction -- any term matches)
-        pn_stmt = (
-            select(
-                PartName.part_id,
-                func.max(score_expr).label("score"),
-            )
-            .where(text("part_names.name ||| :bm25_q").bindparams(bindparam("bm25_q", value=bm25_q)))
-            .group_by(PartName.part_id)
-            .order_by(desc("score"))
-        )
-        rows = (await session.execute(pn_stmt)).all()
-    except DatabaseError as e:
-        logger.warning("Part search failed: %s", e)
-        return []
-
-    if not rows:
-        return []
+    """Search parts by name using ParadeDB BM25 on part_names.
 
-    part_ids = [r[0] for r in rows]
-    score_map = {r[0]: round(float(r[1]), 2) for r in rows}
+    Best score per part is aggregated in a subquery and joined straight to
+    Part, so matching parts come back in one round trip (plus eager loads).
+    """
+    score_expr = literal_column("pdb.score(part_names.id)")
 
-    parts_stmt = (
-        select(Part)
-        .where(Part.id.in_(part_ids))
+    # BM25 search on part_names (disjunction -- any term matches)
+    scores = (
+        select(
+            PartName.part_id,
+            func.max(score_expr).label("score"),
+        )
+        .where(text("part_names.name ||| :bm25_q").bindparams(bindparam("bm25_q", value=bm25_q)))
+        .group_by(PartName.part_id)
+        .subquery("part_scores")
+    )
+    stmt = (
+        select(Part, scores.c.score)
+        .join(scores, Part.id == scores.c.part_id)
         .options(
             selectinload(Part.names),
             selectinload(Part.instances),
         )
+        .order_by(desc(scores.c.score))
     )
-    parts = (await session.execute(parts_stmt)).scalars().all()
+    try:
+        rows = (await session.execute(stmt)).all()
+    except DatabaseError as e:
+        logger.warning("Part search failed: %s", e)
+        return []
 
-    # Build result dicts preserving score order
-    part_map = {p.id: p for p in parts}
     result = []
-    for pid in part_ids:
-        part = part_map.get(pid)
-        if not part:
-            continue
+    for part, score in rows:
         types = list({pi.annotation_type for pi in part.instances if pi.annotation_type})
         result.append(
             {
@@ -297,7 +302,7 @@ async def _search_parts(session: Any, bm25_q: str) -> list[dict]:
                 "length": part.length,
                 "instance_count": len(part.instances),
                 "types": types,
-                "score": score_map[pid],
+                "score": round(float(score), 2),
             }
         )
 
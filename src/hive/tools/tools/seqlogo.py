@@ -9,7 +9,7 @@ from typing import Any
 from pydantic import BaseModel, Field, field_validator
 
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_part, resolve_sequence
 
 
@@ -81,12 +81,10 @@ class SeqLogoTool(Tool):
                 pass
 
     def input_schema(self) -> dict:
-        schema = SeqLogoInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(SeqLogoInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = SeqLogoInput(**params)
+        inp = parse_input(SeqLogoInput, params)
         total = len(inp.sids) + len(inp.pids)
 
         if total < 2:
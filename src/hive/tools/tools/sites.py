@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 
 from hive.context import current_user_id
 from hive.db import session as db
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 
@@ -38,12 +38,10 @@ class SitesTool(Tool):
     advanced = {"circular"}
 
     def input_schema(self) -> dict:
-        schema = SitesInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(SitesInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = SitesInput(**params)
+        inp = parse_input(SitesInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
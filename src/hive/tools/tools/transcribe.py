@@ -7,7 +7,7 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from hive.molbio.seq import transcribe as seq_transcribe
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 
@@ -27,12 +27,10 @@ class TranscribeTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = TranscribeInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(TranscribeInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = TranscribeInput(**params)
+        inp = parse_input(TranscribeInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
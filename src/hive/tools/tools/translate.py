@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from hive.molbio.seq import translate as seq_translate
-from hive.tools.base import Tool
+from hive.tools.base import Tool, model_schema, parse_input
 from hive.tools.resolve import resolve_and_clean
 
 
+@lru_cache(maxsize=128)
+def _translate_cached(cleaned: str, table: int) -> str:
+    """Translate with a small memo -- LLM retries often resend the same sequence."""
+    return seq_translate(cleaned, table=table)
+
+
 class TranslateInput(BaseModel):
     sequence: str = Field(
         ...,
@@ -29,12 +37,10 @@ class TranslateTool(Tool):
         pass
 
     def input_schema(self) -> dict:
-        schema = TranslateInput.model_json_schema()
-        schema.pop("title", None)
-        return schema
+        return model_schema(TranslateInput)
 
     async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
-        inp = TranslateInput(**params)
+        inp = parse_input(TranslateInput, params)
         result = await resolve_and_clean(inp.sequence)
         if isinstance(result, dict):
             return result
@@ -47,7 +53,8 @@ class TranslateTool(Tool):
         if len(cleaned) < 3:
             return {"error": "Sequence too short to translate (need at least 3 nucleotides)"}
 
-        protein = seq_translate(cleaned, table=inp.table)
+        # Per-codon loop is CPU-bound -- keep it off the event loop
+        protein = await asyncio.to_thread(_translate_cached, cleaned, inp.table)
 
         stops = protein.count("*")
         return {
@@ -10,11 +10,12 @@ from hive.db import Feedback, User
 
 _USERNAME_RE = re.compile(r"^[a-zA-Z0-9\-_ ]+$")
 _MAX_USERNAME_LEN = 50
+_SLUG_TABLE = str.maketrans("", "", "-_ ")
 
 
 def make_slug(username: str) -> str:
     """Convert display name to slug: strip hyphens/underscores/spaces, lowercase."""
-    return re.sub(r"[\-_ ]", "", username).lower()
+    return username.translate(_SLUG_TABLE).lower()
 
 
 def validate_username(username: str) -> bool:
@@ -36,14 +37,22 @@ async def create_user(session: AsyncSession, username: str) -> User:
     if not slug:
         raise ValueError("Username must contain at least one alphanumeric character")
 
-    existing = (await session.execute(select(User).where(User.slug == slug))).scalar_one_or_none()
-    if existing:
+    # Single atomic statement: a concurrent signup for the same slug cannot
+    # slip in between an existence check and the insert
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    stmt = (
+        insert(User)
+        .values(username=username, slug=slug, token=secrets.token_urlsafe(32), preferences={})
+        .on_conflict_do_nothing(index_elements=["slug"])
+        .returning(User)
+    )
+    user = (await session.execute(stmt)).scalar_one_or_none()
+    if user is None:
         raise ValueError(f"Username already taken (slug: {slug})")
-
-    token = secrets.token_urlsafe(32)
-    user = User(username=username, slug=slug, token=token, preferences={})
-    session.add(user)
-    await session.flush()
     return user
 
 
@@ -58,8 +67,10 @@ async def get_user_by_slug(session: AsyncSession, slug: str) -> User | None:
 
 
 async def list_users(session: AsyncSession) -> list[User]:
-    """Return all users ordered by creation date."""
-    result = await session.execute(select(User).order_by(User.created_at))
+    """Return all users ordered by creation date (relationships never lazy-load)."""
+    from sqlalchemy.orm import raiseload
+
+    result = await session.execute(select(User).options(raiseload("*")).order_by(User.created_at))
     return list(result.scalars().all())
 
 
@@ -113,41 +124,52 @@ async def create_feedback(
 
 
 async def list_feedback(session: AsyncSession) -> list[Feedback]:
-    """Return all feedback ordered by newest first, with user eagerly loaded."""
-    from sqlalchemy.orm import selectinload
+    """Return all feedback ordered by newest first, with user eagerly loaded.
+
+    Any other relationship access raises instead of lazy-loading, which on an
+    async session would fail anyway and otherwise hides an N+1.
+    """
+    from sqlalchemy.orm import raiseload, selectinload
 
     result = await session.execute(
-        select(Feedback).options(selectinload(Feedback.user)).order_by(Feedback.created_at.desc())
+        select(Feedback)
+        .options(selectinload(Feedback.user), raiseload("*"))
+        .order_by(Feedback.created_at.desc())
     )
     return list(result.scalars().all())
 
 
 async def feedback_stats(session: AsyncSession) -> dict:
-    """Return feedback summary stats."""
+    """Return feedback summary stats (one round trip)."""
+    from sqlalchemy import case
     from sqlalchemy import func as sqlfunc
 
-    rows = (
-        await session.execute(select(Feedback.rating, sqlfunc.count()).group_by(Feedback.rating))
-    ).all()
-
-    counts = {r: c for r, c in rows}
-    total = sum(counts.values())
-    good = counts.get("good", 0)
-    bad = counts.get("bad", 0)
+    def _rating(value: str):
+        return sqlfunc.coalesce(sqlfunc.sum(case((Feedback.rating == value, 1), else_=0)), 0)
 
-    last = (
+    latest = (
+        select(Feedback.created_at, User.username)
+        .join(User, Feedback.user_id == User.id)
+        .order_by(Feedback.created_at.desc(), Feedback.id.desc())
+        .limit(1)
+    )
+    row = (
         await session.execute(
-            select(Feedback.created_at, User.username)
-            .join(User, Feedback.user_id == User.id)
-            .order_by(Feedback.created_at.desc())
-            .limit(1)
+            select(
+                sqlfunc.count(Feedback.id),
+                _rating("good"),
+                _rating("bad"),
+                latest.with_only_columns(Feedback.created_at).scalar_subquery(),
+                latest.with_only_columns(User.username).scalar_subquery(),
+            )
         )
-    ).first()
+    ).one()
+    total, good, bad, last_at, last_by = row
 
     return {
         "total": total,
         "good": good,
         "bad": bad,
-        "last_at": last[0].isoformat() if last else None,
-        "last_by": last[1] if last else None,
+        "last_at": last_at.isoformat() if last_at else None,
+        "last_by": last_by,
     }
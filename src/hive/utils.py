@@ -1,11 +1,25 @@
 """Shared utility functions."""
 
+import asyncio
 import hashlib
+import json
+import logging
+import re
 import time
 from contextlib import contextmanager
+from datetime import date, datetime
+from datetime import time as dt_time
+from typing import Any
 
-# Amino acid characters that never appear in nucleotide sequences
-_AA_ONLY = set("EFIJLOPQZX*")
+try:
+    import orjson
+except ImportError:  # declared dependency; stdlib json keeps bare checkouts working
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Amino acid characters that never appear in nucleotide sequences (either case)
+_AA_ONLY_RE = re.compile(r"[EFIJLOPQZX*efijlopqzx]")
 
 
 def hash_sequence(seq: str) -> str:
@@ -13,6 +27,44 @@ def hash_sequence(seq: str) -> str:
     return hashlib.sha256(seq.upper().encode()).hexdigest()
 
 
+def _stdlib_default(default: Any):
+    """Encode datetimes as orjson does (RFC 3339) before deferring to *default*."""
+
+    def encode(obj: Any) -> Any:
+        if isinstance(obj, datetime | date | dt_time):
+            return obj.isoformat()
+        if default is None:
+            raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+        return default(obj)
+
+    return encode
+
+
+def json_dumps(obj: Any, default: Any = None) -> str:
+    """Compact JSON string, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_stdlib_default(default), separators=(",", ":"))
+
+
+def json_bytes(obj: Any, default: Any = None) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed (no str round-trip)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_stdlib_default(default), separators=(",", ":")).encode()
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, via orjson when installed.
+
+    Raises json.JSONDecodeError on invalid input either way (orjson's error
+    subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def format_elapsed(seconds: float) -> str:
     """Format seconds into human-friendly string: '1.2s', '2m 15s', '1h 3m'."""
     if seconds < 60:
@@ -66,9 +118,27 @@ def detect_molecule(seq: str, meta: dict | None = None) -> str:
         if mol in ("DNA", "RNA", "protein"):
             return mol
 
-    upper = seq.upper()
-    if any(c in _AA_ONLY for c in upper):
+    # Case-insensitive scans in C -- no uppercased copy of the sequence
+    if _AA_ONLY_RE.search(seq):
         return "protein"
-    if "U" in upper and "T" not in upper:
+    if ("U" in seq or "u" in seq) and "T" not in seq and "t" not in seq:
         return "RNA"
     return "DNA"
+
+
+async def cancel_and_wait(task: asyncio.Task, timeout: float = 5.0) -> None:
+    """Cancel *task* and wait up to *timeout* seconds for it to finish.
+
+    Only the task's own cancellation is absorbed -- if the caller is cancelled
+    while waiting, that still propagates. A task that ignores cancellation
+    (e.g. blocked in a worker thread) is abandoned rather than hanging
+    shutdown.
+    """
+    if task.done():
+        return
+    task.cancel()
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if not done:
+        logger.warning("Task %s did not stop within %.1fs", task.get_name(), timeout)
+    elif not task.cancelled() and (exc := task.exception()) is not None:
+        logger.debug("Task %s failed while stopping: %s", task.get_name(), exc)
@@ -3,11 +3,12 @@
 import asyncio
 import hashlib
 import logging
-from datetime import UTC, datetime
-from functools import partial
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from hive.molbio.seq import reverse_complement
@@ -55,28 +56,37 @@ def extract_tags(file_path: Path, watcher_root: str) -> list[str]:
 
 
 def hash_file(path: Path) -> str:
-    """SHA256 hash of file contents."""
-    h = hashlib.sha256()
+    """SHA256 hash of file contents.
+
+    hashlib.file_digest reads into a reused buffer and hashes without the
+    GIL; SHA-256 is hardware-accelerated on current CPUs, so the digest
+    format (and existing file_hash values) stays the same.
+    """
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 logger = logging.getLogger(__name__)
 
 
+# Parser dispatch, built once: plain parser names, plus (biopython, ext) pairs
+_DISPATCH: dict[str | tuple[str, str], Callable[..., ParseResult]] = {
+    **PARSERS,
+    **{("biopython", ext): fn for ext, fn in BIOPYTHON_PARSERS.items()},
+}
+
+
 def _resolve_parser(match: MatchResult, file_path: Path):
     """Resolve the correct parser function from match result and file extension."""
     parser_name = match.parser
     if parser_name == "biopython":
         ext = file_path.suffix.lstrip(".")
-        parser_fn = BIOPYTHON_PARSERS.get(ext)
+        parser_fn = _DISPATCH.get((parser_name, ext))
         if not parser_fn:
             raise ValueError(f"No biopython parser for extension: .{ext}")
         return parser_fn
 
-    parser_fn = PARSERS.get(parser_name)
+    parser_fn = _DISPATCH.get(parser_name)
     if not parser_fn:
         raise ValueError(f"Unknown parser: {parser_name}")
     return parser_fn
@@ -120,9 +130,14 @@ async def get_or_create_part(
     sequence: str,
     molecule: str,
     cache: dict[str, Part] | None = None,
+    seq_hash: str | None = None,
 ) -> Part:
-    """Find Part by sequence_hash or create new one."""
-    seq_hash = hash_sequence(sequence)
+    """Find Part by sequence_hash or create new one.
+
+    seq_hash: hash_sequence(sequence) when the caller already computed it.
+    """
+    if seq_hash is None:
+        seq_hash = hash_sequence(sequence)
     if cache is not None and seq_hash in cache:
         return cache[seq_hash]
     existing = await session.execute(select(Part).where(Part.sequence_hash == seq_hash))
@@ -170,6 +185,95 @@ async def add_part_name(
         )
 
 
+# Built once and reused, so per-file lookups skip statement construction
+_SELECT_INDEXED = select(IndexedFile).where(IndexedFile.file_path == bindparam("path"))
+
+
+async def prefetch_indexed(session: AsyncSession, paths: list[Path]) -> dict[str, IndexedFile]:
+    """Load IndexedFile rows for many files in one query, keyed by resolved path."""
+    keys = [str(p.resolve()) for p in paths]
+    if not keys:
+        return {}
+    rows = await session.execute(select(IndexedFile).where(IndexedFile.file_path.in_(keys)))
+    return {f.file_path: f for f in rows.scalars()}
+
+
+def _quick_unchanged(indexed: IndexedFile, stat) -> bool:
+    """rsync-style quick check: same size and mtime (within 1s) as last index.
+
+    A size change always forces the hash, even when the mtime was preserved
+    (e.g. copies with ``cp -p``). Pass ``force=True`` to ingest_file to
+    bypass this check entirely.
+    """
+    if indexed.file_mtime_ns is None:
+        return False
+    if indexed.file_size is not None and indexed.file_size != stat.st_size:
+        return False
+    return abs(indexed.file_mtime_ns - stat.st_mtime_ns) < 1_000_000_000
+
+
+# Files up to this size are read into memory once for both hash and parse;
+# larger ones are hashed in streaming chunks and parsers read them directly.
+SINGLE_READ_MAX = 64 * 1024 * 1024
+
+
+@dataclass
+class PreparedFile:
+    """Hashed and parsed file, ready to be written to the database."""
+
+    path: Path
+    stat: os.stat_result
+    file_hash: str
+    result: ParseResult | None = None
+    error: Exception | None = None
+    data: bytes | None = None  # file bytes kept for a deferred parse (parse=False)
+
+
+def parse_file(file_path: Path, match: MatchResult, data: bytes | None = None) -> ParseResult:
+    """Run the parser selected by *match* -- module-level so process pools can pickle it."""
+    return _resolve_parser(match, file_path)(file_path, extract=match.extract, data=data)
+
+
+def prepare_file(
+    file_path: Path,
+    match: MatchResult,
+    existing_file: IndexedFile | None = None,
+    force: bool = False,
+    parse: bool = True,
+) -> PreparedFile | None:
+    """Stat, hash and parse a file -- blocking, no database access.
+
+    Safe to run in worker threads. Returns None when the file is unchanged
+    relative to existing_file (size+mtime quick check, then content hash).
+    Parse failures are captured in PreparedFile.error rather than raised.
+    With parse=False the bytes read for hashing are kept in PreparedFile.data
+    and the caller runs parse_file itself (e.g. in a process pool).
+    """
+    stat = file_path.stat()
+
+    # Fast size+mtime check before expensive hash
+    if not force and existing_file and _quick_unchanged(existing_file, stat):
+        logger.debug("Unchanged (size+mtime): %s", file_path.name)
+        return None
+
+    # Small files are read once: the same bytes are hashed and parsed
+    data = file_path.read_bytes() if stat.st_size <= SINGLE_READ_MAX else None
+    file_hash = hashlib.sha256(data).hexdigest() if data is not None else hash_file(file_path)
+    if not force and existing_file and existing_file.file_hash == file_hash:
+        logger.debug("Unchanged (hash): %s", file_path.name)
+        return None
+
+    prepared = PreparedFile(path=file_path, stat=stat, file_hash=file_hash)
+    if not parse:
+        prepared.data = data
+        return prepared
+    try:
+        prepared.result = parse_file(file_path, match, data)
+    except Exception as e:
+        prepared.error = e
+    return prepared
+
+
 async def ingest_file(
     session: AsyncSession,
     file_path: Path,
@@ -177,44 +281,52 @@ async def ingest_file(
     commit: bool = True,
     watcher_root: str | None = None,
     force: bool = False,
+    prefetched: dict[str, IndexedFile] | None = None,
 ) -> IndexedFile | None:
     """Parse a file and upsert its data into the database.
 
+    prefetched: IndexedFile rows keyed by resolved path, loaded in bulk by
+    the caller (see prefetch_indexed). When given, a path missing from it is
+    treated as new and no per-file SELECT is issued.
+
     Returns the IndexedFile record, or None if the file hasn't changed.
     """
     file_path = file_path.resolve()
-    stat = file_path.stat()
 
-    # Check if already indexed -- fast mtime check before expensive hash
-    existing = await session.execute(
-        select(IndexedFile).where(IndexedFile.file_path == str(file_path))
-    )
-    existing_file = existing.scalar_one_or_none()
+    # Check if already indexed
+    if prefetched is not None:
+        existing_file = prefetched.get(str(file_path))
+    else:
+        existing = await session.execute(_SELECT_INDEXED, {"path": str(file_path)})
+        existing_file = existing.scalar_one_or_none()
 
-    loop = asyncio.get_running_loop()
+    # Hash + parse are sync I/O and CPU -- run off the event loop
+    prepared = await asyncio.to_thread(prepare_file, file_path, match, existing_file, force)
+    if prepared is None:
+        return None
+    return await store_file(
+        session, prepared, existing_file, commit=commit, watcher_root=watcher_root
+    )
 
-    if not force:
-        if existing_file and existing_file.file_mtime:
-            existing_ts = existing_file.file_mtime.timestamp()
-            if abs(existing_ts - stat.st_mtime) < 1.0:
-                logger.debug("Unchanged (mtime): %s", file_path.name)
-                return None
 
-        file_hash = await loop.run_in_executor(None, hash_file, file_path)
+async def store_file(
+    session: AsyncSession,
+    prepared: PreparedFile,
+    existing_file: IndexedFile | None,
+    commit: bool = True,
+    watcher_root: str | None = None,
+) -> IndexedFile | None:
+    """Upsert a prepared file's IndexedFile, Sequence, Parts and history.
 
-        if existing_file and existing_file.file_hash == file_hash:
-            logger.debug("Unchanged (hash): %s", file_path.name)
-            return None
-    else:
-        file_hash = await loop.run_in_executor(None, hash_file, file_path)
+    Returns the IndexedFile record, or None if the file failed to parse
+    (an error row is recorded instead).
+    """
+    file_path = prepared.path
+    stat = prepared.stat
+    file_hash = prepared.file_hash
 
-    # Parse the file (sync I/O -- run off event loop)
-    try:
-        parser_fn = _resolve_parser(match, file_path)
-        result: ParseResult = await loop.run_in_executor(
-            None, partial(parser_fn, file_path, extract=match.extract)
-        )
-    except Exception as e:
+    if prepared.error is not None:
+        e = prepared.error
         logger.error("Parse error %s: %s", file_path.name, e)
         if existing_file:
             existing_file.status = "error"
@@ -227,11 +339,12 @@ async def ingest_file(
                 status="error",
                 error_msg=str(e),
                 file_size=stat.st_size,
-                file_mtime=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+                file_mtime_ns=stat.st_mtime_ns,
             )
             session.add(indexed)
         await session.commit()
         return None
+    result = prepared.result
 
     # Upsert IndexedFile
     if existing_file:
@@ -240,7 +353,7 @@ async def ingest_file(
         existing_file.status = "active"
         existing_file.error_msg = None
         existing_file.file_size = stat.st_size
-        existing_file.file_mtime = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
+        existing_file.file_mtime_ns = stat.st_mtime_ns
         indexed = existing_file
     else:
         indexed = IndexedFile(
@@ -249,7 +362,7 @@ async def ingest_file(
             format=file_path.suffix.lstrip("."),
             status="active",
             file_size=stat.st_size,
-            file_mtime=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+            file_mtime_ns=stat.st_mtime_ns,
         )
         session.add(indexed)
         await session.flush()  # Get indexed.id
@@ -300,33 +413,32 @@ async def ingest_file(
         session.add(seq)
         await session.flush()  # Get seq.id
 
-    # Pre-compute all subsequence hashes and bulk-fetch existing Parts
-    all_hashes: set[str] = set()
-    for f in result.features:
-        subseq = _extract_subseq(result.sequence, f.start, f.end, f.strand, result.topology)
-        if subseq:
-            all_hashes.add(hash_sequence(subseq))
-    for p in result.primers:
-        if p.sequence:
-            all_hashes.add(hash_sequence(p.sequence))
+    # Extract and hash every feature subsequence once (parallel columns,
+    # reused below), then bulk-fetch existing Parts
+    subseqs = [
+        _extract_subseq(result.sequence, f.start, f.end, f.strand, result.topology)
+        for f in result.features
+    ]
+    subseq_hashes = [hash_sequence(sub) if sub else "" for sub in subseqs]
+    primer_hashes = [hash_sequence(p.sequence) if p.sequence else "" for p in result.primers]
+    all_hashes = {h for h in subseq_hashes if h}
+    all_hashes.update(h for h in primer_hashes if h)
     for step_data in meta.get("history", []):
         for oligo in step_data.get("oligos", []):
             if oligo.get("sequence"):
                 all_hashes.add(hash_sequence(oligo["sequence"]))
     parts_cache = await preload_parts(session, all_hashes)
 
-    # For each ParsedFeature: extract subsequence, hash, get_or_create Part
-    for f in result.features:
-        subseq = _extract_subseq(
-            result.sequence,
-            f.start,
-            f.end,
-            f.strand,
-            result.topology,
-        )
+    # PartInstance rows are collected and inserted in one executemany below
+    instance_rows: list[dict] = []
+
+    # For each ParsedFeature: get_or_create Part from its precomputed subsequence
+    for f, subseq, seq_hash in zip(result.features, subseqs, subseq_hashes, strict=True):
         if not subseq:
             continue
-        part = await get_or_create_part(session, subseq, result.molecule, cache=parts_cache)
+        part = await get_or_create_part(
+            session, subseq, result.molecule, cache=parts_cache, seq_hash=seq_hash
+        )
         await add_part_name(
             session,
             part.id,
@@ -334,24 +446,26 @@ async def ingest_file(
             source="file",
             source_detail=file_path.name,
         )
-        session.add(
-            PartInstance(
-                part_id=part.id,
-                seq_id=seq.id,
-                annotation_type=f.type,
-                start=f.start,
-                end=f.end,
-                strand=f.strand,
-                qualifiers=f.qualifiers or None,
-            )
+        instance_rows.append(
+            {
+                "part_id": part.id,
+                "seq_id": seq.id,
+                "annotation_type": f.type,
+                "start": f.start,
+                "end": f.end,
+                "strand": f.strand,
+                "qualifiers": f.qualifiers or None,
+            }
         )
         await annotate_part(session, part.id, f.type, subseq, result.molecule, name=f.name)
 
     # For each ParsedPrimer: create Part from oligo sequence
-    for p in result.primers:
+    for p, seq_hash in zip(result.primers, primer_hashes, strict=True):
         if not p.sequence:
             continue
-        part = await get_or_create_part(session, p.sequence, "DNA", cache=parts_cache)
+        part = await get_or_create_part(
+            session, p.sequence, "DNA", cache=parts_cache, seq_hash=seq_hash
+        )
         await add_part_name(
             session,
             part.id,
@@ -360,18 +474,22 @@ async def ingest_file(
             source_detail=file_path.name,
         )
         if p.start is not None and p.end is not None:
-            session.add(
-                PartInstance(
-                    part_id=part.id,
-                    seq_id=seq.id,
-                    annotation_type="primer_bind",
-                    start=p.start,
-                    end=p.end,
-                    strand=p.strand,
-                )
+            instance_rows.append(
+                {
+                    "part_id": part.id,
+                    "seq_id": seq.id,
+                    "annotation_type": "primer_bind",
+                    "start": p.start,
+                    "end": p.end,
+                    "strand": p.strand,
+                    "qualifiers": None,
+                }
             )
         await annotate_part(session, part.id, "primer_bind", p.sequence, "DNA", name=p.name)
 
+    if instance_rows:
+        await session.execute(insert(PartInstance), instance_rows)
+
     # Ingest cloning history steps
     history_steps = meta.get("history", [])
     if history_steps:
@@ -438,9 +556,7 @@ async def ingest_file(
 async def remove_file(session: AsyncSession, file_path: Path) -> bool:
     """Mark a file as deleted and remove its sequences."""
     file_path = file_path.resolve()
-    result = await session.execute(
-        select(IndexedFile).where(IndexedFile.file_path == str(file_path))
-    )
+    result = await session.execute(_SELECT_INDEXED, {"path": str(file_path)})
     indexed = result.scalar_one_or_none()
 
     if not indexed:
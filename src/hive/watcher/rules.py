@@ -2,7 +2,11 @@
 
 import fnmatch
 import logging
+import os
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 from hive.config import WatcherRule
@@ -18,12 +22,23 @@ class MatchResult:
     message: str | None = None
 
 
+@cache
+def _glob_matcher(pattern: str) -> Callable[[str], re.Match | None]:
+    """Compiled matcher for a rule glob (same semantics as fnmatch.fnmatch)."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
 def match_file(file_path: Path, rules: list[WatcherRule]) -> MatchResult:
     """Match a file against rules (top-down, first match wins)."""
-    filename = file_path.name
+    return match_name(file_path.name, rules)
+
+
+def match_name(filename: str, rules: list[WatcherRule]) -> MatchResult:
+    """Match a bare file name against rules -- rules only look at the name."""
+    name = os.path.normcase(filename)
 
     for rule in rules:
-        if fnmatch.fnmatch(filename, rule.match):
+        if _glob_matcher(rule.match)(name):
             return MatchResult(
                 action=rule.action,
                 parser=rule.parser,
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing as mp
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,8 +16,15 @@ from watchfiles import Change, awatch
 from hive.config import WatcherConfig
 from hive.db import session as db
 from hive.utils import Stopwatch, timed
-from hive.watcher.ingest import ingest_file, remove_file
-from hive.watcher.rules import match_file
+from hive.watcher.ingest import (
+    ingest_file,
+    parse_file,
+    prefetch_indexed,
+    prepare_file,
+    remove_file,
+    store_file,
+)
+from hive.watcher.rules import match_file, match_name
 
 if TYPE_CHECKING:
     from hive.deps import DepRegistry
@@ -22,12 +33,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _iter_files(root: str, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yield regular files under root via os.scandir.
+
+    DirEntry caches the file type from the directory listing, so no stat is
+    needed per entry. Symlinked files are included; symlinked directories
+    are not descended into (avoids cycles). Unreadable directories are
+    skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            yield entry
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug("Skipping unreadable directory: %s", e)
+
+
 async def scan_and_ingest(
     config: WatcherConfig,
     dep_registry: DepRegistry | None = None,
     batch_size: int = 100,
     ctx: ProcessContext | None = None,
     force: bool = False,
+    workers: int = 8,
 ) -> int:
     """Scan directory and ingest all parseable files. Returns count of newly indexed files."""
     root = Path(config.root).expanduser().resolve()
@@ -35,16 +71,13 @@ async def scan_and_ingest(
         logger.warning("Watch directory does not exist: %s", root)
         return 0
 
-    pattern = "**/*" if config.recursive else "*"
-
-    # Collect parseable files first
+    # Collect parseable files first -- rules match on the name alone, so
+    # only files that will be parsed are promoted to Path objects
     files = []
-    for path in root.glob(pattern):
-        if not path.is_file():
-            continue
-        match = match_file(path, config.rules)
+    for entry in _iter_files(str(root), config.recursive):
+        match = match_name(entry.name, config.rules)
         if match.action == "parse":
-            files.append((path, match))
+            files.append((Path(entry.path), match))
         elif match.action == "log" and match.message:
             logger.debug(match.message)
 
@@ -60,39 +93,85 @@ async def scan_and_ingest(
     errors = 0
     sw = Stopwatch()
 
-    for batch_start in range(0, total, batch_size):
-        batch = files[batch_start : batch_start + batch_size]
-        async with db.async_session_factory() as session:
-            for path, match in batch:
+    # Hashing and parsing run ahead in worker threads (bounded by workers);
+    # database writes stay serial in one session per batch, in file order.
+    # With parse_processes set, the CPU-bound parse moves to a process pool
+    # so it scales past the GIL.
+    pool = (
+        ProcessPoolExecutor(config.parse_processes, mp_context=mp.get_context("spawn"))
+        if config.parse_processes > 0
+        else None
+    )
+    sem = asyncio.Semaphore(max(workers, config.parse_processes))
+    loop = asyncio.get_running_loop()
+
+    async def prepare(path: Path, match, existing):
+        async with sem:
+            prepared = await asyncio.to_thread(
+                prepare_file, path, match, existing, force, pool is None
+            )
+            if prepared is not None and pool is not None:
                 try:
-                    result = await ingest_file(
-                        session,
-                        path,
-                        match,
-                        commit=False,
-                        watcher_root=watcher_root,
-                        force=force,
+                    prepared.result = await loop.run_in_executor(
+                        pool, parse_file, prepared.path, match, prepared.data
                     )
-                    if result is not None:
-                        indexed += 1
                 except Exception as e:
-                    logger.error("Failed to ingest %s: %s", path.name, e)
-                    errors += 1
-            await session.commit()
-
-        done = min(batch_start + len(batch), total)
-        logger.info(
-            "Scan progress: %d/%d files (%d%%), %d indexed, %d errors",
-            done,
-            total,
-            done * 100 // total,
-            indexed,
-            errors,
-        )
-        if ctx:
-            await ctx.check()
-        else:
-            await asyncio.sleep(0)  # yield to event loop
+                    prepared.error = e
+                prepared.data = None
+            return prepared
+
+    jobs = []
+    try:
+        for batch_start in range(0, total, batch_size):
+            batch = files[batch_start : batch_start + batch_size]
+            async with db.async_session_factory() as session:
+                # One SELECT per batch instead of one per file
+                known = await prefetch_indexed(session, [path for path, _ in batch])
+                jobs = []
+                for path, match in batch:
+                    path = path.resolve()
+                    existing = known.get(str(path))
+                    job = asyncio.ensure_future(prepare(path, match, existing))
+                    jobs.append((path, existing, job))
+                for path, existing, job in jobs:
+                    try:
+                        prepared = await job
+                        if prepared is None:
+                            continue
+                        result = await store_file(
+                            session,
+                            prepared,
+                            existing,
+                            commit=False,
+                            watcher_root=watcher_root,
+                        )
+                        if result is not None:
+                            indexed += 1
+                    except Exception as e:
+                        logger.error("Failed to ingest %s: %s", path.name, e)
+                        errors += 1
+                await session.commit()
+
+            done = min(batch_start + len(batch), total)
+            logger.info(
+                "Scan progress: %d/%d files (%d%%), %d indexed, %d errors",
+                done,
+                total,
+                done * 100 // total,
+                indexed,
+                errors,
+            )
+            if ctx:
+                await ctx.check()
+            else:
+                await asyncio.sleep(0)  # yield to event loop
+    finally:
+        # An interrupted batch leaves parses in flight -- drop them, and never
+        # block the event loop waiting on pool workers
+        for _, _, job in jobs:
+            job.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     sw.stop()
     logger.info(
@@ -1,6 +1,9 @@
 """Shared test fixtures."""
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from hive.db import Base
 
 
 @pytest.fixture
@@ -17,3 +20,19 @@ def sample_sequence():
             {"name": "CMV", "type": "promoter", "start": 1, "end": 588, "strand": 1},
         ],
     }
+
+
+@pytest.fixture
+async def db_session():
+    """Create an in-memory SQLite database for testing."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
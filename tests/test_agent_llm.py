@@ -6,7 +6,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from hive.llm.agent import Agent, _parse_tools_line, _strip_tools_line
+from hive.llm.agent import Agent, _parse_tools_line, _strip_tools_line, trim_history
+from hive.llm.client import _with_cache_breakpoints
 from hive.skills import SkillLibrary
 from hive.tools.base import Tool
 from hive.tools.registry import ToolRegistry
@@ -150,6 +151,9 @@ class TestPlannerMode:
         assert result["plan"] == "GOAL: find GFP plasmids"
         assert "results" in result["content"]
         assert llm.chat.call_count == 3
+        # Prompt-cache markers only for planner turns (stable prefix)
+        flags = [c.kwargs["cache_prefix"] for c in llm.chat.call_args_list]
+        assert flags == [True, True, False]
 
     async def test_read_injects_skill_into_system(self, registry, skills):
         """Read() injects skill content into planner system prompt."""
@@ -289,6 +293,43 @@ class TestWorkerMode:
         assert result["type"] == "message"
         assert "42" in result["content"]
 
+    async def test_report_fast_finish(self, registry):
+        """Populated report ends the run without a summary turn."""
+        llm = _mock_llm([
+            _tool_call_response([("Python", {"code": 'report["rows"] = [{"a": 1}]'})]),
+        ])
+        agent = Agent(registry, skills=None)
+        agent.prepare("rows please", use_planner=False)
+        result = await agent.run(llm, max_turns=10)
+        assert llm.chat.call_count == 1
+        assert result["report"] is True
+        assert "rows" in result["content"]
+
+    async def test_fast_finish_waits_for_all_deliver_steps(self, registry, skills):
+        """Plan with two DELIVER steps keeps going after the first table."""
+        llm = _mock_llm([
+            _tool_call_response([("Search", {})]),
+            _text_response("GOAL: x\nDELIVER:\n1. report[\"a\"]\n2. report[\"b\"]"),
+            _tool_call_response([("Python", {"code": 'report["a"] = [{"x": 1}]'})]),
+            _tool_call_response([("Python", {"code": 'report["b"] = [{"y": 2}]'})]),
+        ])
+        agent = Agent(registry, skills)
+        agent.prepare("two tables", use_planner=True)
+        result = await agent.run(llm, max_turns=10)
+        assert llm.chat.call_count == 4
+        assert set(result["data"]) == {"a", "b"}
+
+    async def test_fast_finish_disabled(self, registry):
+        llm = _mock_llm([
+            _tool_call_response([("Python", {"code": 'report["rows"] = [{"a": 1}]'})]),
+            _text_response("One row."),
+        ])
+        agent = Agent(registry, skills=None, fast_finish=False)
+        agent.prepare("rows please", use_planner=False)
+        result = await agent.run(llm, max_turns=10)
+        assert llm.chat.call_count == 2
+        assert result["content"] == "One row."
+
     async def test_worker_sees_plan_in_system_prompt(self, registry, skills):
         """After planner produces plan, worker sees it in system prompt."""
         llm = _mock_llm([
@@ -358,6 +399,31 @@ class TestStripToolsLine:
         assert _strip_tools_line(plan) == plan
 
 
+class TestTrimHistory:
+    def _pair(self, q: str, a: str) -> list[dict]:
+        return [{"role": "user", "content": q}, {"role": "assistant", "content": a}]
+
+    def test_within_budget_unchanged(self):
+        history = self._pair("find GFP", "Found 3.")
+        assert trim_history(history, budget=100) == history
+
+    def test_drops_oldest_pair(self):
+        history = self._pair("q1", "a" * 50) + self._pair("q2", "short")
+        assert trim_history(history, budget=40) == self._pair("q2", "short")
+
+    def test_drops_orphaned_reply(self):
+        history = self._pair("q" * 30, "a1") + self._pair("q2", "a2")
+        assert [m["content"] for m in trim_history(history, budget=10)] == ["q2", "a2"]
+
+    def test_cuts_oversized_last_message(self):
+        history = self._pair("q1", "x" * 100)
+        trimmed = trim_history(history, budget=20)
+        assert len(trimmed) == 1
+        assert trimmed[0]["content"].startswith("x" * 20)
+        assert trimmed[0]["content"].endswith("[... truncated]")
+        assert history[1]["content"] == "x" * 100
+
+
 # -- ToolRegistry.filtered --
 
 
@@ -452,3 +518,166 @@ class TestWorkerToolFiltering:
         system_msg = [m for m in worker_msgs if m["role"] == "system"][0]
         assert "TOOLS:" not in system_msg["content"]
         assert "GOAL: find GFP" in system_msg["content"]
+
+
+# -- Prompt cache breakpoints --
+
+
+class TestCacheBreakpoints:
+    def test_marks_system_and_last_tool(self):
+        msgs = [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}]
+        tools = [{"type": "function", "function": {"name": "A"}},
+                 {"type": "function", "function": {"name": "B"}}]
+        new_msgs, new_tools = _with_cache_breakpoints(msgs, tools)
+        assert new_msgs[0]["content"] == [
+            {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}},
+        ]
+        assert new_msgs[1] is msgs[1]
+        assert "cache_control" not in new_tools[0]
+        assert new_tools[1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_inputs_not_mutated(self):
+        msgs = [{"role": "system", "content": "sys"}]
+        tools = [{"type": "function", "function": {"name": "A"}}]
+        _with_cache_breakpoints(msgs, tools)
+        assert msgs[0]["content"] == "sys"
+        assert "cache_control" not in tools[0]
+
+    def test_tool_observations_left_uncached(self):
+        msgs = [
+            {"role": "system", "content": "sys"},
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": None, "tool_calls": []},
+            {"role": "tool", "tool_call_id": "1", "content": "big result"},
+        ]
+        new_msgs, _ = _with_cache_breakpoints(msgs, None)
+        assert all("cache_control" not in m for m in new_msgs[1:])
+        assert new_msgs[1:] == msgs[1:]
+
+    def test_no_system_no_tools(self):
+        msgs = [{"role": "user", "content": "hi"}]
+        assert _with_cache_breakpoints(msgs, None) == (msgs, None)
+
+
+class TestSignatureCache:
+    def test_cached_list_is_copy(self, registry):
+        sigs = registry.signatures()
+        sigs.append("extra")
+        assert "extra" not in registry.signatures()
+
+    def test_register_invalidates(self, registry):
+        before = registry.signatures(detailed=True)
+        registry.register(FakeTool("gc", ("gc content", "Compute GC content.")))
+        after = registry.signatures(detailed=True)
+        assert len(after) > len(before)
+        assert any(s.startswith("gc(") for s in after)
+
+    def test_planner_prompt_reused_until_register(self, registry):
+        agent = Agent(registry, skills=None)
+        first = agent._planner_base()
+        assert agent._planner_base() is first
+        registry.register(FakeTool("gc", ("gc content", "Compute GC content.")))
+        rebuilt = agent._planner_base()
+        assert rebuilt is not first
+        assert "gc(" in rebuilt
+
+    def test_planner_prompt_shared_across_agents(self, registry):
+        first = Agent(registry, skills=None)._planner_base()
+        assert Agent(registry, skills=None)._planner_base() is first
+
+
+class TestTokenAccounting:
+    async def test_cached_tokens_tracked(self, registry):
+        usage = {"prompt_tokens": 100, "completion_tokens": 5, "cache_read_input_tokens": 80}
+        llm = _mock_llm([_text_response("Hi.", usage=usage)])
+        agent = Agent(registry, skills=None)
+        agent.prepare("hello", use_planner=False)
+        result = await agent.run(llm, max_turns=3)
+        assert result["tokens"] == {"in": 100, "out": 5, "cached": 80}
+
+    async def test_openai_cached_tokens_details(self, registry):
+        usage = {
+            "prompt_tokens": 100, "completion_tokens": 5,
+            "prompt_tokens_details": {"cached_tokens": 64},
+        }
+        llm = _mock_llm([_text_response("Hi.", usage=usage)])
+        agent = Agent(registry, skills=None)
+        agent.prepare("hello", use_planner=False)
+        result = await agent.run(llm, max_turns=3)
+        assert result["tokens"]["cached"] == 64
+
+    async def test_older_skill_reads_compacted(self, registry, skills):
+        llm = _mock_llm([
+            _tool_call_response([("Read", {"name": "seq_search"})], usage=None),
+            _tool_call_response([("Read", {"name": "blast_sim"})]),
+            _text_response("GOAL: search"),
+            _text_response("Done."),
+        ])
+        agent = Agent(registry, skills)
+        agent.prepare("find stuff", use_planner=True)
+        await agent.run(llm, max_turns=10)
+
+        turn2_msgs = llm.chat.call_args_list[2][0][0]
+        tool_msgs = [m for m in turn2_msgs if m["role"] == "tool"]
+        assert tool_msgs[0]["content"] == "Skill 'seq_search' loaded (see Domain Skills)."
+        assert "BLAST" in tool_msgs[1]["content"]
+        # Skill bodies stay in the system prompt
+        assert "Seq Search" in turn2_msgs[0]["content"]
+
+
+class TestHealthClient:
+    async def test_health_reuses_client_and_closes(self):
+        import httpx
+
+        from hive.config import ModelEntry
+        from hive.llm.client import LLMClient
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"data": []})
+
+        client = LLMClient(ModelEntry(base_url="http://llm.local"))
+        http = httpx.AsyncClient(
+            base_url="http://llm.local/v1", transport=httpx.MockTransport(handler)
+        )
+        client._http = http
+
+        assert await client.health() is True
+        assert await client.health() is True
+        assert client._http is http
+        assert calls == ["/v1/models", "/v1/models"]
+
+        await client.close()
+        assert client._http is None
+        assert http.is_closed
+
+
+class TestLitellmImport:
+    async def test_completion_imports_off_the_event_loop(self, monkeypatch):
+        import threading
+        from types import SimpleNamespace
+
+        from hive.config import ModelEntry
+        from hive.llm import client as client_mod
+
+        async def acompletion(**kwargs):
+            return SimpleNamespace(model_dump=lambda: {"choices": []})
+
+        fake = SimpleNamespace(acompletion=acompletion)
+        import_threads = []
+
+        def fake_import():
+            import_threads.append(threading.current_thread())
+            client_mod._litellm_module = fake
+            return fake
+
+        monkeypatch.setattr(client_mod, "_litellm_module", None)
+        monkeypatch.setattr(client_mod, "_litellm", fake_import)
+
+        llm = client_mod.LLMClient(ModelEntry(base_url="http://llm.local"))
+        assert await llm.chat([{"role": "user", "content": "hi"}]) == {"choices": []}
+        assert await llm.chat([{"role": "user", "content": "hi"}]) == {"choices": []}
+        assert len(import_threads) == 1
+        assert import_threads[0] is not threading.current_thread()
@@ -9,7 +9,12 @@ from hive.tools.tools.digest import DigestTool
 from hive.tools.tools.extract import _slice_sequence
 from hive.tools.tools.gc import GCTool
 from hive.tools.tools.revcomp import RevCompTool
-from hive.tools.tools.search import _parse_bool_query
+from hive.tools.tools.search import (
+    SearchResultItem,
+    _hoist_topology,
+    _parse_bool_query,
+    _result_item,
+)
 from hive.tools.tools.sites import SitesTool
 from hive.tools.tools.transcribe import TranscribeTool
 from hive.tools.tools.translate import TranslateTool
@@ -42,6 +47,10 @@ class TestTranslate:
         result = await tool.execute({"sequence": "AT"})
         assert "error" in result
 
+    async def test_pasted_whitespace_and_case(self, tool):
+        result = await tool.execute({"sequence": "atg aaa\r\nttt\tgcc TGA\n"})
+        assert result["protein"] == "MKFA*"
+
 
 
 # -- Transcribe --
@@ -269,6 +278,32 @@ class TestParseBoolQuery:
         assert terms == ["KanR", "circular"]
         assert op == "and"
 
+    def test_hoist_topology_from_and(self):
+        assert _hoist_topology(["KanR", "Circular"], "and") == (["KanR"], "circular")
+
+    def test_hoist_topology_single(self):
+        assert _hoist_topology(["linear"], "single") == ([], "linear")
+
+    def test_hoist_topology_skips_or_and_conflicts(self):
+        assert _hoist_topology(["GFP", "circular"], "or") == (["GFP", "circular"], None)
+        terms = ["circular", "linear"]
+        assert _hoist_topology(terms, "and") == (terms, None)
+        assert _hoist_topology(["GFP"], "single") == (["GFP"], None)
+
+    def test_result_item_matches_model_shape(self):
+        named = MagicMock(part=MagicMock(names=[MagicMock(), MagicMock()]))
+        named.part.names[0].name = "KanR"
+        unnamed = MagicMock(part=None)
+        seq = MagicMock(
+            id=7, length=3000, topology="circular", has_history=False,
+            meta={"tags": ["lab"]}, part_instances=[named, unnamed],
+        )
+        seq.name = "pUC19"
+        item = _result_item(seq, "pUC19.gb", 0.5)
+        assert item == SearchResultItem(**item).model_dump()
+        assert item["features"] == ["KanR"]
+        assert item["tags"] == ["lab"]
+
 
 # -- resolve_input --
 
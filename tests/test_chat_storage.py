@@ -15,6 +15,13 @@ class TestChatStorage:
         assert loaded["title"] == "Test Chat"
         assert loaded["messages"] == msgs
 
+    def test_saved_file_is_compact(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        store.save("abc123", [{"role": "user", "content": "hi"}], title="Test Chat")
+        raw = (tmp_path / "abc123.json").read_text()
+        assert "\n" not in raw
+        assert '{"role":"user","content":"hi"}' in raw
+
     def test_load_missing(self, tmp_path):
         store = ChatStorage(str(tmp_path))
         assert store.load("nonexistent") is None
@@ -77,3 +84,127 @@ class TestChatStorage:
         assert len(chat_id) == 8
         # IDs should be hex strings
         int(chat_id, 16)
+
+    def test_list_chats_uses_index_across_instances(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        store.save("aaa", [{"role": "user", "content": "one"}], title="First")
+        store.save("bbb", [], title="Second")
+        store.update_title("aaa", "Renamed")
+        store.delete("bbb")
+
+        reopened = ChatStorage(str(tmp_path))
+        chats = reopened.list_chats()
+        assert [(c["id"], c["title"], c["message_count"]) for c in chats] == [
+            ("aaa", "Renamed", 1)
+        ]
+
+    def test_index_rebuilt_from_existing_files(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        store.save("aaa", [{"role": "user", "content": "hi"}], user_slug="alice", title="Old")
+        (tmp_path / "index.jsonl").unlink()
+
+        chats = ChatStorage(str(tmp_path)).list_chats(user_slug="alice")
+        assert len(chats) == 1
+        assert chats[0]["id"] == "aaa"
+        assert chats[0]["title"] == "Old"
+        assert chats[0]["message_count"] == 1
+
+    def test_unchanged_save_skips_write(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        msgs = [{"role": "user", "content": "hi"}]
+        store.save("abc123", msgs, title="T")
+        path = tmp_path / "abc123.json"
+        before = path.stat().st_mtime_ns
+        index_before = (tmp_path / "index.jsonl").read_bytes()
+
+        store.save("abc123", msgs)
+        assert path.stat().st_mtime_ns == before
+        assert (tmp_path / "index.jsonl").read_bytes() == index_before
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_repeated_save_skips_read(self, tmp_path, monkeypatch):
+        store = ChatStorage(str(tmp_path))
+        msgs = [{"role": "user", "content": "hi"}]
+        store.save("abc123", msgs, title="T")
+
+        def fail(*_):
+            raise AssertionError("file read on a no-op save")
+
+        monkeypatch.setattr(store, "_read", fail)
+        store.save("abc123", msgs, title="T")
+
+    def test_save_after_rename_rewrites(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        msgs = [{"role": "user", "content": "hi"}]
+        store.save("abc123", msgs, title="T")
+        store.update_title("abc123", "Renamed")
+        store.save("abc123", msgs, title="T")
+        assert store.load("abc123")["title"] == "T"
+
+    def test_missing_index_rebuilt_from_files(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        for cid in ("aaa", "bbb", "ccc"):
+            store.save(cid, [{"role": "user", "content": cid}], title=cid.upper())
+        (tmp_path / "index.jsonl").unlink()
+        (tmp_path / "ddd.json").write_text("{not json")
+
+        chats = ChatStorage(str(tmp_path)).list_chats()
+        assert sorted(c["title"] for c in chats) == ["AAA", "BBB", "CCC"]
+
+    def test_corrupt_index_rebuilt(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        store.save("aaa", [], title="Kept")
+        with open(tmp_path / "index.jsonl", "a") as f:
+            f.write('{"stem": "bbb", "tit')  # torn write
+
+        chats = ChatStorage(str(tmp_path)).list_chats()
+        assert [(c["id"], c["title"]) for c in chats] == [("aaa", "Kept")]
+        assert len((tmp_path / "index.jsonl").read_text().splitlines()) == 1
+
+    async def test_async_wrappers(self, tmp_path):
+        store = ChatStorage(str(tmp_path))
+        await store.asave("abc123", [{"role": "user", "content": "hi"}], user_slug="al", title="T")
+        await store.aupdate_title("abc123", "New", user_slug="al")
+
+        loaded = await store.aload("abc123", "al")
+        assert loaded["title"] == "New"
+        assert [c["id"] for c in await store.alist_chats("al")] == ["abc123"]
+        assert await store.adelete("abc123", "al") is True
+        assert await store.alist_chats("al") == []
+
+    def test_compressed_round_trip_and_migration(self, tmp_path):
+        plain = ChatStorage(str(tmp_path))
+        plain.save("abc123", [{"role": "user", "content": "hi"}], title="T")
+
+        store = ChatStorage(str(tmp_path), compress=True)
+        assert store.load("abc123")["title"] == "T"  # legacy plain file still readable
+
+        msgs = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "yo"}]
+        store.save("abc123", msgs)
+        assert (tmp_path / "abc123.json.gz").exists()
+        assert not (tmp_path / "abc123.json").exists()
+        assert len(store.load("abc123")["messages"]) == 2
+
+        (tmp_path / "index.jsonl").unlink()
+        chats = ChatStorage(str(tmp_path)).list_chats()
+        assert [(c["id"], c["message_count"]) for c in chats] == [("abc123", 2)]
+
+        assert store.delete("abc123") is True
+        assert list(tmp_path.glob("abc123*")) == []
+
+    async def test_listing_cached_until_index_changes(self, tmp_path, monkeypatch):
+        store = ChatStorage(str(tmp_path))
+        store.save("aaa", [], user_slug="al", title="One")
+        assert [c["title"] for c in store.list_chats("al")] == ["One"]
+
+        # Cached: neither the index scan nor a worker thread is needed
+        monkeypatch.setattr(store, "_index", {})
+        monkeypatch.setattr("asyncio.to_thread", None)
+        assert [c["title"] for c in await store.alist_chats("al")] == ["One"]
+        monkeypatch.undo()
+
+        store.update_title("aaa", "Renamed", user_slug="al")
+        store.save("bbb", [], user_slug="al", title="Two")
+        assert [c["title"] for c in store.list_chats("al")] == ["Two", "Renamed"]
+        store.delete("bbb", user_slug="al")
+        assert [c["title"] for c in await store.alist_chats("al")] == ["Renamed"]
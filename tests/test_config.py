@@ -1,5 +1,7 @@
 """Tests for config: grouped sections, dep_data_dir, logging."""
 
+import os
+
 from hive.config import LogConfig, Settings, load_config
 
 
@@ -75,3 +77,14 @@ class TestLoadConfig:
     def test_load_missing_file_uses_defaults(self):
         s = load_config("/nonexistent/config.yaml")
         assert s.deps.blast.default_evalue == 1e-5
+
+    def test_load_config_cached_until_file_changes(self, tmp_path):
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("data_root: /one\n")
+        first = load_config(str(config_file))
+        assert load_config(str(config_file)) is first
+
+        config_file.write_text("data_root: /two\n")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_config(str(config_file)).data_root == "/two"
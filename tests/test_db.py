@@ -1,7 +1,7 @@
 """Tests for database audit and cleanup operations."""
 
 import json
-from datetime import UTC, datetime
+import time
 from pathlib import Path
 
 import pytest
@@ -37,7 +37,7 @@ def _make_file(session, path="/tmp/test.dna", file_hash="abc123", status="active
         format="dna",
         status=status,
         file_size=1000,
-        file_mtime=datetime.now(UTC),
+        file_mtime_ns=time.time_ns(),
     )
     session.add(f)
     return f
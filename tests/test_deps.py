@@ -1,5 +1,7 @@
 """Tests for deps system: Dep ABC, DepRegistry, BlastDep."""
 
+import pytest
+
 from hive.deps import Dep, DepRegistry
 from hive.deps.blast import BlastDep
 
@@ -46,6 +48,31 @@ class TestDep:
         result = await dep.setup()
         assert result is True
 
+    async def test_run_gives_child_no_stdin(self):
+        rc, stdout, _ = await Dep._run(["cat"])
+        assert rc == 0
+        assert stdout == b""
+
+    async def test_run_kills_child_on_cancel(self, monkeypatch):
+        import asyncio
+
+        spawned = []
+        real_exec = asyncio.create_subprocess_exec
+
+        async def spy(*args, **kwargs):
+            proc = await real_exec(*args, **kwargs)
+            spawned.append(proc)
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", spy)
+        task = asyncio.create_task(Dep._run(["sleep", "30"]))
+        while not spawned:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert spawned[0].returncode is not None
+
 
 # -- DepRegistry --
 
@@ -1,34 +1,31 @@
 """Tests for the ingestion pipeline -- parse files and store in DB."""
 
+import asyncio
+import hashlib
+import os
 from pathlib import Path
 
 import pytest
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from hive.config import WatcherConfig, WatcherRule
 from hive.db import Base, IndexedFile, Part, PartInstance, PartName, Sequence
-from hive.watcher.ingest import extract_tags, ingest_file, remove_file
+from hive.db import session as db
+from hive.watcher import scan_and_ingest
+from hive.watcher.ingest import (
+    _resolve_parser,
+    extract_tags,
+    hash_file,
+    ingest_file,
+    prefetch_indexed,
+    remove_file,
+)
 from hive.watcher.rules import MatchResult
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-async def db_session():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with session_factory() as session:
-        yield session
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    await engine.dispose()
-
-
 class TestIngestGenbank:
     async def test_ingest_new_file(self, db_session):
         match = MatchResult(action="parse", parser="biopython", extract=None)
@@ -66,6 +63,16 @@ class TestIngestGenbank:
         assert "GFP_mini" in name_set
         assert "T7_promoter" in name_set
 
+    async def test_part_instances_bulk_inserted(self, db_session):
+        match = MatchResult(action="parse", parser="biopython", extract=None)
+        await ingest_file(db_session, FIXTURES / "test_plasmid.gb", match)
+
+        seq = (await db_session.execute(select(Sequence))).scalar_one()
+        pis = (await db_session.execute(select(PartInstance))).scalars().all()
+        assert {pi.seq_id for pi in pis} == {seq.id}
+        assert all(pi.start is not None and pi.end is not None for pi in pis)
+        assert any(pi.qualifiers for pi in pis)
+
     async def test_sequence_has_hash_and_molecule(self, db_session):
         match = MatchResult(action="parse", parser="biopython", extract=None)
         await ingest_file(db_session, FIXTURES / "test_plasmid.gb", match)
@@ -83,6 +90,17 @@ class TestIngestGenbank:
         assert result1 is not None
         assert result2 is None  # Same hash, no re-index
 
+    async def test_size_change_with_same_mtime_reindexes(self, db_session, tmp_path):
+        path = tmp_path / "p.gb"
+        path.write_text((FIXTURES / "test_plasmid.gb").read_text())
+        match = MatchResult(action="parse", parser="biopython", extract=None)
+        assert await ingest_file(db_session, path, match) is not None
+
+        st = path.stat()
+        path.write_text(path.read_text().replace("//", "\n//", 1))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert await ingest_file(db_session, path, match) is not None
+
     async def test_file_count(self, db_session):
         match = MatchResult(action="parse", parser="biopython", extract=None)
         await ingest_file(db_session, FIXTURES / "test_plasmid.gb", match)
@@ -145,6 +163,32 @@ class TestRemoveFile:
         assert len(seqs) == 0
 
 
+class TestPrefetch:
+    async def test_prefetched_rows_skip_lookup(self, db_session):
+        match = MatchResult(action="parse", parser="biopython", extract=None)
+        gb = FIXTURES / "test_plasmid.gb"
+        await ingest_file(db_session, gb, match)
+
+        known = await prefetch_indexed(db_session, [gb, FIXTURES / "missing.gb"])
+        assert list(known) == [str(gb.resolve())]
+        assert await ingest_file(db_session, gb, match, prefetched=known) is None
+
+    async def test_empty_prefetch_means_new(self, db_session):
+        match = MatchResult(action="parse", parser="biopython", extract=None)
+        result = await ingest_file(
+            db_session, FIXTURES / "test_plasmid.gb", match, prefetched={},
+        )
+        assert result is not None
+
+
+class TestHashFile:
+    def test_matches_sha256(self, tmp_path):
+        data = b"ACGT" * 300_000
+        path = tmp_path / "big.fa"
+        path.write_bytes(data)
+        assert hash_file(path) == hashlib.sha256(data).hexdigest()
+
+
 class TestExtractTags:
     def test_basic_tags(self):
         tags = extract_tags(Path("/watcher/proj/sub/file.dna"), "/watcher")
@@ -198,3 +242,119 @@ class TestMultipleFiles:
 
         assert len(files) == 2
         assert len(seqs) == 2
+
+
+class TestScan:
+    @pytest.fixture
+    async def session_factory(self, monkeypatch):
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr(db, "async_session_factory", factory)
+        yield factory
+        await engine.dispose()
+
+    async def test_scan_parses_ahead_and_skips_unchanged(self, session_factory, tmp_path):
+        for name in ("test_plasmid.gb", "test_sequence.fasta"):
+            (tmp_path / "sub").mkdir(exist_ok=True)
+            (tmp_path / "sub" / name).write_bytes((FIXTURES / name).read_bytes())
+        (tmp_path / "broken.xyz").write_text("no parser for this\n")
+        config = WatcherConfig(
+            root=str(tmp_path),
+            rules=[
+                WatcherRule(match="*.gb", action="parse", parser="biopython"),
+                WatcherRule(match="*.fasta", action="parse", parser="biopython"),
+                WatcherRule(match="*.xyz", action="parse", parser="missing"),
+            ],
+        )
+
+        assert await scan_and_ingest(config, batch_size=2, workers=2) == 2
+        async with session_factory() as s:
+            statuses = {
+                Path(f.file_path).name: f.status
+                for f in (await s.execute(select(IndexedFile))).scalars()
+            }
+        assert statuses == {
+            "test_plasmid.gb": "active",
+            "test_sequence.fasta": "active",
+            "broken.xyz": "error",
+        }
+
+        assert await scan_and_ingest(config, workers=2) == 0
+
+    async def test_scan_with_parse_processes(self, session_factory, tmp_path):
+        (tmp_path / "test_plasmid.gb").write_bytes((FIXTURES / "test_plasmid.gb").read_bytes())
+        (tmp_path / "broken.xyz").write_text("no parser for this\n")
+        config = WatcherConfig(
+            root=str(tmp_path),
+            parse_processes=2,
+            rules=[
+                WatcherRule(match="*.gb", action="parse", parser="biopython"),
+                WatcherRule(match="*.xyz", action="parse", parser="missing"),
+            ],
+        )
+
+        assert await scan_and_ingest(config) == 1
+        async with session_factory() as s:
+            seq = (await s.execute(select(Sequence))).scalar_one()
+            statuses = {f.status for f in (await s.execute(select(IndexedFile))).scalars()}
+        assert seq.length == 120
+        assert statuses == {"active", "error"}
+
+
+    async def test_cancelled_scan_drops_pending_parses(
+        self, session_factory, tmp_path, monkeypatch
+    ):
+        from concurrent.futures import Executor, Future
+
+        from hive.watcher import watcher
+
+        class StalledPool(Executor):
+            """Accepts parses but never runs them -- a scan stuck mid-batch."""
+
+            def __init__(self, *args, **kwargs):
+                self.futures: list[Future] = []
+                self.shutdown_args = None
+                pools.append(self)
+
+            def submit(self, fn, *args, **kwargs):
+                self.futures.append(Future())
+                return self.futures[-1]
+
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                self.shutdown_args = (wait, cancel_futures)
+
+        pools: list[StalledPool] = []
+        monkeypatch.setattr(watcher, "ProcessPoolExecutor", StalledPool)
+        for name in ("a.gb", "b.gb"):
+            (tmp_path / name).write_bytes((FIXTURES / "test_plasmid.gb").read_bytes())
+        config = WatcherConfig(
+            root=str(tmp_path),
+            parse_processes=2,
+            rules=[WatcherRule(match="*.gb", action="parse", parser="biopython")],
+        )
+
+        task = asyncio.create_task(scan_and_ingest(config))
+        while not pools or len(pools[0].futures) < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert all(f.cancelled() for f in pools[0].futures)
+        assert pools[0].shutdown_args == (False, True)
+
+
+class TestResolveParser:
+    def test_dispatch(self):
+        from hive.parsers import BIOPYTHON_PARSERS, PARSERS
+
+        bio = MatchResult(action="parse", parser="biopython")
+        assert _resolve_parser(bio, Path("x.fa")) is BIOPYTHON_PARSERS["fa"]
+        sgff = MatchResult(action="parse", parser="sgffp")
+        assert _resolve_parser(sgff, Path("x.dna")) is PARSERS["sgffp"]
+        with pytest.raises(ValueError, match="No biopython parser"):
+            _resolve_parser(bio, Path("x.dna"))
+        with pytest.raises(ValueError, match="Unknown parser"):
+            _resolve_parser(MatchResult(action="parse", parser="nope"), Path("x.dna"))
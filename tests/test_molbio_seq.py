@@ -41,3 +41,6 @@ class TestTranslate:
     def test_unknown_table(self):
         with pytest.raises(ValueError, match="Unknown codon table"):
             translate("ATG", table=999)
+
+    def test_ambiguous_codon_is_x(self):
+        assert translate("ATGNNNTAA") == "MX*"
@@ -1,11 +1,16 @@
 """Tests for file parsers."""
 
+import io
 from pathlib import Path
 
+import pytest
+
 from hive.parsers import BIOPYTHON_PARSERS, PARSERS
 from hive.parsers.base import ParseResult
 from hive.parsers.fasta import parse_fasta
 from hive.parsers.genbank import parse_genbank
+from hive.parsers.snapgene import _parse_strand, _read_sgff, parse_snapgene
+from hive.utils import detect_molecule
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -62,6 +67,28 @@ class TestGenbankParser:
         assert result.features == []
         assert len(result.sequence) == 120
 
+    def test_crlf_bytes_match_file(self):
+        raw = (FIXTURES / "test_plasmid.gb").read_bytes()
+        crlf = parse_genbank(FIXTURES / "x.gb", data=raw.replace(b"\n", b"\r\n"))
+        plain = parse_genbank(FIXTURES / "test_plasmid.gb")
+        assert crlf.sequence == plain.sequence
+        assert len(crlf.features) == len(plain.features)
+
+    def test_parsed_objects_are_slotted(self):
+        result = parse_genbank(FIXTURES / "test_plasmid.gb")
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.features[0], "__dict__")
+
+    def test_unterminated_origin(self):
+        raw = b"LOCUS       x   8 bp    DNA     linear\nORIGIN\n        1 acgtacgt\n"
+        assert parse_genbank(Path("x.gb"), data=raw).sequence == ""
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.gb"
+        path.write_bytes(b"")
+        result = parse_genbank(path)
+        assert (result.name, result.sequence) == ("empty", "")
+
 
 class TestFastaParser:
     def test_parse_basic(self):
@@ -82,6 +109,90 @@ class TestFastaParser:
         result = parse_fasta(FIXTURES / "test_sequence.fasta")
         assert result.sequence.startswith("ATGGTGAGCAAGGGCGAGGAG")
 
+    def test_preloaded_multi_record_crlf(self):
+        raw = b">first one\r\nACGT\r\nAC\r\n>second\r\nTTTT\r\n"
+        result = parse_fasta(Path("x.fa"), data=raw)
+        assert (result.name, result.description, result.sequence) == ("first", "one", "ACGTAC")
+
+    def test_preloaded_header_only(self):
+        assert parse_fasta(Path("x.fa"), data=b">lonely").sequence == ""
+
+
+def _snapgene_bytes() -> bytes:
+    from sgffp import SgffObject
+    from sgffp.models.feature import SgffFeature, SgffSegment
+    from sgffp.models.primer import SgffPrimer
+    from sgffp.writer import SgffWriter
+
+    sgff = SgffObject.new("ACGT" * 20, topology="circular")
+    sgff.features.add(SgffFeature(name="f1", type="CDS", segments=[SgffSegment(start=2, end=10)]))
+    sgff.primers.add(SgffPrimer(name="p1", sequence="ACGTACGTAC"))
+    buf = io.BytesIO()
+    SgffWriter(buf).write(sgff)
+    return buf.getvalue()
+
+
+class TestSnapgeneParser:
+    def test_full_parse(self):
+        result = parse_snapgene(Path("x.dna"), data=_snapgene_bytes())
+        assert (result.size_bp, result.topology) == (80, "circular")
+        assert [f.name for f in result.features] == ["f1"]
+        assert [p.name for p in result.primers] == ["p1"]
+
+    def test_extract_skips_unused_blocks(self):
+        raw = _snapgene_bytes()
+        assert set(_read_sgff(raw, ["features"]).blocks) == {0, 10}
+        result = parse_snapgene(Path("x.dna"), extract=["features"], data=raw)
+        assert result.sequence == "ACGT" * 20
+        assert [f.name for f in result.features] == ["f1"]
+        assert result.primers == []
+
+    @pytest.mark.parametrize("extract", [None, ["sequence"], ["features", "primers"]])
+    def test_restricted_read_matches_sgffreader(self, extract):
+        # _read_sgff mirrors SgffReader._parse via sgffp internals -- guard
+        # against drift when sgffp is upgraded
+        from sgffp import SgffReader
+
+        path = FIXTURES / "test_plasmid.dna"
+        full = SgffReader.from_file(path)
+        restricted = _read_sgff(path, extract)
+        assert restricted.cookie == full.cookie
+        assert set(restricted.blocks) <= set(full.blocks)
+        assert {0, 6} <= set(restricted.blocks)
+        for bid, value in restricted.blocks.items():
+            assert value == full.blocks[bid]
+        if extract is None:
+            assert restricted.blocks == full.blocks
+
+    def test_path_matches_bytes(self, tmp_path):
+        path = tmp_path / "x.dna"
+        path.write_bytes(_snapgene_bytes())
+        assert parse_snapgene(path) == parse_snapgene(path, data=path.read_bytes())
+
+    def test_parse_strand(self):
+        assert [_parse_strand(s) for s in ("+", "-", ".", "-1", 1, -1, 0, 2, "?")] == [
+            1, -1, 0, -1, 1, -1, 0, 2, 0,
+        ]
+
+    def test_rejects_non_snapgene(self):
+        with pytest.raises(ValueError, match="magic byte"):
+            parse_snapgene(Path("x.dna"), data=b"LOCUS")
+
+
+class TestDetectMolecule:
+    def test_dna(self):
+        assert detect_molecule("ATGCatgcNN") == "DNA"
+
+    def test_rna_either_case(self):
+        assert detect_molecule("AUGC") == "RNA"
+        assert detect_molecule("augc") == "RNA"
+
+    def test_protein_lowercase(self):
+        assert detect_molecule("mkflv") == "protein"
+
+    def test_meta_hint_wins(self):
+        assert detect_molecule("ATGC", {"molecule_type": "RNA"}) == "RNA"
+
 
 class TestParserRegistry:
     def test_parsers_registered(self):
@@ -103,3 +214,9 @@ class TestParserRegistry:
         parser = BIOPYTHON_PARSERS["fasta"]
         result = parser(FIXTURES / "test_sequence.fasta")
         assert result.name == "GFP_coding_sequence"
+
+    def test_preloaded_data_matches_path(self):
+        for name in ("test_plasmid.gb", "test_sequence.fasta"):
+            path = FIXTURES / name
+            parser = BIOPYTHON_PARSERS[path.suffix.lstrip(".")]
+            assert parser(path, data=path.read_bytes()) == parser(path)
@@ -184,3 +184,44 @@ class TestProcessRegistry:
         await asyncio.sleep(0.1)
         assert ps.get_state("counter") == ProcessState.completed
         assert ps.get_state("failer") == ProcessState.error
+
+
+class TestCancelAndWait:
+    async def test_stubborn_task_is_abandoned(self):
+        from hive.utils import cancel_and_wait
+
+        release = asyncio.Event()
+
+        async def stubborn():
+            while not release.is_set():
+                try:
+                    await release.wait()
+                except asyncio.CancelledError:
+                    continue  # ignores cancellation
+
+        task = asyncio.create_task(stubborn())
+        await asyncio.sleep(0)
+        await cancel_and_wait(task, timeout=0.05)
+        assert not task.done()
+        release.set()
+        await task
+
+    async def test_caller_cancellation_propagates(self):
+        from hive.utils import cancel_and_wait
+
+        async def slow_to_stop():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(slow_to_stop())
+        await asyncio.sleep(0)
+        stopper = asyncio.create_task(cancel_and_wait(task, timeout=5))
+        await asyncio.sleep(0.01)
+        stopper.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stopper
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
@@ -5,7 +5,10 @@ from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from hive.db import Base
+from hive.llm import ResponseCache
 from hive.skills import SkillLibrary
 from hive.tools import Tool, ToolRegistry
 from hive.router import (
@@ -15,6 +18,7 @@ from hive.router import (
     _form_response,
     _help_response,
     _parse_args,
+    _split_command,
     _tool_response,
     route_input,
 )
@@ -86,6 +90,20 @@ class DirectOnlyTool(Tool):
         return {"ok": True}
 
 
+@pytest.fixture
+async def db_session():
+    """Create an in-memory SQLite database for testing."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
 @pytest.fixture()
 def registry():
     reg = ToolRegistry()
@@ -120,6 +138,19 @@ class TestModePatterns:
         assert m.group(1) == "search"
         assert m.group(2) == "ampicillin"
 
+    @pytest.mark.parametrize("text", [
+        "//search ampicillin", "//status", '//search {"query": "GFP"}',
+        "/search ampicillin", "/blast\n  ATGC  ", "/gc-content x", "///x",
+        "//", "/", "hello /search", "/ search", "//_priv  a b ",
+    ])
+    def test_split_command_matches_patterns(self, text):
+        expected = None
+        if m := DIRECT_PATTERN.match(text):
+            expected = (True, m.group(1), m.group(2).strip())
+        elif m := GUIDED_PATTERN.match(text):
+            expected = (False, m.group(1), m.group(2).strip())
+        assert _split_command(text) == expected
+
 
 
 # -- Pure Helpers --
@@ -142,6 +173,10 @@ class TestParseArgs:
     def test_invalid_json(self):
         assert _parse_args("{bad json") == {"query": "{bad json"}
 
+    def test_json_scalar_treated_as_text(self):
+        assert _parse_args("42") == {"query": "42"}
+        assert _parse_args('["a"]') == {"query": '["a"]'}
+
 
 class TestResponseHelpers:
     def test_tool_response(self):
@@ -389,6 +424,139 @@ class TestAgenticLoop:
         assert "Could not connect" in resp["content"]
 
 
+# -- Response Cache --
+
+
+class TestResponseCache:
+    def _llm(self, responses):
+        client = AsyncMock()
+        client.chat = AsyncMock(side_effect=responses)
+        client.provider, client.model = "ollama", "test"
+        return client
+
+    def _text(self, content):
+        return {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 20},
+        }
+
+    async def test_repeat_served_from_cache(self, registry):
+        cache = ResponseCache()
+        llm = self._llm([self._text("Hello!")])
+        first = await route_input("hello  there", registry, llm_client=llm, response_cache=cache)
+        again = await route_input("Hello there", registry, llm_client=llm, response_cache=cache)
+        assert llm.chat.call_count == 1
+        assert again["content"] == first["content"]
+        assert "tokens" not in again
+
+    async def test_history_is_part_of_key(self, registry):
+        cache = ResponseCache()
+        llm = self._llm([self._text("One."), self._text("Two.")])
+        await route_input("hi", registry, llm_client=llm, response_cache=cache)
+        history = [{"role": "user", "content": "earlier"}]
+        resp = await route_input(
+            "hi", registry, llm_client=llm, history=history, response_cache=cache
+        )
+        assert resp["content"] == "Two."
+
+    async def test_llm_error_not_cached(self, registry):
+        cache = ResponseCache()
+        llm = self._llm([Exception("Connection failed"), self._text("Recovered.")])
+        await route_input("hi", registry, llm_client=llm, response_cache=cache)
+        resp = await route_input("hi", registry, llm_client=llm, response_cache=cache)
+        assert resp["content"] == "Recovered."
+
+    async def test_paraphrase_served_with_embedding_model(self, registry):
+        cache = ResponseCache(embedding_model="embed", threshold=0.95)
+        llm = self._llm([self._text("GFP plasmids: ...")])
+        llm.embed = AsyncMock(side_effect=[[1.0, 0.0], [0.99, 0.05]])
+        await route_input("find GFP plasmids", registry, llm_client=llm, response_cache=cache)
+        resp = await route_input(
+            "show me GFP constructs", registry, llm_client=llm, response_cache=cache
+        )
+        assert llm.chat.call_count == 1
+        assert resp["content"] == "GFP plasmids: ..."
+
+    async def test_dissimilar_prompt_misses(self, registry):
+        cache = ResponseCache(embedding_model="embed", threshold=0.95)
+        llm = self._llm([self._text("One."), self._text("Two.")])
+        llm.embed = AsyncMock(side_effect=[[1.0, 0.0], [0.0, 1.0]])
+        await route_input("find GFP plasmids", registry, llm_client=llm, response_cache=cache)
+        resp = await route_input("list primers", registry, llm_client=llm, response_cache=cache)
+        assert resp["content"] == "Two."
+
+    async def test_raw_sequence_prompt_is_exact_only(self, registry):
+        cache = ResponseCache(embedding_model="embed")
+        llm = self._llm([self._text("Hits.")])
+        llm.embed = AsyncMock(return_value=[1.0, 0.0])
+        await route_input("blast " + "ACGT" * 10, registry, llm_client=llm, response_cache=cache)
+        llm.embed.assert_not_called()
+
+    async def test_embedding_failure_falls_back_to_exact(self, registry):
+        cache = ResponseCache(embedding_model="embed")
+        llm = self._llm([self._text("One.")])
+        llm.embed = AsyncMock(side_effect=RuntimeError("no embeddings"))
+        resp = await route_input("hi", registry, llm_client=llm, response_cache=cache)
+        assert resp["content"] == "One."
+        await route_input("hi", registry, llm_client=llm, response_cache=cache)
+        assert llm.chat.call_count == 1
+
+    async def test_data_change_misses_cache(self, registry, monkeypatch):
+        from hive.db import session as db
+
+        cache = ResponseCache()
+        llm = self._llm([self._text("2 plasmids."), self._text("3 plasmids.")])
+        await route_input("list pUC19 plasmids", registry, llm_client=llm, response_cache=cache)
+        monkeypatch.setattr(db, "data_version", db.data_version)
+        db.mark_data_changed()
+        resp = await route_input(
+            "list pUC19 plasmids", registry, llm_client=llm, response_cache=cache
+        )
+        assert llm.chat.call_count == 2
+        assert resp["content"] == "3 plasmids."
+
+    async def test_prune_misses_cache(self, registry, db_session):
+        import time
+
+        from hive.admin.db import prune
+        from hive.db import IndexedFile
+
+        db_session.add(
+            IndexedFile(
+                file_path="/nonexistent/orphan.dna",
+                file_hash="orph",
+                format="dna",
+                status="active",
+                file_size=1000,
+                file_mtime_ns=time.time_ns(),
+            )
+        )
+        await db_session.commit()
+        cache = ResponseCache()
+        llm = self._llm([self._text("1 file."), self._text("0 files.")])
+        await route_input("how many files?", registry, llm_client=llm, response_cache=cache)
+
+        await prune(db_session, "/tmp", dry_run=True)
+        await route_input("how many files?", registry, llm_client=llm, response_cache=cache)
+        assert llm.chat.call_count == 1  # a dry run writes nothing
+
+        await prune(db_session, "/tmp", dry_run=False, no_archive=True)
+        resp = await route_input("how many files?", registry, llm_client=llm, response_cache=cache)
+        assert llm.chat.call_count == 2
+        assert resp["content"] == "0 files."
+
+    def test_expiry_and_eviction(self):
+        cache = ResponseCache(max_entries=2, ttl=-1)
+        cache.put("a", {"type": "message", "content": "x"})
+        assert cache.get("a") is None
+        cache = ResponseCache(max_entries=2)
+        for k in "abc":
+            cache.put(k, {"type": "message", "content": k})
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c")["content"] == "c"
+
+
 # -- Error Sanitization --
 
 
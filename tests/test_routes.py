@@ -0,0 +1,183 @@
+"""Tests for REST endpoints and app-level response handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from hive.admin.db import prune
+from hive.db import Base, IndexedFile, User, counts
+from hive.db import session as db_session
+from hive.server import routes
+from hive.server.app import FastJSONResponse
+from hive.server.routes import _ollama_tags_url, _startup_state, health, status
+from hive.server.websocket import _quick_status
+from hive.utils import json_loads
+
+
+@pytest.fixture
+async def db(monkeypatch):
+    """In-memory SQLite installed as the app's session factory, plus a list
+    collecting executed statements. Cached status counts start empty."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(db_session, "async_session_factory", factory)
+    monkeypatch.setattr(counts, "_counts_cache", None)
+    yield factory, statements
+
+    await engine.dispose()
+
+
+def _request():
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()))
+
+
+class TestStartupState:
+    async def test_reports_background_indexing(self):
+        app = SimpleNamespace(state=SimpleNamespace())
+        assert _startup_state(app) == {"indexing": False, "blast_index_ready": False}
+
+        gate = asyncio.Event()
+
+        async def index():
+            await gate.wait()
+            return {"blast": True, "mafft": True}
+
+        app.state.startup_task = asyncio.create_task(index())
+        assert _startup_state(app) == {"indexing": True, "blast_index_ready": False}
+        gate.set()
+        await app.state.startup_task
+        assert _startup_state(app) == {"indexing": False, "blast_index_ready": True}
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        app.state.startup_task = asyncio.create_task(fail())
+        await asyncio.gather(app.state.startup_task, return_exceptions=True)
+        assert _startup_state(app)["blast_index_ready"] is False
+
+
+class TestStatusEndpoint:
+    async def test_counts_in_one_query(self, db):
+        _, statements = db
+        result = await status(_request())
+        assert result == {
+            "indexed_files": 0,
+            "sequences": 0,
+            "parts": 0,
+            "part_instances": 0,
+            "database": True,
+            "indexing": False,
+            "blast_index_ready": False,
+        }
+        assert len(statements) == 1
+
+        await status(_request())
+        assert len(statements) == 1  # served from cache
+        db_session.mark_data_changed()
+        await status(_request())
+        assert len(statements) == 2  # a data change invalidates
+        await _quick_status()
+        assert len(statements) == 2  # status bar shares the same cached counts
+
+    async def test_writes_outside_watcher_invalidate(self, db):
+        factory, _ = db
+        async with factory() as s:
+            s.add(
+                IndexedFile(
+                    file_path="/nonexistent/orphan.dna",
+                    file_hash="orph",
+                    format="dna",
+                    status="active",
+                    file_size=1,
+                    file_mtime_ns=0,
+                )
+            )
+            await s.commit()
+        assert (await status(_request()))["indexed_files"] == 1
+
+        async with factory() as s:
+            await prune(s, "/tmp", dry_run=False, no_archive=True)
+        assert (await status(_request()))["indexed_files"] == 0
+
+        async with factory() as s:
+            s.add(User(username="u", slug="u", token="t"))
+            await s.commit()
+        await status(_request())
+        async with factory() as s:
+            await s.execute(delete(User))  # bulk DML, no flush
+            await s.commit()
+        assert (await _quick_status())["users"] == 0
+
+    async def test_no_database(self, monkeypatch):
+        monkeypatch.setattr(db_session, "async_session_factory", None)
+        assert (await status(_request()))["database"] is False
+
+
+class TestHealthEndpoint:
+    async def test_probe_touches_no_table(self, db, monkeypatch):
+        _, statements = db
+        assert await health() == {"status": "healthy", "checks": {"database": True}}
+        assert [" ".join(st.split()).upper() for st in statements] == ["SELECT 1"]
+
+        monkeypatch.setattr(db_session, "async_session_factory", None)
+        assert await health() == {"status": "degraded", "checks": {"database": False}}
+
+
+class TestOllamaDiscovery:
+    async def test_tags_cached_per_base_url(self, monkeypatch):
+        monkeypatch.setattr(routes, "_ollama_cache", {})
+        calls = []
+
+        def handler(request):
+            calls.append(str(request.url))
+            return httpx.Response(200, json={"models": [{"name": "llama3"}, {"name": "qwen"}]})
+
+        configured = [{"id": "ollama/qwen"}]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await routes._discover_ollama(client, "http://ollama:11434/v1", configured)
+            second = await routes._discover_ollama(client, "http://ollama:11434/v1", [])
+
+        assert calls == ["http://ollama:11434/api/tags"]
+        assert [m["id"] for m in first] == ["ollama/llama3"]
+        assert [m["id"] for m in second] == ["ollama/llama3", "ollama/qwen"]
+
+    async def test_failure_not_cached(self, monkeypatch):
+        monkeypatch.setattr(routes, "_ollama_cache", {})
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(503)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            assert await routes._discover_ollama(client, "http://ollama:11434", []) == []
+            assert await routes._discover_ollama(client, "http://ollama:11434", []) == []
+        assert len(calls) == 2
+
+    def test_tags_url_strips_v1_suffix_only(self):
+        assert _ollama_tags_url("http://ollama:11434/v1") == "http://ollama:11434/api/tags"
+        assert _ollama_tags_url("http://ollama:11434/v1/") == "http://ollama:11434/api/tags"
+        assert _ollama_tags_url("http://host1/v11") == "http://host1/v11/api/tags"
+        assert _ollama_tags_url("http://gpu1:11434") == "http://gpu1:11434/api/tags"
+        assert _ollama_tags_url("ollama:11434") is None
+
+
+class TestFastJSONResponse:
+    def test_renders_compact_utf8(self):
+        resp = FastJSONResponse({"name": "pUC19 – Δlac", "hits": [1, 2]})
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.body.startswith(b'{"name":')
+        assert json_loads(resp.body) == {"name": "pUC19 – Δlac", "hits": [1, 2]}
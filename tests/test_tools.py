@@ -1,15 +1,34 @@
-"""Tests for tool system: base class, factory, prompts."""
+"""Tests for tool system: base class, factory, prompts, DB lookups."""
 
+import json
+from pathlib import Path
 from typing import Any
 
+import pytest
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from sqlalchemy import select
+
 from hive.config import Settings
-from hive.tools.base import Tool, _params_to_schema
+from hive.db import Sequence
+from hive.tools.resolve import resolve_part, resolve_sequence
+from hive.tools.tools.extract import _find_part_instance
+from hive.watcher.ingest import ingest_file
+from hive.watcher.rules import MatchResult
+from hive.tools.base import Tool, _params_to_schema, model_schema, parse_input
 from hive.tools.registry import ToolRegistry
 from hive.tools.factory import ToolFactory
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
 # -- Helpers --
 
 
+async def _ingest_plasmid(session) -> Sequence:
+    match = MatchResult(action="parse", parser="biopython", extract=None)
+    await ingest_file(session, FIXTURES / "test_plasmid.gb", match)
+    return (await session.execute(select(Sequence))).scalar_one()
+
+
 class DummyTool(Tool):
     name = "dummy"
     description = ("test", "A test tool")
@@ -59,6 +78,11 @@ class TestToolMetadata:
         assert schema["description"] == "A test tool"
         assert "properties" in schema["parameters"]
 
+    def test_api_schema_built_once(self):
+        t = ParamsTool()
+        assert t.api_schema() is t.api_schema()
+        assert t.api_schema()["parameters"]["required"] == ["query"]
+
     def test_group_returns_first_tag(self):
         t = DummyTool()
         assert t.group() == "test"
@@ -98,6 +122,70 @@ class TestParamsToSchema:
         assert schema["properties"]["limit"]["default"] == 10
 
 
+class TestModelSchema:
+    def test_title_removed(self):
+        class QInput(BaseModel):
+            query: str = Field(..., description="Search text")
+
+        schema = model_schema(QInput)
+        assert "title" not in schema
+        assert schema["required"] == ["query"]
+
+    def test_cached_per_model(self):
+        class QInput(BaseModel):
+            query: str
+
+        assert model_schema(QInput) is model_schema(QInput)
+
+
+class SimpleInput(BaseModel):
+    sequence: str = Field(..., description="Sequence")
+    table: int = Field(default=1, description="Codon table")
+
+
+class TestParseInput:
+    def test_exact_types_skip_validation(self):
+        inp = parse_input(SimpleInput, {"sequence": "ATG"})
+        assert inp.sequence == "ATG"
+        assert inp.table == 1
+        assert inp.model_fields_set == {"sequence"}
+
+    def test_coercion_still_applies(self):
+        inp = parse_input(SimpleInput, {"sequence": "ATG", "table": "11"})
+        assert inp.table == 11
+
+    def test_missing_required_raises(self):
+        with pytest.raises(ValidationError):
+            parse_input(SimpleInput, {})
+
+    def test_wrong_type_raises(self):
+        with pytest.raises(ValidationError):
+            parse_input(SimpleInput, {"sequence": ["ATG"]})
+
+    def test_optional_scalars_skip_validation(self):
+        class Lookup(BaseModel):
+            sid: int | None = None
+            name: str | None = None
+
+        inp = parse_input(Lookup, {"sid": 3, "name": None})
+        assert (inp.sid, inp.name) == (3, None)
+        assert inp.model_fields_set == {"sid", "name"}
+        assert parse_input(Lookup, {"sid": "3"}).sid == 3
+        with pytest.raises(ValidationError):
+            parse_input(Lookup, {"sid": [3]})
+
+    def test_validators_force_full_validation(self):
+        class Upper(BaseModel):
+            name: str
+
+            @field_validator("name")
+            @classmethod
+            def _up(cls, v):
+                return v.upper()
+
+        assert parse_input(Upper, {"name": "gfp"}).name == "GFP"
+
+
 # -- Tool Registry --
 
 
@@ -128,6 +216,49 @@ class TestToolRegistry:
         assert len(meta) == 1
         assert meta[0]["name"] == "dummy"
 
+    def test_help_text_cached_until_register(self):
+        reg = ToolRegistry()
+        reg.register(DummyTool())
+        first = reg.help_text()
+        assert "/dummy" in first
+        assert reg.help_text() is first
+        reg.register(ParamsTool())
+        assert "/paramtool" in reg.help_text()
+
+    def test_api_schemas_json_cached_until_register(self):
+        reg = ToolRegistry()
+        reg.register(DummyTool())
+        first = reg.api_schemas_json()
+        assert reg.api_schemas_json() is first
+        assert json.loads(first)[0]["name"] == "dummy"
+        reg.register(ParamsTool())
+        assert [t["name"] for t in json.loads(reg.api_schemas_json())] == ["dummy", "paramtool"]
+
+    async def test_execute_endpoint_returns_encoded_json(self):
+        from types import SimpleNamespace
+
+        from hive.server.routes import execute_tool
+
+        reg = ToolRegistry()
+        reg.register(ParamsTool())
+
+        async def body():
+            return {"query": "GFP", "limit": 2}
+
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(tool_registry=reg)))
+        request.json = body
+        response = await execute_tool("paramtool", request)
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"data": {"query": "GFP", "limit": 2}}
+
+    def test_metadata_cached_until_register(self):
+        reg = ToolRegistry()
+        reg.register(DummyTool())
+        first = reg.metadata()
+        assert reg.metadata()[0] is first[0]
+        reg.register(ParamsTool())
+        assert [m["name"] for m in reg.metadata()] == ["dummy", "paramtool"]
+
     def test_filtered_subset(self):
         reg = ToolRegistry()
         t1 = DummyTool()
@@ -139,6 +270,14 @@ class TestToolRegistry:
         assert sub.get("dummy") is t1
         assert sub.get("paramtool") is None
 
+    def test_filtered_reused_until_register(self):
+        reg = ToolRegistry()
+        reg.register(DummyTool())
+        sub = reg.filtered(["dummy"])
+        assert reg.filtered(["dummy"]) is sub
+        reg.register(ParamsTool())
+        assert reg.filtered(["dummy"]) is not sub
+
     def test_filtered_ignores_unknown(self):
         reg = ToolRegistry()
         reg.register(DummyTool())
@@ -185,3 +324,51 @@ class TestPrompts:
         assert "## Rules" in prompt
         assert "sid:N" in prompt
         assert "pid:N" in prompt
+
+
+# -- DB lookups (db_session from conftest) --
+
+
+class TestFindPartInstance:
+    async def test_finds_by_name_substring(self, db_session):
+        seq = await _ingest_plasmid(db_session)
+
+        inst = await _find_part_instance(db_session, seq.id, "gfp")
+        assert inst is not None
+        assert (inst.start, inst.end) == (39, 108)
+        assert await _find_part_instance(db_session, seq.id, "T7_term") is not None
+        assert await _find_part_instance(db_session, seq.id, "nonexistent") is None
+
+
+class TestResolve:
+    async def test_resolve_sequence(self, db_session):
+        seq = await _ingest_plasmid(db_session)
+
+        by_sid = await resolve_sequence(db_session, sid=seq.id, load_parts=True)
+        assert by_sid is seq
+        assert by_sid.part_instances
+        assert await resolve_sequence(db_session, sid=seq.id + 1) is None
+        assert await resolve_sequence(db_session) is None
+
+        by_name = await resolve_sequence(db_session, name=seq.name.upper(), load_file=True)
+        assert by_name is seq
+        assert by_name.file.file_path.endswith("test_plasmid.gb")
+
+    async def test_deleted_file_not_resolved(self, db_session):
+        seq = await _ingest_plasmid(db_session)
+        seq = await resolve_sequence(db_session, sid=seq.id, load_file=True)
+        seq.file.status = "deleted"
+        await db_session.commit()
+
+        assert await resolve_sequence(db_session, sid=seq.id) is None
+        assert await resolve_sequence(db_session, name=seq.name) is None
+
+    async def test_resolve_part(self, db_session):
+        seq = await _ingest_plasmid(db_session)
+        seq = await resolve_sequence(db_session, sid=seq.id, load_parts=True)
+
+        pid = seq.part_instances[0].part_id
+        part = await resolve_part(db_session, pid=pid, load_names=True, load_instances=True)
+        assert part.id == pid and part.names
+        assert part.instances[0].sequence.file.file_path.endswith("test_plasmid.gb")
+        assert await resolve_part(db_session, pid=pid + 10_000) is None
@@ -0,0 +1,101 @@
+"""Tests for user and feedback service queries."""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from hive.db import Base
+from hive.users import (
+    create_feedback,
+    create_user,
+    feedback_stats,
+    list_feedback,
+    list_users,
+)
+
+
+@pytest.fixture
+async def db():
+    """In-memory SQLite engine plus a list collecting executed statements."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session, statements
+
+    await engine.dispose()
+
+
+class TestListQueries:
+    async def test_list_feedback_loads_users_without_n_plus_one(self, db):
+        session, statements = db
+        for name in ("alice", "bob", "carol"):
+            user = await create_user(session, name)
+            await create_feedback(session, user.id, "good", 3, f"from {name}")
+        session.expunge_all()
+
+        statements.clear()
+        items = await list_feedback(session)
+        assert {fb.user.username for fb in items} == {"alice", "bob", "carol"}
+        assert len(statements) <= 2
+
+    async def test_list_users(self, db):
+        session, statements = db
+        await create_user(session, "alice")
+        await create_user(session, "bob")
+        session.expunge_all()
+
+        statements.clear()
+        users = await list_users(session)
+        assert [u.username for u in users] == ["alice", "bob"]
+        assert len(statements) == 1
+
+
+class TestFeedbackStats:
+    async def test_empty(self, db):
+        session, _ = db
+        assert await feedback_stats(session) == {
+            "total": 0,
+            "good": 0,
+            "bad": 0,
+            "last_at": None,
+            "last_by": None,
+        }
+
+    async def test_counts_and_last_in_one_query(self, db):
+        session, statements = db
+        alice = await create_user(session, "alice")
+        bob = await create_user(session, "bob")
+        await create_feedback(session, alice.id, "good", 3, "nice")
+        await create_feedback(session, alice.id, "bad", 5, "broken")
+        await create_feedback(session, bob.id, "good", 1, "ok")
+
+        statements.clear()
+        st = await feedback_stats(session)
+        assert len(statements) == 1
+        assert (st["total"], st["good"], st["bad"]) == (3, 2, 1)
+        assert st["last_by"] == "bob"
+        assert st["last_at"] is not None
+
+
+class TestCreateUser:
+    async def test_duplicate_slug_rejected_in_one_statement(self, db):
+        session, statements = db
+        statements.clear()
+        user = await create_user(session, "Alice Smith")
+        assert len(statements) == 1
+        assert user.id is not None
+        assert user.slug == "alicesmith"
+        assert user.preferences == {}
+
+        with pytest.raises(ValueError, match="already taken"):
+            await create_user(session, "alice_smith")
+        assert [u.username for u in await list_users(session)] == ["Alice Smith"]
@@ -0,0 +1,52 @@
+"""Tests for hive.utils JSON helpers -- orjson and the stdlib fallback agree."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+import pytest
+
+from hive import utils
+
+PAYLOAD = {
+    "created": datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=UTC),
+    "naive": datetime(2026, 1, 2, 3, 4, 5),
+    "day": date(2026, 1, 2),
+    "mw": Decimal("2686.5"),
+    "name": "pUC19 – Δlac",
+    "hits": [1, 2.5, None, True],
+}
+EXPECTED = (
+    '{"created":"2026-01-02T03:04:05.678000+00:00","naive":"2026-01-02T03:04:05",'
+    '"day":"2026-01-02","mw":"2686.5","name":"pUC19 – Δlac","hits":[1,2.5,null,true]}'
+)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJson:
+    def test_dumps_matches_across_backends(self, backend):
+        assert utils.json_loads(utils.json_dumps(PAYLOAD, default=str)) == utils.json_loads(
+            EXPECTED
+        )
+
+    def test_bytes_round_trip(self, backend):
+        raw = utils.json_bytes(PAYLOAD, default=str)
+        assert isinstance(raw, bytes)
+        assert utils.json_loads(raw)["created"] == "2026-01-02T03:04:05.678000+00:00"
+
+    def test_unserializable_without_default_raises(self, backend):
+        with pytest.raises(TypeError):
+            utils.json_dumps({"x": object()})
+
+    def test_loads_invalid_raises_decode_error(self, backend):
+        import json
+
+        with pytest.raises(json.JSONDecodeError):
+            utils.json_loads("{nope")
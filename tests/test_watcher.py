@@ -3,7 +3,8 @@
 from pathlib import Path
 
 from hive.config import WatcherRule
-from hive.watcher.rules import match_file
+from hive.watcher.rules import match_file, match_name
+from hive.watcher.watcher import _iter_files
 
 
 def _rules():
@@ -85,3 +86,27 @@ class TestRuleMatching:
         result = match_file(Path("/data/sequences/my_plasmid.gb"), _rules())
         assert result.action == "parse"
         assert result.parser == "biopython"
+
+
+class TestIterFiles:
+    def _tree(self, root: Path):
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "top.gb").write_text("x")
+        (root / "a" / "mid.fasta").write_text("x")
+        (root / "a" / "b" / "deep.dna").write_text("x")
+        (root / "loop").symlink_to(root, target_is_directory=True)
+        (root / "link.gb").symlink_to(root / "top.gb")
+
+    def test_recursive(self, tmp_path):
+        self._tree(tmp_path)
+        names = sorted(e.name for e in _iter_files(str(tmp_path), recursive=True))
+        assert names == ["deep.dna", "link.gb", "mid.fasta", "top.gb"]
+
+    def test_top_level_only(self, tmp_path):
+        self._tree(tmp_path)
+        names = sorted(e.name for e in _iter_files(str(tmp_path), recursive=False))
+        assert names == ["link.gb", "top.gb"]
+
+    def test_match_name_equals_match_file(self):
+        for name in ("plasmid.dna", ".DS_Store", "x.log", "unknown.xyz"):
+            assert match_name(name, _rules()) == match_file(Path("/d") / name, _rules())
@@ -1,6 +1,17 @@
 """Tests for websocket helper functions."""
 
-from hive.server.websocket import _extract_thinking, _fallback_title, _strip_large_widget_data
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+from hive.server import websocket as ws_mod
+from hive.server.websocket import (
+    _extract_thinking,
+    _fallback_title,
+    _rerun_stale_widgets,
+    _strip_large_widget_data,
+)
+from hive.tools import Tool, ToolRegistry
 
 
 class TestExtractThinking:
@@ -92,3 +103,85 @@ class TestStripLargeWidgetData:
         }
         result = _strip_large_widget_data(msg, 10)
         assert result["widget"]["data"] is not None
+
+
+class SlowTool(Tool):
+    name = "slow"
+    description = ("slow", "Sleeps then echoes params")
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return {"echo": params}
+
+
+class TestRerunStaleWidgets:
+    def _chat(self, n: int) -> dict:
+        return {"messages": [
+            {"role": "assistant", "widget": {"tool": "slow", "params": {"i": i}, "stale": True}}
+            for i in range(n)
+        ]}
+
+    async def test_reruns_concurrently(self, monkeypatch):
+        send = AsyncMock()
+        monkeypatch.setattr(ws_mod.manager, "send_json", send)
+        tool = SlowTool()
+        reg = ToolRegistry()
+        reg.register(tool)
+        chat = self._chat(3)
+        await _rerun_stale_widgets("c1", chat, reg, None, max_rerun=-1)
+        assert tool.peak == 3
+        assert send.await_count == 3
+        for i, msg in enumerate(chat["messages"]):
+            assert msg["widget"]["data"] == {"echo": {"i": i}}
+            assert "stale" not in msg["widget"]
+
+    async def test_max_rerun_keeps_latest(self, monkeypatch):
+        monkeypatch.setattr(ws_mod.manager, "send_json", AsyncMock())
+        reg = ToolRegistry()
+        reg.register(SlowTool())
+        chat = self._chat(3)
+        await _rerun_stale_widgets("c1", chat, reg, None, max_rerun=2)
+        stale = [m["widget"].get("stale", False) for m in chat["messages"]]
+        assert stale == [True, False, False]
+
+
+class TestQuickStatus:
+    async def test_counts_in_one_cached_query(self, monkeypatch):
+        from sqlalchemy import event
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+        from hive.db import Base, User, counts
+        from hive.db import session as db
+
+        engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr(db, "async_session_factory", factory)
+        monkeypatch.setattr(counts, "_counts_cache", None)
+        statements: list[str] = []
+        event.listen(
+            engine.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, stmt, *a: statements.append(stmt),
+        )
+
+        status = await ws_mod._quick_status(tool_count=4)
+        assert status["db_connected"] is True
+        assert (status["sequences"], status["tools"], status["last_updated"]) == (0, 4, None)
+        assert len(statements) == 1
+
+        await ws_mod._quick_status()
+        assert len(statements) == 1  # served from cache
+
+        async with factory() as s:
+            s.add(User(username="u", slug="u", token="t"))
+            await s.commit()
+        assert (await ws_mod._quick_status())["users"] == 1  # the commit invalidates
+        await engine.dispose()